@@ -16,8 +16,11 @@ async_db_url = env.load('DB_URL', is_sensitive=True).string()
 logger = Logger('Alembic')
 from api.infrastructure.models.user_model import UserModel
 from api.infrastructure.models.address_model import AddressModel
+from api.infrastructure.models.cep_cache_model import CepCacheModel
 from api.infrastructure.models.demand_model import DemandModel
+from api.infrastructure.models.geocode_cache_model import GeocodeCacheModel
 from api.infrastructure.models.product_model import ProductModel
+from api.infrastructure.models.signed_url_cache_model import SignedUrlCacheModel
 from api.infrastructure.models.store_model import StoreModel
 from api.infrastructure.models import base_model
 target_metadata = base_model.Base.metadata
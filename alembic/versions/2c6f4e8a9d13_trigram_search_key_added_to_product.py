@@ -0,0 +1,51 @@
+"""Trigram search key added to product
+
+Revision ID: 2c6f4e8a9d13
+Revises: 7b3e90c1d54a
+Create Date: 2026-10-18 16:02:11.519377
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2c6f4e8a9d13'
+down_revision: Union[str, None] = '7b3e90c1d54a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute('CREATE EXTENSION IF NOT EXISTS unaccent')
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    # unaccent() is only STABLE, so it cannot back a generated column or an index directly
+    op.execute(
+        "CREATE OR REPLACE FUNCTION immutable_unaccent(text) RETURNS text "
+        "LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT "
+        "AS $$ SELECT public.unaccent('public.unaccent'::regdictionary, $1) $$"
+    )
+    op.add_column('product', sa.Column(
+        'search_key',
+        sa.String(),
+        sa.Computed('lower(immutable_unaccent(search_name))', persisted=True),
+        nullable=False
+    ))
+    op.create_index(
+        'ix_product_search_key_trgm',
+        'product',
+        ['search_key'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'search_key': 'gin_trgm_ops'}
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_product_search_key_trgm', table_name='product', postgresql_using='gin')
+    op.drop_column('product', 'search_key')
+    op.execute('DROP FUNCTION IF EXISTS immutable_unaccent(text)')
@@ -0,0 +1,35 @@
+"""Bucket name added to signed URL cache
+
+Revision ID: 3d8f1b6e2a95
+Revises: b94d2e7a1c58
+Create Date: 2026-10-18 22:03:51.774019
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3d8f1b6e2a95'
+down_revision: Union[str, None] = 'b94d2e7a1c58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The cached URLs do not say which bucket they were signed for; they are signed again on the next read
+    op.execute('TRUNCATE signed_url_cache')
+    op.add_column('signed_url_cache', sa.Column('bucket_name', sa.String(length=128), nullable=False))
+    op.drop_constraint('signed_url_cache_pkey', 'signed_url_cache', type_='primary')
+    op.create_primary_key('signed_url_cache_pkey', 'signed_url_cache', ['bucket_name', 'blob_name'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute('TRUNCATE signed_url_cache')
+    op.drop_constraint('signed_url_cache_pkey', 'signed_url_cache', type_='primary')
+    op.drop_column('signed_url_cache', 'bucket_name')
+    op.create_primary_key('signed_url_cache_pkey', 'signed_url_cache', ['blob_name'])
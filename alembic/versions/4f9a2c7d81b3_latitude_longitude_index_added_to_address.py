@@ -0,0 +1,28 @@
+"""Latitude longitude index added to address
+
+Revision ID: 4f9a2c7d81b3
+Revises: e30ed9845615
+Create Date: 2026-10-18 09:12:41.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4f9a2c7d81b3'
+down_revision: Union[str, None] = 'e30ed9845615'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_address_latitude_longitude', 'address', ['latitude', 'longitude'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_address_latitude_longitude', table_name='address')
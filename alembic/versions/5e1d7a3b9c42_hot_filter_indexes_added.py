@@ -0,0 +1,54 @@
+"""Hot filter indexes added
+
+Revision ID: 5e1d7a3b9c42
+Revises: 2c6f4e8a9d13
+Create Date: 2026-10-18 17:36:52.120947
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5e1d7a3b9c42'
+down_revision: Union[str, None] = '2c6f4e8a9d13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (name, table, columns, partial on active = true)
+INDEXES = [
+    ('ix_demand_store_uuid_created_at_active', 'demand', ['store_uuid', 'created_at', 'uuid'], True),
+    ('ix_demand_created_at_active', 'demand', ['created_at', 'uuid'], True),
+    ('ix_demand_product_uuid', 'demand', ['product_uuid'], False),
+    ('ix_store_owner_uuid_created_at_active', 'store', ['owner_uuid', 'created_at', 'uuid'], True),
+    ('ix_store_cnpj_active', 'store', ['cnpj'], True),
+    ('ix_store_address_uuid', 'store', ['address_uuid'], False),
+    ('ix_store_created_at_active', 'store', ['created_at', 'uuid'], True),
+    ('ix_product_created_at_active', 'product', ['created_at', 'uuid'], True),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CREATE INDEX CONCURRENTLY cannot run inside the migration transaction
+    with op.get_context().autocommit_block():
+        for name, table, columns, partial in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                unique=False,
+                postgresql_concurrently=True,
+                postgresql_where=sa.text('active') if partial else None,
+                if_not_exists=True
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,37 @@
+"""Signed URL cache table added
+
+Revision ID: 7b3e90c1d54a
+Revises: 0d9e6a4b2f17
+Create Date: 2026-10-18 15:21:37.408215
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7b3e90c1d54a'
+down_revision: Union[str, None] = '0d9e6a4b2f17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('signed_url_cache',
+    sa.Column('blob_name', sa.String(length=512), nullable=False),
+    sa.Column('signed_url', sa.String(length=4096), nullable=False),
+    sa.Column('expires_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('blob_name'),
+    prefixes=['UNLOGGED']
+    )
+    op.create_index('ix_signed_url_cache_expires_at', 'signed_url_cache', ['expires_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_signed_url_cache_expires_at', table_name='signed_url_cache')
+    op.drop_table('signed_url_cache')
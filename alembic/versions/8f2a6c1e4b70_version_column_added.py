@@ -0,0 +1,32 @@
+"""Version column added
+
+Revision ID: 8f2a6c1e4b70
+Revises: 5e1d7a3b9c42
+Create Date: 2026-10-18 18:40:27.204113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8f2a6c1e4b70'
+down_revision: Union[str, None] = '5e1d7a3b9c42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ['user', 'address', 'store', 'product', 'demand']
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in TABLES:
+        op.add_column(table, sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in reversed(TABLES):
+        op.drop_column(table, 'version')
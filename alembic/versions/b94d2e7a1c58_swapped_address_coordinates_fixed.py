@@ -0,0 +1,39 @@
+"""Swapped address coordinates fixed
+
+Revision ID: b94d2e7a1c58
+Revises: 8f2a6c1e4b70
+Create Date: 2026-10-18 20:12:41.518302
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b94d2e7a1c58'
+down_revision: Union[str, None] = '8f2a6c1e4b70'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    Geocoded addresses used to be saved with latitude and longitude swapped. Every address
+    is in Brazil, where the latitude (-34 to 6) is always greater than the longitude (-74
+    to -34), so the rows where it is not are the swapped ones. Rows written after the fix
+    are left alone and running this twice changes nothing.
+    """
+    op.execute(
+        'UPDATE address '
+        'SET latitude = longitude, longitude = latitude, version = version + 1 '
+        'WHERE latitude < longitude'
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema.
+
+    Nothing to do: swapping the rows back would only break the coordinates again.
+    """
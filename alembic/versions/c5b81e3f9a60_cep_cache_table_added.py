@@ -0,0 +1,37 @@
+"""CEP cache table added
+
+Revision ID: c5b81e3f9a60
+Revises: 4f9a2c7d81b3
+Create Date: 2026-10-18 11:26:41.318406
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5b81e3f9a60'
+down_revision: Union[str, None] = '4f9a2c7d81b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('cep_cache',
+    sa.Column('cep', sa.String(length=8), nullable=False),
+    sa.Column('data', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+    sa.Column('expires_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('cep')
+    )
+    op.create_index('ix_cep_cache_expires_at', 'cep_cache', ['expires_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_cep_cache_expires_at', table_name='cep_cache')
+    op.drop_table('cep_cache')
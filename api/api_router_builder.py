@@ -8,11 +8,18 @@ from api.controllers.address_controller import AddressController
 from api.controllers.auth_controller import AuthController
 from api.controllers.auth_wrapper import AuthWrapper
 from api.controllers.demand_controller import DemandController
+from api.controllers.metrics_controller import MetricsController
 from api.controllers.product_controller import ProductController
 from api.controllers.reel_controller import ReelController
 from api.controllers.store_controller import StoreController
 from api.controllers.user_controller import UserController
 
+# Clients
+from api.clients.cep_cache import CepCache
+from api.clients.geocode_cache import GeocodeCache
+from api.clients.google_buckets_client import GoogleStorageClientCacheManager
+from api.clients.signed_url_cache_backend import PostgresSignedUrlCacheBackend
+
 # Repositories
 from api.infrastructure.repositories.address_repository import AddressRepository
 from api.infrastructure.repositories.demand_repository import DemandRepository
@@ -24,6 +31,9 @@ from api.infrastructure.repositories.user_repository import UserRepository
 from api.services.address_service import AddressService
 from api.services.auth_service import AuthService
 from api.services.demand_service import DemandService
+from api.services.geocoding_queue import GeocodingQueue
+from api.services.metrics_service import MetricsService
+from api.services.product_catalog import ProductCatalog
 from api.services.product_service import ProductService
 from api.services.reel_service import ReelService
 from api.services.store_service import StoreService
@@ -31,8 +41,11 @@ from api.services.user_service import UserService
 
 # Config
 from api.api_config import ApiConfig
+from api.infrastructure.instrumented_pool import InstrumentedAsyncQueuePool
+from api.infrastructure.request_session_scope import RequestSessionScope
 from api.shared.env_variable_manager import EnvVariableManager
 from api.shared.logger import Logger
+from api.shared.lru_ttl_cache import LruTtlCache
 
 
 class ApiRouterBuilder:
@@ -44,19 +57,30 @@ class ApiRouterBuilder:
         db_url = self.env.load('DB_URL', is_sensitive=True).string()
         self.engine = self.__create_sql_engine(db_url)
         self.sessionmaker = async_sessionmaker(self.engine, expire_on_commit=False)
+        self.session_scope = RequestSessionScope(self.sessionmaker)
 
     def build(self) -> list[APIRouter]:
         self.logger.log_info('Building API routers')
         routers = []
-        session = self.sessionmaker()
+        session = self.session_scope.session
+
+        # Signed URLs
+        signed_url_cache_backend = self.env.load('SIGNED_URL_CACHE_BACKEND', 'memory').string()
+        if signed_url_cache_backend == 'postgres':
+            self.logger.log_debug('Sharing the signed URLs between workers through Postgres')
+            GoogleStorageClientCacheManager.shared().use_backend(PostgresSignedUrlCacheBackend(self.session_scope))
 
         # User
         self.logger.log_debug('Creating UserRepository, UserService, and UserController')
         user_repository = UserRepository(session)
-        user_service = UserService(user_repository)
+        sessions_cache = LruTtlCache(
+            max_size=self.env.load('USER_SESSION_CACHE_SIZE', 10000).integer(),
+            ttl_seconds=self.env.load('USER_SESSION_CACHE_SECONDS', 300).integer()
+        )
+        user_service = UserService(user_repository, sessions_cache)
         
         #Auth
-        auth_service = AuthService(user_service)
+        auth_service = AuthService(user_service, sessions_cache)
         auth_controller = AuthController(auth_service)
         routers.append(auth_controller.router)
         auth_wrapper = AuthWrapper(auth_service)
@@ -67,21 +91,43 @@ class ApiRouterBuilder:
         # Address
         self.logger.log_debug('Creating AddressRepository, AddressService, and AddressController')
         address_repository = AddressRepository(session)
-        address_service = AddressService(address_repository)
+        cep_cache = CepCache(
+            self.session_scope,
+            max_size=self.env.load('CEP_CACHE_SIZE', 5000).integer(),
+            ttl_seconds=self.env.load('CEP_CACHE_TTL_SECONDS', 2592000).integer(),
+            negative_ttl_seconds=self.env.load('CEP_CACHE_NEGATIVE_TTL_SECONDS', 86400).integer()
+        )
+        geocode_cache = GeocodeCache(
+            self.session_scope,
+            max_size=self.env.load('GEOCODE_CACHE_SIZE', 5000).integer(),
+            ttl_seconds=self.env.load('GEOCODE_CACHE_TTL_SECONDS', 7776000).integer()
+        )
+        self.geocoding_queue = GeocodingQueue(
+            self.session_scope,
+            geocode_cache,
+            requests_per_second=self.env.load('GEOCODING_REQUESTS_PER_SECOND', 1).float(),
+            max_attempts=self.env.load('GEOCODING_MAX_ATTEMPTS', 5).integer(),
+            backoff_seconds=self.env.load('GEOCODING_BACKOFF_SECONDS', 2).float()
+        )
+        address_service = AddressService(address_repository, cep_cache, geocode_cache, self.geocoding_queue)
         address_controller = AddressController(address_service, auth_wrapper)
         routers.append(address_controller.router)
 
         # Store
         self.logger.log_debug('Creating StoreRepository, StoreService, and StoreController')
         store_repository = StoreRepository(session)
-        store_service = StoreService(store_repository, user_repository, address_repository)
+        store_service = StoreService(store_repository, user_repository, address_repository, self.session_scope)
         store_controller = StoreController(store_service, auth_wrapper)
         routers.append(store_controller.router)
 
         # Product
         self.logger.log_debug('Creating ProductRepository, ProductService, and ProductController')
         product_repository = ProductRepository(session)
-        product_service = ProductService(product_repository)
+        self.product_catalog = ProductCatalog(
+            self.session_scope,
+            refresh_interval_seconds=self.env.load('PRODUCT_CATALOG_REFRESH_SECONDS', 300).float()
+        )
+        product_service = ProductService(product_repository, self.product_catalog)
         product_controller = ProductController(product_service, auth_wrapper)
         routers.append(product_controller.router)
 
@@ -93,7 +139,8 @@ class ApiRouterBuilder:
             store_repository,
             product_repository,
             user_repository,
-            product_service
+            product_service,
+            self.session_scope
         )
         demand_controller = DemandController(demand_service, auth_wrapper)
         routers.append(demand_controller.router)
@@ -104,6 +151,12 @@ class ApiRouterBuilder:
         reel_controller = ReelController(reel_service, auth_wrapper)
         routers.append(reel_controller.router)
 
+        # Metrics
+        self.logger.log_debug('Creating MetricsService and MetricsController')
+        metrics_service = MetricsService(self.engine, cep_cache, self.geocoding_queue, GoogleStorageClientCacheManager.shared())
+        metrics_controller = MetricsController(metrics_service, auth_wrapper)
+        routers.append(metrics_controller.router)
+
         self.logger.log_info('All routers successfully initialized')
         return routers
 
@@ -112,7 +165,7 @@ class ApiRouterBuilder:
         is_local = self.env.load('IS_LOCAL', default_value=False).boolean()
         if is_local:
             self.logger.log_info('Creating the engine for local environment')
-            return create_async_engine(db_connection_url, echo=False)
+            return create_async_engine(db_connection_url, echo=False, **self.__load_pool_options())
         self.logger.log_info('Creating the engine for Google Cloud environment')
         cloud_connection_name = self.env.load('CLOUD_SQL_CONNECTION_NAME').string()
         parsed_url = make_url(db_connection_url)
@@ -127,6 +180,24 @@ class ApiRouterBuilder:
             database=db_name,
             query={'host': socket_path}
         )
-        engine = create_async_engine(db_url, echo=False)
+        engine = create_async_engine(db_url, echo=False, **self.__load_pool_options())
         self.logger.log_info('The database engine was successfully created')
-        return engine
\ No newline at end of file
+        return engine
+
+    def __load_pool_options(self) -> dict:
+        pool_options = {
+            'poolclass': InstrumentedAsyncQueuePool,
+            'pool_size': self.env.load('DB_POOL_SIZE', 5).integer(),
+            'max_overflow': self.env.load('DB_POOL_MAX_OVERFLOW', 10).integer(),
+            'pool_timeout': self.env.load('DB_POOL_TIMEOUT_SECONDS', 30).float(),
+            'pool_recycle': self.env.load('DB_POOL_RECYCLE_SECONDS', 1800).integer(),
+            'pool_pre_ping': self.env.load('DB_POOL_PRE_PING', True).boolean(),
+            'connect_args': {
+                'statement_cache_size': self.env.load('DB_STATEMENT_CACHE_SIZE', 100).integer()
+            }
+        }
+        self.logger.log_info(
+            f'Connection pool: size {pool_options["pool_size"]}, max overflow {pool_options["max_overflow"]}, '
+            f'recycle {pool_options["pool_recycle"]}s, pre ping {pool_options["pool_pre_ping"]}'
+        )
+        return pool_options
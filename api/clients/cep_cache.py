@@ -0,0 +1,92 @@
+from datetime import datetime, timedelta
+from threading import Lock
+from typing import Optional
+import pytz
+from api.infrastructure.repositories.cep_cache_repository import CepCacheRepository
+from api.infrastructure.request_session_scope import RequestSessionScope
+from api.shared.logger import Logger
+from api.shared.lru_ttl_cache import LruTtlCache
+
+
+class CepCache:
+    '''Two-tier cache of ViaCEP answers: an in-process LRU in front of the `cep_cache` table.
+
+    Unknown CEPs are cached too (as ViaCEP's own `{"erro": true}` answer) with a shorter TTL,
+    so repeated lookups of a typo do not reach the provider either. The table is read and
+    written in a session scope of its own, so caching a CEP never commits or rolls back the
+    session of the request that looked it up.
+    '''
+
+    def __init__(self,
+                 session_scope: Optional[RequestSessionScope] = None,
+                 max_size: int = 5000,
+                 ttl_seconds: int = 2592000,
+                 negative_ttl_seconds: int = 86400):
+        self.session_scope = session_scope
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.memory = LruTtlCache[str, dict](max_size=max_size, ttl_seconds=ttl_seconds)
+        self.logger = Logger('CepCache')
+        self._lock = Lock()
+        self.memory_hits: int = 0
+        self.database_hits: int = 0
+        self.misses: int = 0
+        self.negative_hits: int = 0
+
+    async def get(self, cep: str) -> Optional[dict]:
+        data = self.memory.get(cep)
+        if data is not None:
+            self._count_hit('memory_hits', data)
+            return data
+        data = await self._get_from_database(cep)
+        if data is not None:
+            self._count_hit('database_hits', data)
+            self.memory.set(cep, data, self._ttl_for(data))
+            return data
+        with self._lock:
+            self.misses += 1
+        return None
+
+    async def set(self, cep: str, data: dict) -> None:
+        ttl_seconds = self._ttl_for(data)
+        self.memory.set(cep, data, ttl_seconds)
+        if self.session_scope is None:
+            return
+        try:
+            async with self.session_scope.begin() as session:
+                await CepCacheRepository(session).save(cep, data, datetime.now(pytz.utc) + timedelta(seconds=ttl_seconds))
+        except Exception as ex:
+            self.logger.log_warning(f'The CEP {cep} could not be persisted in the cache: {ex}')
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.memory_hits + self.database_hits + self.misses
+            hits = self.memory_hits + self.database_hits
+            return {
+                'memory_hits': self.memory_hits,
+                'database_hits': self.database_hits,
+                'misses': self.misses,
+                'negative_hits': self.negative_hits,
+                'hit_ratio': round(hits / lookups, 4) if lookups else 0.0,
+                'memory_size': len(self.memory),
+                'memory_max_size': self.memory.max_size,
+            }
+
+    async def _get_from_database(self, cep: str) -> Optional[dict]:
+        if self.session_scope is None:
+            return None
+        try:
+            async with self.session_scope.begin() as session:
+                return await CepCacheRepository(session).get(cep)
+        except Exception as ex:
+            self.logger.log_warning(f'The cached CEP {cep} could not be read from the database: {ex}')
+            return None
+
+    def _count_hit(self, tier: str, data: dict) -> None:
+        with self._lock:
+            setattr(self, tier, getattr(self, tier) + 1)
+            if data.get('erro'):
+                self.negative_hits += 1
+
+    def _ttl_for(self, data: dict) -> int:
+        return self.negative_ttl_seconds if data.get('erro') else self.ttl_seconds
@@ -1,23 +1,27 @@
+from api.clients.cep_cache import CepCache
+from api.clients.http_transport import HttpTransport
 from api.controllers.models.address.address_response_model import AddressResponseModel
 from api.exceptions.external_service_exception import ExternalServiceException
 from api.exceptions.not_found_exception import NotFoundException
 from api.shared.validator import Validator
 from api.shared.logger import Logger
-import http.client
-import json
+from typing import Optional
 
 
 class CorreiosClient:
     BASE_HOST = 'viacep.com.br'
     BASE_PATH = '/ws'
 
-    def __init__(self):
+    def __init__(self, transport: Optional[HttpTransport] = None, base_url: Optional[str] = None, cache: Optional[CepCache] = None):
         self.logger = Logger('CorreiosClient')
         self.validator = Validator()
+        self.transport = transport or HttpTransport.shared()
+        self.base_url = base_url or f'https://{self.BASE_HOST}'
+        self.cache = cache
 
     async def get_by_cep(self, cep: str) -> AddressResponseModel:
         self.validator.on(cep, 'CEP').cep_is_valid(f'O CEP informado: {cep} é inválido.').check()
-        data = await self._fetch_data_from_correios(cep)
+        data = await self._get_data(cep.replace('-', '').strip())
         address = AddressResponseModel(
             zip_code=data.get('cep'),
             street_address=data.get('logradouro'),
@@ -31,26 +35,41 @@ class CorreiosClient:
         )
         return address
 
+    async def _get_data(self, cleaned_cep: str) -> dict:
+        if self.cache is None:
+            return await self._fetch_data_from_correios(cleaned_cep)
+        data = await self.cache.get(cleaned_cep)
+        if data is not None:
+            self.logger.log_debug(f'ZIP code {cleaned_cep} found in the cache.')
+            if data.get('erro'):
+                raise NotFoundException(f'O CEP {cleaned_cep} não foi encontrado.')
+            return data
+        try:
+            data = await self._fetch_data_from_correios(cleaned_cep)
+        except NotFoundException:
+            await self.cache.set(cleaned_cep, {'erro': True})
+            raise
+        await self.cache.set(cleaned_cep, data)
+        return data
+
     async def _fetch_data_from_correios(self, cep: str) -> dict:
         cleaned_cep = cep.replace('-', '').strip()
-        conn = http.client.HTTPSConnection(self.BASE_HOST)
         path = f'{self.BASE_PATH}/{cleaned_cep}/json/'
         self.logger.log_info(f'Requesting ZIP code {cleaned_cep} from Correios API...')
         try:
-            conn.request('GET', path)
-            response = conn.getresponse()
-            if response.status != 200:
-                error_message = response.read().decode()
-                self.logger.log_error(f'HTTP error when fetching ZIP code {cleaned_cep}: {response.status} - {error_message}')
-                raise ExternalServiceException(f'Erro ao consultar o CEP {cleaned_cep}: código {response.status}')
-            data: dict = json.loads(response.read())
+            response = await self.transport.get(f'{self.base_url}{path}')
+            if response.status_code != 200:
+                self.logger.log_error(f'HTTP error when fetching ZIP code {cleaned_cep}: {response.status_code} - {response.text}')
+                raise ExternalServiceException(f'Erro ao consultar o CEP {cleaned_cep}: código {response.status_code}')
+            data: dict = response.json()
             if data.get('erro'):
                 self.logger.log_info(f'ZIP code {cleaned_cep} not found.')
                 raise NotFoundException(f'O CEP {cleaned_cep} não foi encontrado.')
             self.logger.log_info(f'ZIP code {cleaned_cep} successfully retrieved.')
             return data
+        except NotFoundException:
+            raise
         except Exception as ex:
             self.logger.log_error(f'Unexpected error while fetching ZIP code {cleaned_cep}: {ex}')
             raise ExternalServiceException(f'Erro inesperado ao consultar o CEP {cleaned_cep}: {ex}')
-        finally:
-            conn.close()
+
@@ -0,0 +1,83 @@
+from datetime import datetime, timedelta
+from threading import Lock
+from typing import Awaitable, Callable, Optional
+import pytz
+from api.infrastructure.repositories.geocode_cache_repository import GeocodeCacheRepository
+from api.infrastructure.request_session_scope import RequestSessionScope
+from api.shared.logger import Logger
+from api.shared.lru_ttl_cache import LruTtlCache
+from api.shared.single_flight import SingleFlight
+
+
+class GeocodeCache:
+    '''Two-tier cache of geocoded addresses (in-process LRU in front of the `geocode_cache` table).
+
+    Concurrent misses for the same query are coalesced, so a burst of identical saves makes a
+    single upstream Nominatim call. The table is read and written in a session scope of its own,
+    so caching coordinates never commits or rolls back the session of the caller.
+    '''
+
+    def __init__(self,
+                 session_scope: Optional[RequestSessionScope] = None,
+                 max_size: int = 5000,
+                 ttl_seconds: int = 7776000):
+        self.session_scope = session_scope
+        self.ttl_seconds = ttl_seconds
+        self.memory = LruTtlCache[str, tuple[float, float]](max_size=max_size, ttl_seconds=ttl_seconds)
+        self.flights = SingleFlight[tuple[float, float]]()
+        self.logger = Logger('GeocodeCache')
+        self._lock = Lock()
+        self.memory_hits: int = 0
+        self.database_hits: int = 0
+        self.misses: int = 0
+
+    async def get_or_fetch(self, query: str, fetch: Callable[[], Awaitable[tuple[float, float]]]) -> tuple[float, float]:
+        coordinates = self.memory.get(query)
+        if coordinates is not None:
+            self._count('memory_hits')
+            return coordinates
+        coordinates = await self._get_from_database(query)
+        if coordinates is not None:
+            self._count('database_hits')
+            self.memory.set(query, coordinates)
+            return coordinates
+        return await self.flights.do(query, lambda: self._fetch_and_store(query, fetch))
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.memory_hits + self.database_hits + self.misses
+            hits = self.memory_hits + self.database_hits
+            return {
+                'memory_hits': self.memory_hits,
+                'database_hits': self.database_hits,
+                'misses': self.misses,
+                'hit_ratio': round(hits / lookups, 4) if lookups else 0.0,
+                'memory_size': len(self.memory),
+                'memory_max_size': self.memory.max_size,
+            }
+
+    async def _fetch_and_store(self, query: str, fetch: Callable[[], Awaitable[tuple[float, float]]]) -> tuple[float, float]:
+        self._count('misses')
+        coordinates = await fetch()
+        self.memory.set(query, coordinates)
+        if self.session_scope is not None:
+            try:
+                async with self.session_scope.begin() as session:
+                    await GeocodeCacheRepository(session).save(query, coordinates, datetime.now(pytz.utc) + timedelta(seconds=self.ttl_seconds))
+            except Exception as ex:
+                self.logger.log_warning(f'The coordinates of "{query}" could not be persisted in the cache: {ex}')
+        return coordinates
+
+    async def _get_from_database(self, query: str) -> Optional[tuple[float, float]]:
+        if self.session_scope is None:
+            return None
+        try:
+            async with self.session_scope.begin() as session:
+                return await GeocodeCacheRepository(session).get(query)
+        except Exception as ex:
+            self.logger.log_warning(f'The cached coordinates of "{query}" could not be read from the database: {ex}')
+            return None
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
@@ -1,18 +1,27 @@
 import uuid
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
 from time import time
 from datetime import datetime, timedelta
 from pathlib import Path
 from google.oauth2 import service_account
 from google.cloud import storage
-from typing import Dict, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
+import pytz
+from api.clients.signed_url_cache_backend import ISignedUrlCacheBackend
+from api.clients.v4_url_signer import V4UrlSigner
 from api.shared.logger import Logger
+from api.shared.lru_ttl_cache import LruTtlCache
 from api.enums.bucket_name import BucketName
 from api.shared.env_variable_manager import EnvVariableManager
 
 
 class GoogleBucketsClient:
 
+    _signing_executor: Optional[ThreadPoolExecutor] = None
+    _signing_executor_lock = Lock()
+
     def __init__(self, bucket_name: BucketName):
         self.logger = Logger(f'GoogleBucketsClient-{bucket_name.value}')
         self.env = EnvVariableManager()
@@ -21,9 +30,11 @@ class GoogleBucketsClient:
         credentials = service_account.Credentials.from_service_account_file(storage_account_file_path)
         self.client = storage.Client(credentials=credentials)
         self.logger.log_info(f'Using the bucket {bucket_name.value}')
+        self.bucket_name: str = bucket_name.value
         self.bucket = self.client.bucket(bucket_name.value)
+        self.signer = V4UrlSigner(credentials, bucket_name.value, self.signed_url_expiration_seconds, self.client.api_endpoint)
         self.image_directory = 'images'
-        self.manager = GoogleStorageClientCacheManager()
+        self.manager = GoogleStorageClientCacheManager.shared()
 
     def _generate_unique_filename(self, original_filename: str, folder: Optional[str] = '') -> str:
         ext = Path(original_filename).suffix
@@ -47,30 +58,50 @@ class GoogleBucketsClient:
         if not blob:
             self.logger.log_warning(f'The blob {blob_name} was not found in this bucket, cannot be deleted')
             return
-        self.manager.remove_cache(blob.name)
+        await self.manager.remove_cache(self.bucket_name, blob.name)
         await asyncio.to_thread(blob.delete)
 
     async def update_image(self, new_image_bytes: bytes, original_filename: str, old_blob_name: Optional[str] = None) -> str:
         self.logger.log_debug(f'Updating image, old file name: {old_blob_name}')
         if old_blob_name and old_blob_name.strip():
             await self.delete_image(old_blob_name)
-            self.manager.remove_cache(old_blob_name)
+            await self.manager.remove_cache(self.bucket_name, old_blob_name)
         return await self.save_image(new_image_bytes, original_filename)
 
     async def read_image(self, blob_name: str) -> str:
         if not blob_name:
             return ''
-        cached_signed_url = self.manager.get_image_signed_url(blob_name)
-        if cached_signed_url:
-            return cached_signed_url
-        blob = self.bucket.blob(blob_name)
-        expiration: timedelta = timedelta(seconds=self.signed_url_expiration_seconds)
-        signed_url: str = await asyncio.to_thread(blob.generate_signed_url, 
-                                      version='v4', 
-                                      expiration=expiration,
-                                      method='GET')
-        self.manager.cache_image(blob_name, signed_url, expiration)
-        return signed_url
+        signed_urls = await self.read_images([blob_name])
+        return signed_urls[blob_name]
+
+    async def read_images(self, blob_names: Iterable[str]) -> Dict[str, str]:
+        '''Sign many blobs at once: each distinct name is signed once, the misses concurrently.
+
+        Returns a mapping from blob name to signed URL (empty names map to an empty string).
+        '''
+        blob_names = list(dict.fromkeys(blob_names))
+        signed_urls: Dict[str, str] = {blob_name: '' for blob_name in blob_names if not blob_name}
+        signed_urls.update(await self.manager.get_many(self.bucket_name, [blob_name for blob_name in blob_names if blob_name]))
+        misses = [blob_name for blob_name in blob_names if blob_name not in signed_urls]
+        if misses:
+            self.logger.log_debug(f'Signing {len(misses)} images, {len(signed_urls)} were already signed')
+            new_signed_urls = dict(zip(misses, await asyncio.gather(*(self._sign(blob_name) for blob_name in misses))))
+            await self.manager.cache_images(self.bucket_name, new_signed_urls, timedelta(seconds=self.signed_url_expiration_seconds))
+            signed_urls.update(new_signed_urls)
+        return signed_urls
+
+    async def _sign(self, blob_name: str) -> str:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_signing_executor(), self.signer.sign, blob_name)
+
+    @classmethod
+    def _get_signing_executor(cls) -> ThreadPoolExecutor:
+        if cls._signing_executor is None:
+            with cls._signing_executor_lock:
+                if cls._signing_executor is None:
+                    max_workers = EnvVariableManager().load('SIGNED_URL_MAX_WORKERS', 8).integer()
+                    cls._signing_executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='url-signer')
+        return cls._signing_executor
 
     def _get_content_type(self, filename: str) -> str:
         ext = Path(filename).suffix.lower()
@@ -80,34 +111,123 @@ class GoogleBucketsClient:
             '.png': 'image/png',
             '.webp': 'image/webp'
         }.get(ext, 'application/octet-stream')
-    
-class GoogleStorageClientCacheImage:
 
-    def __init__(self, blob_name: str, signed_url: str, expiration: timedelta):
-        self.blob_name: str = blob_name
-        self.signed_url: str = signed_url
-        self.expires_at: datetime = datetime.now() + expiration
-
-    def is_expired(self) -> bool:
-        return datetime.now() >= self.expires_at
 
 class GoogleStorageClientCacheManager:
+    '''Process-wide, size-bounded LRU of signed URLs shared by every GoogleBucketsClient.
+
+    The URLs are keyed by bucket and blob name, since the same blob name can exist in two buckets.
+
+    Entries live slightly less than the signed URLs themselves, so a cached URL is never
+    handed out right before it stops working, and a periodic sweeper drops the expired
+    ones instead of waiting for a read to find them. With a backend configured the LRU is
+    only the first tier: local misses are looked up in the backend, which the other
+    workers fill, before anything is signed.
+    '''
+
+    _shared: Optional['GoogleStorageClientCacheManager'] = None
+
+    def __init__(self,
+                 max_size: int = 20000,
+                 ttl_seconds: float = 10500,
+                 sweep_interval_seconds: float = 60,
+                 backend: Optional[ISignedUrlCacheBackend] = None):
+        self.logger = Logger('GoogleStorageClientCacheManager')
+        self.cached = LruTtlCache[Tuple[str, str], str](max_size=max_size, ttl_seconds=ttl_seconds)
+        self.sweep_interval_seconds = sweep_interval_seconds
+        self.backend = backend
+        self.shared_hits: int = 0
+        self._sweeper: Optional[asyncio.Task] = None
+
+    @classmethod
+    def shared(cls) -> 'GoogleStorageClientCacheManager':
+        '''Process-wide cache configured from the SIGNED_URL_CACHE_* environment variables.'''
+        if cls._shared is None:
+            env = EnvVariableManager()
+            expiration_seconds = env.load('SIGNED_BUCKET_URL_EXPIRATION_SECONDS', 10800).integer()
+            margin_seconds = env.load('SIGNED_URL_CACHE_MARGIN_SECONDS', 300).integer()
+            cls._shared = cls(
+                max_size=env.load('SIGNED_URL_CACHE_SIZE', 20000).integer(),
+                ttl_seconds=expiration_seconds - margin_seconds,
+                sweep_interval_seconds=env.load('SIGNED_URL_CACHE_SWEEP_SECONDS', 60).float()
+            )
+        return cls._shared
+
+    def use_backend(self, backend: Optional[ISignedUrlCacheBackend]) -> None:
+        '''Share the signed URLs with the other workers through `backend` (None keeps them process-local).'''
+        self.backend = backend
+
+    async def get_many(self, bucket_name: str, blob_names: List[str]) -> Dict[str, str]:
+        '''Return the cached signed URLs of the given blobs of the bucket, looking in the shared backend for local misses.'''
+        signed_urls: Dict[str, str] = {}
+        misses: List[str] = []
+        for blob_name in blob_names:
+            signed_url = self.cached.get((bucket_name, blob_name))
+            if signed_url is None:
+                misses.append(blob_name)
+            else:
+                signed_urls[blob_name] = signed_url
+        if misses and self.backend is not None:
+            now = datetime.now(pytz.utc)
+            for blob_name, (signed_url, expires_at) in (await self._read_backend(bucket_name, misses)).items():
+                self.cached.set((bucket_name, blob_name), signed_url, (expires_at - now).total_seconds())
+                signed_urls[blob_name] = signed_url
+                self.shared_hits += 1
+        return signed_urls
+
+    async def cache_images(self, bucket_name: str, signed_urls: Dict[str, str], expiration: timedelta) -> None:
+        ttl_seconds = min(expiration.total_seconds(), self.cached.ttl_seconds)
+        for blob_name, signed_url in signed_urls.items():
+            self.cached.set((bucket_name, blob_name), signed_url, ttl_seconds)
+        if not signed_urls or self.backend is None:
+            return
+        try:
+            await self.backend.save_many(bucket_name, signed_urls, datetime.now(pytz.utc) + timedelta(seconds=ttl_seconds))
+        except Exception as ex:
+            self.logger.log_warning(f'{len(signed_urls)} signed URLs could not be shared with the other workers: {ex}')
+
+    async def remove_cache(self, bucket_name: str, blob_name: str) -> None:
+        self.cached.remove((bucket_name, blob_name))
+        if self.backend is None:
+            return
+        try:
+            await self.backend.remove(bucket_name, blob_name)
+        except Exception as ex:
+            self.logger.log_warning(f'The shared signed URL of {blob_name} could not be removed: {ex}')
 
-    def __init__(self):
-        self.cached: Dict[str, GoogleStorageClientCacheImage] = {}
-
-    def cache_image(self, blob_name: str, signed_url: str, expiration: timedelta) -> None:
-        self.cached[blob_name] = GoogleStorageClientCacheImage(blob_name, signed_url, expiration)
+    def stats(self) -> dict:
+        return {**self.cached.stats(), 'shared_hits': self.shared_hits}
 
-    def remove_cache(self, blob_name: str) -> None:
-        if self.cached.get(blob_name):
-            del self.cached[blob_name]
+    def start_sweeper(self) -> None:
+        if self._sweeper is not None and not self._sweeper.done():
+            return
+        self._sweeper = asyncio.create_task(self._sweep_periodically(), name='signed-url-cache-sweeper')
 
-    def get_image_signed_url(self, blob_name: str) -> Optional[str]:
-        cached_image = self.cached.get(blob_name)
-        if not cached_image:
-            return None
-        if cached_image.is_expired():
-            self.remove_cache(blob_name)
-            return None
-        return cached_image.signed_url
\ No newline at end of file
+    async def stop_sweeper(self) -> None:
+        if self._sweeper is None:
+            return
+        self._sweeper.cancel()
+        try:
+            await self._sweeper
+        except asyncio.CancelledError:
+            pass
+        self._sweeper = None
+
+    async def _sweep_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.sweep_interval_seconds)
+            removed = self.cached.sweep()
+            if removed:
+                self.logger.log_debug(f'{removed} expired signed URLs were dropped from the cache')
+            if self.backend is not None:
+                try:
+                    await self.backend.purge_expired()
+                except Exception as ex:
+                    self.logger.log_warning(f'The expired shared signed URLs could not be purged: {ex}')
+
+    async def _read_backend(self, bucket_name: str, blob_names: List[str]) -> Dict[str, Tuple[str, datetime]]:
+        try:
+            return await self.backend.get_many(bucket_name, blob_names)
+        except Exception as ex:
+            self.logger.log_warning(f'The shared signed URLs could not be read: {ex}')
+            return {}
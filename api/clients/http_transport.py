@@ -0,0 +1,70 @@
+import asyncio
+from typing import Optional
+import httpx
+from api.shared.env_variable_manager import EnvVariableManager
+from api.shared.logger import Logger
+
+
+class HttpTransport:
+    '''Async HTTP transport shared by the external API clients.
+
+    Connections are pooled and kept alive between calls, every request has a timeout, and
+    the number of in-flight requests per host is capped so a slow provider cannot take
+    over the whole pool.
+    '''
+
+    _shared: Optional['HttpTransport'] = None
+
+    def __init__(self,
+                 max_connections: int = 20,
+                 max_keepalive_connections: int = 10,
+                 keepalive_expiry_seconds: float = 30,
+                 timeout_seconds: float = 10,
+                 per_host_limit: int = 5):
+        self.logger = Logger('HttpTransport')
+        self.per_host_limit = per_host_limit
+        self.client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry_seconds
+            ),
+            timeout=httpx.Timeout(timeout_seconds)
+        )
+        self._host_semaphores: dict[str, asyncio.Semaphore] = {}
+
+    @classmethod
+    def shared(cls) -> 'HttpTransport':
+        '''Process-wide transport configured from the HTTP_CLIENT_* environment variables.'''
+        if cls._shared is None:
+            env = EnvVariableManager()
+            cls._shared = cls(
+                max_connections=env.load('HTTP_CLIENT_MAX_CONNECTIONS', 20).integer(),
+                max_keepalive_connections=env.load('HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS', 10).integer(),
+                keepalive_expiry_seconds=env.load('HTTP_CLIENT_KEEPALIVE_SECONDS', 30).float(),
+                timeout_seconds=env.load('HTTP_CLIENT_TIMEOUT_SECONDS', 10).float(),
+                per_host_limit=env.load('HTTP_CLIENT_PER_HOST_LIMIT', 5).integer()
+            )
+        return cls._shared
+
+    @classmethod
+    async def close_shared(cls) -> None:
+        if cls._shared is not None:
+            await cls._shared.close()
+            cls._shared = None
+
+    async def get(self, url: str, params: Optional[dict] = None, headers: Optional[dict] = None) -> httpx.Response:
+        host = httpx.URL(url).host
+        async with self._semaphore_for(host):
+            self.logger.log_debug(f'GET {url}')
+            return await self.client.get(url, params=params, headers=headers)
+
+    async def close(self) -> None:
+        await self.client.aclose()
+
+    def _semaphore_for(self, host: str) -> asyncio.Semaphore:
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.per_host_limit)
+            self._host_semaphores[host] = semaphore
+        return semaphore
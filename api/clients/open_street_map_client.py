@@ -1,39 +1,48 @@
+from api.clients.geocode_cache import GeocodeCache
+from api.clients.http_transport import HttpTransport
 from api.domain.entities.address import Address
 from api.exceptions.external_service_exception import ExternalServiceException
 from api.exceptions.not_found_exception import NotFoundException
 from api.shared.logger import Logger
 from api.shared.validator import Validator
-import http.client
-import urllib.parse
-import json
+from typing import Optional
 
 
 class OpenStreetMapsClient:
     BASE_HOST = 'nominatim.openstreetmap.org'
     BASE_PATH = '/search'
 
-    def __init__(self):
+    def __init__(self, transport: Optional[HttpTransport] = None, base_url: Optional[str] = None, cache: Optional[GeocodeCache] = None):
         self.logger = Logger('NominatimClient')
         self.validator = Validator()
+        self.transport = transport or HttpTransport.shared()
+        self.base_url = base_url or f'https://{self.BASE_HOST}'
+        self.cache = cache
 
     async def get_coordinates(self, address: Address) -> tuple[float, float]:
         """Retrieve latitude and longitude for a given address using Nominatim API."""
         self._validate_address(address)
         query = self._build_query(address)
+        if self.cache is None:
+            return await self._fetch_coordinates(query)
+        return await self.cache.get_or_fetch(self.cache_key(address), lambda: self._fetch_coordinates(query))
+
+    def cache_key(self, address: Address) -> str:
+        """Normalized query for the address; equal keys always geocode to the same place."""
+        return ' '.join(self._build_query(address).lower().split())
+
+    async def _fetch_coordinates(self, query: str) -> tuple[float, float]:
         self.logger.log_info(f'Consultando coordenadas para: {query}')
         try:
-            conn = http.client.HTTPSConnection(self.BASE_HOST)
-            path = f'{self.BASE_PATH}?q={urllib.parse.quote(query)}&format=json&limit=1'
+            params = {'q': query, 'format': 'json', 'limit': 1}
             headers = {
                 'User-Agent': 'TudoFresco/1.0 (gbrl.volt@gmail.com)'
             }
-            conn.request('GET', path, headers=headers)
-            response = conn.getresponse()
-            if response.status != 200:
-                error_message = response.read().decode()
-                self.logger.log_error(f'Erro HTTP {response.status}: {error_message}')
-                raise ExternalServiceException(f'Erro ao buscar coordenadas: {response.status}')
-            result = json.loads(response.read())
+            response = await self.transport.get(f'{self.base_url}{self.BASE_PATH}', params=params, headers=headers)
+            if response.status_code != 200:
+                self.logger.log_error(f'Erro HTTP {response.status_code}: {response.text}')
+                raise ExternalServiceException(f'Erro ao buscar coordenadas: {response.status_code}')
+            result = response.json()
             if not result:
                 raise NotFoundException('Endereço não encontrado no Nominatim.')
             lat = float(result[0]['lat'])
@@ -43,8 +52,6 @@ class OpenStreetMapsClient:
         except Exception as ex:
             self.logger.log_error(f'Erro inesperado ao consultar endereço: {ex}')
             raise ExternalServiceException(f'Erro inesperado ao consultar coordenadas: {ex}')
-        finally:
-            conn.close()
 
     def _validate_address(self, address: Address):
         """Validate that required address fields are not empty."""
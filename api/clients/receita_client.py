@@ -1,21 +1,23 @@
+from api.clients.http_transport import HttpTransport
 from api.controllers.models.store.store_response_model import StoreResponseModel
 from api.controllers.models.address.address_response_model import AddressResponseModel
 from api.exceptions.external_service_exception import ExternalServiceException
 from api.exceptions.not_found_exception import NotFoundException
 from api.shared.validator import Validator
 from api.shared.logger import Logger
-import http.client
-import json
 from datetime import datetime
+from typing import Optional
 
 
 class ReceitaClient:
     BASE_HOST = "receitaws.com.br"
     BASE_PATH = "/v1/cnpj"
 
-    def __init__(self):
+    def __init__(self, transport: Optional[HttpTransport] = None, base_url: Optional[str] = None):
         self.logger = Logger('ReceitaClient')
         self.validator = Validator()
+        self.transport = transport or HttpTransport.shared()
+        self.base_url = base_url or f'https://{self.BASE_HOST}'
 
     async def get_by_cnpj(self, cnpj: str) -> StoreResponseModel:
         self.validator.on(cnpj, 'CNPJ').cnpj_is_valid(f'O valor informado: {cnpj} não é um CNPJ válido').check()
@@ -57,18 +59,15 @@ class ReceitaClient:
         return store_response
 
     async def _fetch_data_from_receita(self, cnpj: str) -> dict:
-        conn = http.client.HTTPSConnection(self.BASE_HOST)
         cleaned_cnpj = cnpj.replace('/', '').replace('.', '').replace('-', '')
         path = f"{self.BASE_PATH}/{cleaned_cnpj}"
         self.logger.log_info(f"Fetching the Cnpj: {cnpj} from the gov")
         try:
-            conn.request("GET", path)
-            response = conn.getresponse()
-            if response.status != 200:
-                error_message = response.read().decode()
-                self.logger.log_error(f"Error while fetching the Cnpj {cnpj}: {response.status} - {error_message}")
-                raise ExternalServiceException(f"Error while fetching the Cnpj {cnpj}: {response.status}")
-            data: dict = json.loads(response.read())
+            response = await self.transport.get(f'{self.base_url}{path}')
+            if response.status_code != 200:
+                self.logger.log_error(f"Error while fetching the Cnpj {cnpj}: {response.status_code} - {response.text}")
+                raise ExternalServiceException(f"Error while fetching the Cnpj {cnpj}: {response.status_code}")
+            data: dict = response.json()
             if data.get('status') == 'ERROR':
                 error_message = data.get('message', 'Unknown error')
                 self.logger.log_error(f"Error in API response: {error_message}")
@@ -78,5 +77,3 @@ class ReceitaClient:
         except Exception as ex:
             self.logger.log_error(f'Error while fecthing the cnpj: {cnpj}. Details: {ex}')
             return {}
-        finally:
-            conn.close()
\ No newline at end of file
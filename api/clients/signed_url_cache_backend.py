@@ -0,0 +1,54 @@
+from abc import abstractmethod
+from datetime import datetime
+from typing import Dict, Iterable, Tuple
+from api.infrastructure.repositories.signed_url_cache_repository import SignedUrlCacheRepository
+from api.infrastructure.request_session_scope import RequestSessionScope
+
+
+class ISignedUrlCacheBackend:
+    '''Store of signed URLs shared between API workers, read after the in-process cache misses.'''
+
+    @abstractmethod
+    async def get_many(self, bucket_name: str, blob_names: Iterable[str]) -> Dict[str, Tuple[str, datetime]]:
+        '''Return the (signed URL, expiration) of the requested blobs of the bucket that are still valid.'''
+        raise NotImplementedError("Subclasses must implement 'get_many'")
+
+    @abstractmethod
+    async def save_many(self, bucket_name: str, signed_urls: Dict[str, str], expires_at: datetime) -> None:
+        raise NotImplementedError("Subclasses must implement 'save_many'")
+
+    @abstractmethod
+    async def remove(self, bucket_name: str, blob_name: str) -> None:
+        raise NotImplementedError("Subclasses must implement 'remove'")
+
+    @abstractmethod
+    async def purge_expired(self) -> int:
+        '''Delete the expired entries and return how many were deleted.'''
+        raise NotImplementedError("Subclasses must implement 'purge_expired'")
+
+
+class PostgresSignedUrlCacheBackend(ISignedUrlCacheBackend):
+    '''Keeps the signed URLs in the unlogged `signed_url_cache` table.
+
+    Every call runs in its own session scope, so caching a URL never commits (or waits on)
+    the session of the request that asked for it.
+    '''
+
+    def __init__(self, session_scope: RequestSessionScope):
+        self.session_scope = session_scope
+
+    async def get_many(self, bucket_name: str, blob_names: Iterable[str]) -> Dict[str, Tuple[str, datetime]]:
+        async with self.session_scope.begin() as session:
+            return await SignedUrlCacheRepository(session).get_many(bucket_name, blob_names)
+
+    async def save_many(self, bucket_name: str, signed_urls: Dict[str, str], expires_at: datetime) -> None:
+        async with self.session_scope.begin() as session:
+            await SignedUrlCacheRepository(session).save_many(bucket_name, signed_urls, expires_at)
+
+    async def remove(self, bucket_name: str, blob_name: str) -> None:
+        async with self.session_scope.begin() as session:
+            await SignedUrlCacheRepository(session).delete(bucket_name, blob_name)
+
+    async def purge_expired(self) -> int:
+        async with self.session_scope.begin() as session:
+            return await SignedUrlCacheRepository(session).delete_expired()
@@ -0,0 +1,69 @@
+import binascii
+import hashlib
+from datetime import datetime, timezone
+from typing import Optional, Tuple
+from urllib.parse import quote, urlparse
+from google.oauth2 import service_account
+
+
+class V4UrlSigner:
+    '''Builds Cloud Storage V4 signed GET URLs for one bucket without going through `Blob`.
+
+    The output is exactly what `bucket.blob(name).generate_signed_url(version='v4', method='GET')`
+    returns. The service-account signer is resolved once, and the parts of the canonical
+    request that only depend on the day are computed once per day instead of once per URL.
+    '''
+
+    ALGORITHM = 'GOOG4-RSA-SHA256'
+    DEFAULT_ENDPOINT = 'https://storage.googleapis.com'
+
+    def __init__(self,
+                 credentials: service_account.Credentials,
+                 bucket_name: str,
+                 expiration_seconds: int,
+                 api_access_endpoint: str = DEFAULT_ENDPOINT):
+        self.signer = credentials.signer
+        self.signer_email: str = credentials.signer_email
+        self.endpoint: str = api_access_endpoint
+        self.expiration_seconds: int = int(expiration_seconds)
+        self._resource_prefix = f'/{bucket_name}/'
+        self._canonical_headers = f'host:{urlparse(api_access_endpoint).netloc}\n'
+        # (datestamp, credential scope, quoted credential), swapped as a whole so threads signing across midnight never mix two days
+        self._scope: Tuple[str, str, str] = ('', '', '')
+
+    def sign(self, blob_name: str, now: Optional[datetime] = None) -> str:
+        now = (now or datetime.now(timezone.utc)).astimezone(timezone.utc)
+        timestamp = now.strftime('%Y%m%dT%H%M%SZ')
+        credential_scope, quoted_credential = self._scope_for(timestamp[:8])
+        resource = self._resource_prefix + quote(blob_name.encode('utf-8'), safe=b'/~')
+        canonical_query = (
+            f'X-Goog-Algorithm={self.ALGORITHM}'
+            f'&X-Goog-Credential={quoted_credential}'
+            f'&X-Goog-Date={timestamp}'
+            f'&X-Goog-Expires={self.expiration_seconds}'
+            '&X-Goog-SignedHeaders=host'
+        )
+        canonical_request = '\n'.join([
+            'GET',
+            resource,
+            canonical_query,
+            self._canonical_headers,
+            'host',
+            'UNSIGNED-PAYLOAD',
+        ])
+        string_to_sign = '\n'.join([
+            self.ALGORITHM,
+            timestamp,
+            credential_scope,
+            hashlib.sha256(canonical_request.encode('ascii')).hexdigest(),
+        ])
+        signature = binascii.hexlify(self.signer.sign(string_to_sign.encode('ascii'))).decode('ascii')
+        return f'{self.endpoint}{resource}?{canonical_query}&X-Goog-Signature={signature}'
+
+    def _scope_for(self, datestamp: str) -> Tuple[str, str]:
+        cached_datestamp, credential_scope, quoted_credential = self._scope
+        if datestamp != cached_datestamp:
+            credential_scope = f'{datestamp}/auto/storage/goog4_request'
+            quoted_credential = quote(f'{self.signer_email}/{credential_scope}', safe='~')
+            self._scope = (datestamp, credential_scope, quoted_credential)
+        return credential_scope, quoted_credential
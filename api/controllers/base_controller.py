@@ -1,4 +1,4 @@
-from typing import Generic, TypeVar, Type, List
+from typing import Generic, Optional, TypeVar, Type, List
 from uuid import UUID
 from fastapi import APIRouter, Body, Depends, Query
 from fastapi.responses import JSONResponse
@@ -22,7 +22,8 @@ class BaseController(Generic[RequestModelT, ResponseModelT]):
         response_model: Type[ResponseModelT],
         prefix: str,
         tag: str,
-        auth_wrapper: AuthWrapper
+        auth_wrapper: AuthWrapper,
+        list_response_model: Optional[Type[BaseResponseModel]] = None
     ):
         self.service = service
         self.logger = Logger(tag)
@@ -51,7 +52,7 @@ class BaseController(Generic[RequestModelT, ResponseModelT]):
             path='/list',
             endpoint=self._list_handler(),
             methods=['GET'],
-            response_model=List[response_model],
+            response_model=List[list_response_model or response_model],
             summary=f'List {tag}s',
             dependencies=[Depends(self.auth_wrapper.with_access([UserAccess.ADMIN,  UserAccess.STORE_OWNER, UserAccess.EMPLOYEE]))]
         )
@@ -63,6 +64,14 @@ class BaseController(Generic[RequestModelT, ResponseModelT]):
             summary=f'Update {tag} by UUID',
             dependencies=[Depends(self.auth_wrapper.with_access([UserAccess.ADMIN,  UserAccess.STORE_OWNER, UserAccess.EMPLOYEE]))]
         )
+        self.router.add_api_route(
+            path='/by-uuid/{uuid}',
+            endpoint=self._patch_handler(),
+            methods=['PATCH'],
+            response_model=response_model,
+            summary=f'Partially update {tag} by UUID',
+            dependencies=[Depends(self.auth_wrapper.with_access([UserAccess.ADMIN,  UserAccess.STORE_OWNER, UserAccess.EMPLOYEE]))]
+        )
         self.router.add_api_route(
             path='/by-uuid/{uuid}',
             endpoint=self._delete_handler(),
@@ -87,9 +96,9 @@ class BaseController(Generic[RequestModelT, ResponseModelT]):
         return get
 
     def _list_handler(self):
-        async def list_entities(page: int = Query(1), per_page: int = Query(10)) -> JSONResponse:
-            self.logger.log_info(f"Listing entities page: {page}, per_page: {per_page}")
-            service_response: ServiceResponse = await self.service.list(page=page, per_page=per_page)
+        async def list_entities(page: int = Query(1), per_page: int = Query(10), cursor: Optional[str] = None) -> JSONResponse:
+            self.logger.log_info(f"Listing entities page: {page}, per_page: {per_page}, cursor: {cursor}")
+            service_response: ServiceResponse = await self.service.list(page=page, per_page=per_page, cursor=cursor)
             return self.make_response(service_response)
         return list_entities
 
@@ -100,6 +109,14 @@ class BaseController(Generic[RequestModelT, ResponseModelT]):
             return self.make_response(service_response)
         return update
 
+    def _patch_handler(self):
+        patch_model = self.request_model.partial()
+        async def patch(uuid: UUID, model: patch_model = Body(...)) -> JSONResponse:
+            self.logger.log_info(f"Patching the fields {sorted(model.model_fields_set)} of the entity {uuid}")
+            service_response: ServiceResponse = await self.service.patch(obj_id=uuid, request=model)
+            return self.make_response(service_response)
+        return patch
+
     def _delete_handler(self):
         async def delete(uuid: UUID) -> JSONResponse:
             self.logger.log_info(f"Deleting entity {uuid}")
@@ -112,10 +129,13 @@ class BaseController(Generic[RequestModelT, ResponseModelT]):
             pass
         elif not service_response.payload:
             service_response.payload = {}
+        content = {
+            'payload': service_response.payload,
+            'message': service_response.message
+        }
+        if service_response.next_cursor:
+            content['next_cursor'] = service_response.next_cursor
         return JSONResponse(
             status_code=service_response.status,
-            content=jsonable_encoder({
-                'payload': service_response.payload,
-                'message': service_response.message
-            })
+            content=jsonable_encoder(content)
         )
\ No newline at end of file
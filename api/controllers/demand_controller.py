@@ -1,10 +1,14 @@
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 from fastapi import Body, Depends, Query
 from fastapi.responses import JSONResponse
 from api.controllers.auth_wrapper import AuthWrapper
+from api.controllers.models.demand.demand_bulk_request_model import DemandBulkRequestModel
+from api.controllers.models.demand.demand_bulk_status_request_model import DemandBulkStatusRequestModel
+from api.controllers.models.demand.demand_bulk_status_response_model import DemandBulkStatusResponseModel
 from api.controllers.models.demand.demand_request_model import DemandRequestModel
 from api.controllers.models.demand.demand_response_model import DemandResponseModel
+from api.controllers.models.demand.demand_summary_response_model import DemandSummaryResponseModel
 from api.controllers.models.user.user_response_model import UserResponseModel
 from api.enums.demand_status import DemandStatus
 from api.enums.product_type import ProductType
@@ -29,7 +33,7 @@ class DemandController(BaseController[DemandRequestModel, DemandResponseModel]):
             path='/list-by-store',
             endpoint=self._list_by_store_handler(),
             methods=['GET'],
-            response_model=List[DemandResponseModel],
+            response_model=List[DemandSummaryResponseModel],
             status_code=200,
             summary=f'Listing {self.__class__.__name__} by store'
         )
@@ -40,6 +44,22 @@ class DemandController(BaseController[DemandRequestModel, DemandResponseModel]):
             response_model=DemandResponseModel,
             summary='Get DemandResponseModel by UUID'
         )
+        self.router.add_api_route(
+            path='/bulk',
+            endpoint=self._create_many_handler(),
+            methods=['POST'],
+            response_model=List[DemandResponseModel],
+            status_code=201,
+            summary='Create many demands at once'
+        )
+        self.router.add_api_route(
+            path='/bulk-status',
+            endpoint=self._update_status_many_handler(),
+            methods=['PATCH'],
+            response_model=DemandBulkStatusResponseModel,
+            status_code=200,
+            summary='Change the status of many demands at once'
+        )
     
     def _create_handler(self):
         async def create(model: DemandRequestModel = Body(...),
@@ -49,6 +69,41 @@ class DemandController(BaseController[DemandRequestModel, DemandResponseModel]):
             return self.make_response(service_response)
         return create
 
+    def _update_handler(self):
+        async def update(uuid: UUID,
+                         model: DemandRequestModel = Body(...),
+                         user: UserResponseModel = Depends(self.auth_wrapper.with_access([UserAccess.STORE_OWNER, UserAccess.ADMIN]))) -> JSONResponse:
+            self.logger.log_info(f'Updating the demand {uuid}')
+            service_response: ServiceResponse = await self.service.update(obj_id=uuid, request=model, user=user)
+            return self.make_response(service_response)
+        return update
+
+    def _patch_handler(self):
+        patch_model = DemandRequestModel.partial()
+        async def patch(uuid: UUID,
+                        model: patch_model = Body(...),
+                        user: UserResponseModel = Depends(self.auth_wrapper.with_access([UserAccess.STORE_OWNER, UserAccess.ADMIN]))) -> JSONResponse:
+            self.logger.log_info(f'Patching the fields {sorted(model.model_fields_set)} of the demand {uuid}')
+            service_response: ServiceResponse = await self.service.patch(obj_id=uuid, request=model, user=user)
+            return self.make_response(service_response)
+        return patch
+
+    def _create_many_handler(self):
+        async def create_many(model: DemandBulkRequestModel = Body(...),
+                              user: UserResponseModel = Depends(self.auth_wrapper.with_access([UserAccess.STORE_OWNER, UserAccess.ADMIN]))) -> JSONResponse:
+            self.logger.log_info(f'Creating {len(model.demands)} demands')
+            service_response: ServiceResponse = await self.service.create_many(user=user, request=model)
+            return self.make_response(service_response)
+        return create_many
+
+    def _update_status_many_handler(self):
+        async def update_status_many(model: DemandBulkStatusRequestModel = Body(...),
+                                     user: UserResponseModel = Depends(self.auth_wrapper.with_access([UserAccess.STORE_OWNER, UserAccess.ADMIN]))) -> JSONResponse:
+            self.logger.log_info(f'Changing the status of {len(model.demand_uuids)} demands to {model.status.value}')
+            service_response: ServiceResponse = await self.service.update_status_many(user=user, request=model)
+            return self.make_response(service_response)
+        return update_status_many
+
     def _get_handler(self):
         async def get(uuid: UUID,
                       user: UserResponseModel = Depends(self.auth_wrapper.with_access([UserAccess.STORE_OWNER, UserAccess.ADMIN])),
@@ -63,9 +118,10 @@ class DemandController(BaseController[DemandRequestModel, DemandResponseModel]):
             async def list_by_store(
                 store_uuid: UUID, page: int = Query(1), per_page: int = Query(10), radius_meters: int = 10000, product_type: ProductType = ProductType.ANY,
                 status: DemandStatus = DemandStatus.ANY,
+                cursor: Optional[str] = None,
                 user: UserResponseModel = Depends(self.auth_wrapper.with_access([UserAccess.STORE_OWNER, UserAccess.ADMIN]))
             ) -> JSONResponse:
-                self.logger.log_info(f'Listing the demands for the store {store_uuid}, page: {page}, per page: {per_page}')
+                self.logger.log_info(f'Listing the demands for the store {store_uuid}, page: {page}, per page: {per_page}, cursor: {cursor}')
                 service_response: ServiceResponse = await self.service.list_by_store(
                     user=user,
                     store_uuid=store_uuid,
@@ -73,7 +129,8 @@ class DemandController(BaseController[DemandRequestModel, DemandResponseModel]):
                     page=page,
                     per_page=per_page,
                     radius_meters=radius_meters,
-                    product_type=product_type
+                    product_type=product_type,
+                    cursor=cursor
                 )
                 return self.make_response(service_response)
             return list_by_store
\ No newline at end of file
@@ -0,0 +1,94 @@
+from fastapi import APIRouter, Depends
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from api.controllers.auth_wrapper import AuthWrapper
+from api.controllers.models.metrics.cep_cache_metrics_response_model import CepCacheMetricsResponseModel
+from api.controllers.models.metrics.db_pool_metrics_response_model import DbPoolMetricsResponseModel
+from api.controllers.models.metrics.geocoding_queue_metrics_response_model import GeocodingQueueMetricsResponseModel
+from api.controllers.models.metrics.signed_url_cache_metrics_response_model import SignedUrlCacheMetricsResponseModel
+from api.enums.user_access import UserAccess
+from api.services.metrics_service import MetricsService
+from api.services.service_response import ServiceResponse
+from api.shared.logger import Logger
+
+
+class MetricsController:
+
+    def __init__(self, service: MetricsService, auth_wrapper: AuthWrapper):
+        self.service = service
+        self.auth_wrapper = auth_wrapper
+        self.logger = Logger(self.__class__.__name__)
+        self.router = APIRouter(prefix='/metrics', tags=[self.__class__.__name__])
+        self.router.add_api_route(
+            path='/db-pool',
+            endpoint=self._db_pool_handler(),
+            methods=['GET'],
+            response_model=DbPoolMetricsResponseModel,
+            status_code=200,
+            summary='Database connection pool occupancy and checkout wait times',
+            dependencies=[Depends(self.auth_wrapper.with_access([UserAccess.ADMIN]))]
+        )
+        self.router.add_api_route(
+            path='/cep-cache',
+            endpoint=self._cep_cache_handler(),
+            methods=['GET'],
+            response_model=CepCacheMetricsResponseModel,
+            status_code=200,
+            summary='Hits and misses of the CEP lookup cache',
+            dependencies=[Depends(self.auth_wrapper.with_access([UserAccess.ADMIN]))]
+        )
+        self.router.add_api_route(
+            path='/geocoding-queue',
+            endpoint=self._geocoding_queue_handler(),
+            methods=['GET'],
+            response_model=GeocodingQueueMetricsResponseModel,
+            status_code=200,
+            summary='Depth and lag of the background geocoding queue',
+            dependencies=[Depends(self.auth_wrapper.with_access([UserAccess.ADMIN]))]
+        )
+        self.router.add_api_route(
+            path='/signed-url-cache',
+            endpoint=self._signed_url_cache_handler(),
+            methods=['GET'],
+            response_model=SignedUrlCacheMetricsResponseModel,
+            status_code=200,
+            summary='Size and hit ratio of the signed image URL cache',
+            dependencies=[Depends(self.auth_wrapper.with_access([UserAccess.ADMIN]))]
+        )
+
+    def _db_pool_handler(self):
+        async def db_pool() -> JSONResponse:
+            self.logger.log_debug('Reading the database pool metrics')
+            service_response: ServiceResponse = await self.service.get_db_pool()
+            return self.make_response(service_response)
+        return db_pool
+
+    def _cep_cache_handler(self):
+        async def cep_cache() -> JSONResponse:
+            self.logger.log_debug('Reading the CEP cache metrics')
+            service_response: ServiceResponse = await self.service.get_cep_cache()
+            return self.make_response(service_response)
+        return cep_cache
+
+    def _geocoding_queue_handler(self):
+        async def geocoding_queue() -> JSONResponse:
+            self.logger.log_debug('Reading the geocoding queue metrics')
+            service_response: ServiceResponse = await self.service.get_geocoding_queue()
+            return self.make_response(service_response)
+        return geocoding_queue
+
+    def _signed_url_cache_handler(self):
+        async def signed_url_cache() -> JSONResponse:
+            self.logger.log_debug('Reading the signed URL cache metrics')
+            service_response: ServiceResponse = await self.service.get_signed_url_cache()
+            return self.make_response(service_response)
+        return signed_url_cache
+
+    def make_response(self, service_response: ServiceResponse) -> JSONResponse:
+        return JSONResponse(
+            status_code=service_response.status,
+            content=jsonable_encoder({
+                'payload': service_response.payload or {},
+                'message': service_response.message
+            })
+        )
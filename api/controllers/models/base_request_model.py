@@ -1,4 +1,21 @@
-from pydantic import BaseModel
+from functools import cache
+from typing import Optional, Type
+from pydantic import BaseModel, Field, create_model
+from pydantic.fields import FieldInfo
 
 class BaseRequestModel(BaseModel):
-    pass
\ No newline at end of file
+
+    @classmethod
+    @cache
+    def partial(cls) -> Type['BaseRequestModel']:
+        '''The same fields, all of them optional, plus the version the client read, for PATCH bodies.
+
+        Fields left out of the body are not set, so `model_dump(exclude_unset=True)` only has the
+        ones to change. A field sent as null is still validated against its original type.
+        '''
+        fields = {
+            name: (field.annotation, FieldInfo.merge_field_infos(field, default=None, default_factory=None))
+            for name, field in cls.model_fields.items()
+        }
+        fields['version'] = (Optional[int], Field(None, example=1, description='Versão do registro lida pelo cliente'))
+        return create_model(f'{cls.__name__}Patch', __base__=BaseRequestModel, **fields)
@@ -0,0 +1,10 @@
+from typing import List
+from pydantic import Field
+from api.controllers.models.base_request_model import BaseRequestModel
+from api.controllers.models.demand.demand_request_model import DemandRequestModel
+
+MAX_BULK_DEMANDS = 1000
+
+
+class DemandBulkRequestModel(BaseRequestModel):
+    demands: List[DemandRequestModel] = Field(..., min_length=1, max_length=MAX_BULK_DEMANDS)
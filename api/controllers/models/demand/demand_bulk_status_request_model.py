@@ -0,0 +1,11 @@
+from typing import List
+from uuid import UUID
+from pydantic import Field
+from api.controllers.models.base_request_model import BaseRequestModel
+from api.controllers.models.demand.demand_bulk_request_model import MAX_BULK_DEMANDS
+from api.enums.demand_status import DemandStatus
+
+
+class DemandBulkStatusRequestModel(BaseRequestModel):
+    demand_uuids: List[UUID] = Field(..., min_length=1, max_length=MAX_BULK_DEMANDS, example=['2d7f5e9f-fb71-4fd2-b929-2d6d7a99fa7a'])
+    status: DemandStatus = Field(..., example=DemandStatus.CLOSED.value)
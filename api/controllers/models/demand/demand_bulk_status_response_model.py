@@ -0,0 +1,9 @@
+from typing import List
+from uuid import UUID
+from pydantic import BaseModel, Field
+from api.enums.demand_status import DemandStatus
+
+
+class DemandBulkStatusResponseModel(BaseModel):
+    status: DemandStatus = Field(..., example=DemandStatus.CLOSED.value)
+    demand_uuids: List[UUID] = Field(..., example=['2d7f5e9f-fb71-4fd2-b929-2d6d7a99fa7a'])
@@ -0,0 +1,11 @@
+from pydantic import BaseModel, Field
+
+
+class CepCacheMetricsResponseModel(BaseModel):
+    memory_hits: int = Field(..., example=980)
+    database_hits: int = Field(..., example=15)
+    misses: int = Field(..., example=5)
+    negative_hits: int = Field(..., example=3)
+    hit_ratio: float = Field(..., example=0.995)
+    memory_size: int = Field(..., example=412)
+    memory_max_size: int = Field(..., example=5000)
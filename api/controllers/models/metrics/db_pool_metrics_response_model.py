@@ -0,0 +1,14 @@
+from pydantic import BaseModel, Field
+
+
+class DbPoolMetricsResponseModel(BaseModel):
+    pool_size: int = Field(..., example=5)
+    max_overflow: int = Field(..., example=10)
+    checked_out: int = Field(..., example=3)
+    idle: int = Field(..., example=2)
+    overflow: int = Field(..., example=0)
+    checkouts: int = Field(..., example=1520)
+    timeouts: int = Field(..., example=0)
+    total_wait_ms: float = Field(..., example=842.113)
+    average_wait_ms: float = Field(..., example=0.554)
+    max_wait_ms: float = Field(..., example=31.207)
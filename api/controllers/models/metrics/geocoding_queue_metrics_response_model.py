@@ -0,0 +1,11 @@
+from pydantic import BaseModel, Field
+
+
+class GeocodingQueueMetricsResponseModel(BaseModel):
+    running: bool = Field(..., example=True)
+    depth: int = Field(..., example=4)
+    lag_seconds: float = Field(..., example=3.512)
+    last_lag_seconds: float = Field(..., example=1.204)
+    processed: int = Field(..., example=318)
+    failed: int = Field(..., example=2)
+    retried: int = Field(..., example=7)
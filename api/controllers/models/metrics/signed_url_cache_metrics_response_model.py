@@ -0,0 +1,12 @@
+from pydantic import BaseModel, Field
+
+
+class SignedUrlCacheMetricsResponseModel(BaseModel):
+    size: int = Field(..., example=1840)
+    max_size: int = Field(..., example=20000)
+    hits: int = Field(..., example=15230)
+    misses: int = Field(..., example=1902)
+    hit_ratio: float = Field(..., example=0.889)
+    evictions: int = Field(..., example=0)
+    expirations: int = Field(..., example=62)
+    shared_hits: int = Field(..., example=340)
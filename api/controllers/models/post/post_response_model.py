@@ -3,15 +3,15 @@ from typing import Optional
 from pydantic import Field
 from api.controllers.models.base_response_model import BaseResponseModel
 from api.controllers.models.product.product_response_model import ProductResponseModel
-from api.controllers.models.store.store_response_model import StoreResponseModel
-from api.controllers.models.user.user_response_model import UserResponseModel
+from api.controllers.models.store.store_summary_response_model import StoreSummaryResponseModel
+from api.controllers.models.user.user_summary_response_model import UserSummaryResponseModel
 from api.enums.demand_status import DemandStatus
 
 
 class PostResponseModel(BaseResponseModel):
-    store: StoreResponseModel = Field(..., example={})
+    store: StoreSummaryResponseModel = Field(..., example={})
     product: ProductResponseModel = Field(..., example={})
-    responsible: UserResponseModel = Field(..., example={})
+    responsible: UserSummaryResponseModel = Field(..., example={})
     needed_count: int = Field(..., example=50)
     description: str = Field(..., example='Arroz orgânico da instância Canela Preta')
     deadline: Optional[datetime] = Field(..., example='2025-10-01T12:00:00')
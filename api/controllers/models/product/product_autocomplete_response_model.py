@@ -0,0 +1,8 @@
+from uuid import UUID
+from pydantic import BaseModel, Field
+
+
+class ProductAutocompleteResponseModel(BaseModel):
+    uuid: UUID = Field(..., example='3fa85f64-5717-4562-b3fc-2c963f66afa6')
+    name: str = Field(..., example='Arroz Orgânico')
+    search_name: str = Field(..., example='Arroz Orgânico (kg)')
@@ -0,0 +1,18 @@
+from typing import List, Optional
+from pydantic import Field
+from api.controllers.models.base_response_model import BaseResponseModel
+from api.controllers.models.user.user_summary_response_model import UserSummaryResponseModel
+from api.enums.store_type import StoreType
+
+
+class StoreSummaryResponseModel(BaseResponseModel):
+    trade_name: str = Field(..., example='Loja Orgânica')
+    images: List[str] = Field(..., example=['https://example.com/image1.png'])
+    reputation: float = Field(..., ge=0, le=5, example=4.7)
+    store_type: StoreType = Field(..., example=StoreType.SUPPLIER.value)
+    preferred_phone_contact: str = Field(..., example='(11) 98765-4321')
+    preferred_email_contact: str = Field(..., example='contato@loja.com.br')
+    city: str = Field(..., example='Blumenau')
+    neighbourhood: str = Field(..., example='Centro')
+    province: str = Field(..., example='SC')
+    owner: Optional[UserSummaryResponseModel] = None
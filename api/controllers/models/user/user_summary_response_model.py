@@ -0,0 +1,7 @@
+from pydantic import Field
+from api.controllers.models.base_response_model import BaseResponseModel
+
+
+class UserSummaryResponseModel(BaseResponseModel):
+    name: str = Field(..., example='Gabriel Voltolini')
+    profile_picture: str = Field(..., example='https://example.com/profile.jpg')
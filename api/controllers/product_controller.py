@@ -1,7 +1,8 @@
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 from fastapi.responses import JSONResponse
 from api.controllers.auth_wrapper import AuthWrapper
+from api.controllers.models.product.product_autocomplete_response_model import ProductAutocompleteResponseModel
 from api.controllers.models.product.product_request_model import ProductRequestModel
 from api.controllers.models.product.product_response_model import ProductResponseModel
 from api.controllers.models.user.user_response_model import UserResponseModel
@@ -32,6 +33,14 @@ class ProductController(BaseController[ProductRequestModel, ProductResponseModel
             status_code=200,
             summary='Fetch products by name or type'
         )
+        self.router.add_api_route(
+            path='/autocomplete',
+            endpoint=self._autocomplete_handler(),
+            methods=['GET'],
+            response_model=List[ProductAutocompleteResponseModel],
+            status_code=200,
+            summary='Complete product names by prefix'
+        )
         self.router.add_api_route(
             path='/product-picture',
             endpoint=self._upload_picture_handler(),
@@ -52,19 +61,30 @@ class ProductController(BaseController[ProductRequestModel, ProductResponseModel
     def _search_handler(self):
         async def search(
             name: str = Query('*'), type: ProductType = Query(ProductType.ANY),
-            page: int = Query(1), per_page: int = Query(10),
+            page: int = Query(1), per_page: int = Query(10), cursor: Optional[str] = None,
             user: UserResponseModel = Depends(self.auth_wrapper.with_access([UserAccess.STORE_OWNER, UserAccess.ADMIN]))
         ) -> JSONResponse:
-            self.logger.log_info(f'Listing the stores for the user {user.uuid}, page: {page}, per page: {per_page}')
+            self.logger.log_info(f'Listing the stores for the user {user.uuid}, page: {page}, per page: {per_page}, cursor: {cursor}')
             service_response: ServiceResponse = await self.service.list_by_name_and_type(
                 name=name,
                 type=type,
                 page=page,
-                per_page=per_page
+                per_page=per_page,
+                cursor=cursor
             )
             return self.make_response(service_response)
         return search
     
+    def _autocomplete_handler(self):
+        async def autocomplete(
+            prefix: str = Query(..., max_length=256), limit: int = Query(10, ge=1, le=50),
+            user: UserResponseModel = Depends(self.auth_wrapper.with_access([UserAccess.STORE_OWNER, UserAccess.ADMIN]))
+        ) -> JSONResponse:
+            self.logger.log_debug(f'Completing the product names starting with "{prefix}" for the user {user.uuid}')
+            service_response: ServiceResponse = await self.service.autocomplete(prefix=prefix, limit=limit)
+            return self.make_response(service_response)
+        return autocomplete
+
     def _upload_picture_handler(self):
         async def upload_picture(
             file: UploadFile = File(...),
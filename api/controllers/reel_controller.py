@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 from fastapi.responses import JSONResponse
 from api.controllers.auth_wrapper import AuthWrapper
@@ -42,9 +42,10 @@ class ReelController(BaseController[None, PostResponseModel]):
                 radius_meters: int = 10000,
                 product_type: ProductType = ProductType.ANY,
                 status: DemandStatus = DemandStatus.ANY,
+                cursor: Optional[str] = None,
                 user: UserResponseModel = Depends(self.auth_wrapper.with_access([UserAccess.STORE_OWNER, UserAccess.ADMIN]))
             ) -> JSONResponse:
-                self.logger.log_info(f'Listing the demands for the store {store_uuid}, page: {page}, per page: {per_page}')
+                self.logger.log_info(f'Listing the demands for the store {store_uuid}, page: {page}, per page: {per_page}, cursor: {cursor}')
                 service_response: ServiceResponse = await self.service.get_posts(
                     user=user,
                     store_uuid=store_uuid,
@@ -52,7 +53,8 @@ class ReelController(BaseController[None, PostResponseModel]):
                     page=page,
                     per_page=per_page,
                     radius_meters=radius_meters,
-                    product_type=product_type
+                    product_type=product_type,
+                    cursor=cursor
                 )
                 return self.make_response(service_response)
             return get_posts
\ No newline at end of file
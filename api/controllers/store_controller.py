@@ -1,10 +1,11 @@
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 from fastapi import Body, Depends, Query
 from fastapi.responses import JSONResponse
 from api.controllers.auth_wrapper import AuthWrapper
 from api.controllers.models.store.store_request_model import StoreRequestModel
 from api.controllers.models.store.store_response_model import StoreResponseModel
+from api.controllers.models.store.store_summary_response_model import StoreSummaryResponseModel
 from api.controllers.models.user.user_response_model import UserResponseModel
 from api.enums.user_access import UserAccess
 from api.controllers.base_controller import BaseController
@@ -21,7 +22,8 @@ class StoreController(BaseController[StoreRequestModel, StoreResponseModel]):
             response_model=StoreResponseModel,
             prefix="/store",
             tag=__class__.__name__,
-            auth_wrapper=auth_wrapper
+            auth_wrapper=auth_wrapper,
+            list_response_model=StoreSummaryResponseModel
         )
         self.router.add_api_route(
             path='/list-by-user',
@@ -55,14 +57,15 @@ class StoreController(BaseController[StoreRequestModel, StoreResponseModel]):
 
     def _list_by_user_handler(self):
             async def list_by_user(
-                page: int = Query(...), per_page: int = Query(10),
+                page: int = Query(1), per_page: int = Query(10), cursor: Optional[str] = None,
                 user: UserResponseModel = Depends(self.auth_wrapper.with_access([UserAccess.STORE_OWNER, UserAccess.ADMIN]))
             ) -> JSONResponse:
-                self.logger.log_info(f'Listing the stores for the user {user.uuid}, page: {page}, per page: {per_page}')
+                self.logger.log_info(f'Listing the stores for the user {user.uuid}, page: {page}, per page: {per_page}, cursor: {cursor}')
                 service_response: ServiceResponse = await self.service.list_by_user(
                     user_uuid=user.uuid,
                     page=page,
-                    per_page=per_page
+                    per_page=per_page,
+                    cursor=cursor
                 )
                 return self.make_response(service_response)
             return list_by_user
@@ -84,6 +87,17 @@ class StoreController(BaseController[StoreRequestModel, StoreResponseModel]):
             service_response: ServiceResponse = await self.service.update(obj_id=uuid, request=model, user=user)
             return self.make_response(service_response)
         return update
+
+    def _patch_handler(self):
+        patch_model = StoreRequestModel.partial()
+        async def patch(
+                uuid: UUID,
+                model: patch_model = Body(...),
+                user: UserResponseModel = Depends(self.auth_wrapper.with_access([UserAccess.STORE_OWNER, UserAccess.ADMIN]))) -> JSONResponse:
+            self.logger.log_info(f"Patching the fields {sorted(model.model_fields_set)} of the store {uuid}")
+            service_response: ServiceResponse = await self.service.patch(obj_id=uuid, request=model, user=user)
+            return self.make_response(service_response)
+        return patch
     
     def _delete_handler(self):
         async def delete(
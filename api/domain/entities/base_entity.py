@@ -1,17 +1,30 @@
 from abc import abstractmethod
 from datetime import datetime, timezone
 import enum
-from typing import Any
+from typing import Any, Dict, List, Set, Tuple
 from uuid import uuid4, UUID
 
+_UNSET = object()
+
 
 class BaseEntity:
+    '''Base of the domain entities.
+
+    Assignments to public fields (and to active/updated_at) are recorded as dirty so the
+    repository only writes the columns that changed. List fields changed through
+    `append_to`/`remove_from` record the element changes instead of the whole list.
+    '''
+
+    _TRACKED_PRIVATE_FIELDS = {'_active': 'active', '_updated_at': 'updated_at'}
 
     def __init__(self, **kwargs):
+        self.__dict__['_dirty_fields'] = set()
+        self.__dict__['_array_changes'] = {}
         self._uuid: UUID = self._enforce_uuid(kwargs.pop('uuid', uuid4()))
         self._active: bool = kwargs.pop('active', True)
         self._created_at: datetime = self._enforce_datetime(kwargs.pop('created_at', datetime.now(timezone.utc)))
         self._updated_at: datetime = self._enforce_datetime(kwargs.pop('updated_at', datetime.now(timezone.utc)))
+        self._version: int = kwargs.pop('version', 1)
 
     @property
     def uuid(self) -> UUID:
@@ -29,6 +42,45 @@ class BaseEntity:
     def updated_at(self) -> datetime:
         return self._updated_at
 
+    @property
+    def version(self) -> int:
+        return self._version
+
+    @property
+    def dirty_fields(self) -> Set[str]:
+        '''The fields assigned with a new value since the entity was loaded or last saved.'''
+        return set(self._dirty_fields)
+
+    @property
+    def array_changes(self) -> Dict[str, List[Tuple[str, Any]]]:
+        '''The ('append' | 'remove', element) changes made to each list field, in order.'''
+        return {field: list(changes) for field, changes in self._array_changes.items()}
+
+    def __setattr__(self, key: str, value: Any) -> None:
+        field = self._TRACKED_PRIVATE_FIELDS.get(key, key)
+        changed = not field.startswith('_') and self.__dict__.get(key, _UNSET) != value
+        super().__setattr__(key, value)
+        if changed and '_dirty_fields' in self.__dict__:
+            self._dirty_fields.add(field)
+            self._array_changes.pop(field, None)
+
+    def mark_clean(self) -> None:
+        '''Forget the recorded changes, once the entity matches what is stored.'''
+        self.__dict__['_dirty_fields'] = set()
+        self.__dict__['_array_changes'] = {}
+
+    def append_to(self, field: str, element: Any) -> None:
+        getattr(self, field).append(element)
+        self._record_array_change(field, 'append', element)
+
+    def remove_from(self, field: str, element: Any) -> None:
+        '''Remove every occurrence of `element`, like array_remove does in the database.'''
+        values: list = getattr(self, field)
+        if element not in values:
+            return
+        values[:] = [value for value in values if value != element]
+        self._record_array_change(field, 'remove', element)
+
     @abstractmethod
     def validate(self) -> None:
         return None
@@ -46,7 +98,7 @@ class BaseEntity:
 
     def update(self, **kwargs) -> None:
         for key, value in kwargs.items():
-            if key in ['uuid', 'created_at', 'updated_at', 'active']:
+            if key in ['uuid', 'created_at', 'updated_at', 'active', 'version']:
                 continue
             setattr(self, key, value)
         self.update_timestamp()
@@ -56,6 +108,7 @@ class BaseEntity:
             'uuid': str(self._uuid),
             'created_at': self.created_at.isoformat(),
             'updated_at': self.updated_at.isoformat(),
+            'version': self.version,
         }
         properties: dict = self.__dict__.items()
         for key, value in properties:
@@ -75,11 +128,16 @@ class BaseEntity:
                 result[key] = value
         return result
     
-    def set_base_properties(self, uuid: UUID, active: bool, created_at: datetime, updated_at: datetime) -> None:
+    def set_base_properties(self, uuid: UUID, active: bool, created_at: datetime, updated_at: datetime, version: int = 1) -> None:
         self._uuid = self._enforce_uuid(uuid)
         self._active = active
         self._created_at = self._enforce_datetime(created_at)
         self._updated_at = self._enforce_datetime(updated_at)
+        self._version = version
+
+    def _record_array_change(self, field: str, operation: str, element: Any) -> None:
+        if field not in self._dirty_fields:
+            self._array_changes.setdefault(field, []).append((operation, element))
 
     def _enforce_datetime(self, value: Any) -> datetime:
         if isinstance(value, str):
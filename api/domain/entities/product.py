@@ -35,13 +35,10 @@ class Product(BaseEntity):
         validator.check()
 
     def add_image(self, blob_name: str) -> None:
-        self.images.append(blob_name)
+        self.append_to('images', blob_name)
 
     def delete_image(self, blob_name) -> None:
-        try:
-            self.images.remove(blob_name)
-        except ValueError:
-            pass
+        self.remove_from('images', blob_name)
      
     def get_image(self, index: int) -> str | None:
         image: str | None = None
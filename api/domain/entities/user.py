@@ -33,6 +33,9 @@ class User(BaseEntity):
 
     def hash_password(self) -> None:
         self.password: str = PasswordHasher.hash(self.password)
+
+    async def hash_password_async(self) -> None:
+        self.password: str = await PasswordHasher.hash_async(self.password)
     
     def validate(self):
         validator = Validator()
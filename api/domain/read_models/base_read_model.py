@@ -0,0 +1,35 @@
+from datetime import datetime
+import enum
+from typing import Any, Optional
+from uuid import UUID
+from api.domain.entities.base_entity import BaseEntity
+
+
+class BaseReadModel:
+    '''Base of the read models: lean, read-only projections built straight from the selected columns.
+
+    The list views use them instead of the entities, so a row only carries what is shown.
+    '''
+
+    def __init__(self, uuid: UUID,
+                 created_at: Optional[datetime] = None,
+                 updated_at: Optional[datetime] = None,
+                 version: Optional[int] = None) -> None:
+        self.uuid: UUID = uuid
+        self.created_at: Optional[datetime] = created_at
+        self.updated_at: Optional[datetime] = updated_at
+        self.version: Optional[int] = version
+
+    def to_dict(self) -> dict:
+        return {key: self._to_value(value) for key, value in self.__dict__.items() if value is not None}
+
+    def _to_value(self, value: Any) -> Any:
+        if isinstance(value, UUID):
+            return str(value)
+        if isinstance(value, enum.Enum):
+            return value.value
+        if isinstance(value, datetime):
+            return value.isoformat()
+        if isinstance(value, (BaseEntity, BaseReadModel)):
+            return value.to_dict()
+        return value
@@ -0,0 +1,29 @@
+from datetime import datetime
+from api.domain.entities.product import Product
+from api.domain.read_models.base_read_model import BaseReadModel
+from api.domain.read_models.store_summary import StoreSummary
+from api.domain.read_models.user_summary import UserSummary
+from api.enums.demand_status import DemandStatus
+
+
+class DemandSummary(BaseReadModel):
+    '''A demand as shown in the reel. The product is the whole entity, it is small and its images get signed.'''
+
+    def __init__(self, store: StoreSummary,
+                 product: Product,
+                 responsible: UserSummary,
+                 needed_count: int,
+                 description: str,
+                 deadline: datetime,
+                 status: DemandStatus,
+                 minimum_count: int,
+                 **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.store: StoreSummary = store
+        self.product: Product = product
+        self.responsible: UserSummary = responsible
+        self.needed_count: int = needed_count
+        self.description: str = description
+        self.deadline: datetime = deadline
+        self.status: DemandStatus = status
+        self.minimum_count: int = minimum_count
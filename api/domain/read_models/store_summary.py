@@ -0,0 +1,31 @@
+from typing import List, Optional
+from api.domain.read_models.base_read_model import BaseReadModel
+from api.domain.read_models.user_summary import UserSummary
+from api.enums.store_type import StoreType
+
+
+class StoreSummary(BaseReadModel):
+    '''A store as listed: its public face and where it is, without the legal registration data.'''
+
+    def __init__(self, trade_name: str,
+                 images: List[str],
+                 reputation: float,
+                 store_type: StoreType,
+                 preferred_phone_contact: str,
+                 preferred_email_contact: str,
+                 city: str,
+                 neighbourhood: str,
+                 province: str,
+                 owner: Optional[UserSummary] = None,
+                 **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.trade_name: str = trade_name
+        self.images: List[str] = images
+        self.reputation: float = reputation
+        self.store_type: StoreType = store_type
+        self.preferred_phone_contact: str = preferred_phone_contact
+        self.preferred_email_contact: str = preferred_email_contact
+        self.city: str = city
+        self.neighbourhood: str = neighbourhood
+        self.province: str = province
+        self.owner: Optional[UserSummary] = owner
@@ -0,0 +1,11 @@
+from uuid import UUID
+from api.domain.read_models.base_read_model import BaseReadModel
+
+
+class UserSummary(BaseReadModel):
+    '''A user as shown next to the stores it owns and the demands it is responsible for.'''
+
+    def __init__(self, uuid: UUID, name: str, profile_picture: str) -> None:
+        super().__init__(uuid)
+        self.name: str = name
+        self.profile_picture: str = profile_picture
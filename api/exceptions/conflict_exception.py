@@ -0,0 +1,7 @@
+from api.exceptions.custom_exception import CustomException
+from http import HTTPStatus
+
+
+class ConflictException(CustomException):
+    def __init__(self, message) -> None:
+        super().__init__(message, HTTPStatus.CONFLICT)
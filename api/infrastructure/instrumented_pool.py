@@ -0,0 +1,67 @@
+from threading import Lock
+from time import perf_counter
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy.pool.base import PoolProxiedConnection
+
+
+class PoolWaitStats:
+    '''Accumulates how long callers waited to check a connection out of the pool.'''
+
+    def __init__(self):
+        self._lock = Lock()
+        self.checkouts: int = 0
+        self.timeouts: int = 0
+        self.total_wait_seconds: float = 0.0
+        self.max_wait_seconds: float = 0.0
+
+    def record(self, wait_seconds: float, timed_out: bool = False) -> None:
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.total_wait_seconds += wait_seconds
+            self.max_wait_seconds = max(self.max_wait_seconds, wait_seconds)
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            attempts = self.checkouts + self.timeouts
+            average = self.total_wait_seconds / attempts if attempts else 0.0
+            return {
+                'checkouts': self.checkouts,
+                'timeouts': self.timeouts,
+                'total_wait_ms': round(self.total_wait_seconds * 1000, 3),
+                'average_wait_ms': round(average * 1000, 3),
+                'max_wait_ms': round(self.max_wait_seconds * 1000, 3),
+            }
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    '''AsyncAdaptedQueuePool that keeps checkout wait statistics for the metrics endpoint.'''
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wait_stats = PoolWaitStats()
+
+    def connect(self) -> PoolProxiedConnection:
+        started = perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self.wait_stats.record(perf_counter() - started, timed_out=True)
+            raise
+        self.wait_stats.record(perf_counter() - started)
+        return connection
+
+    def metrics(self) -> dict:
+        '''Snapshot of the pool occupancy plus the accumulated wait statistics.'''
+        pool_size = self.size()
+        return {
+            'pool_size': pool_size,
+            'max_overflow': self._max_overflow,
+            'checked_out': self.checkedout(),
+            'idle': self.checkedin(),
+            'overflow': max(self.overflow(), 0),
+            **self.wait_stats.to_dict(),
+        }
@@ -1,10 +1,14 @@
-from sqlalchemy import Column, String, Float
+from sqlalchemy import Column, Index, String, Float
 from api.infrastructure.models.base_model import BaseModel
 from api.domain.entities.address import Address
 
 
 class AddressModel(BaseModel):
     __tablename__ = 'address'
+    __table_args__ = (
+        Index('ix_address_latitude_longitude', 'latitude', 'longitude'),
+    )
+    SUMMARY_COLUMNS = ('city', 'neighbourhood', 'province')
 
     zip_code = Column(String(32), nullable=False)
     street_address = Column(String(256), nullable=False)
@@ -1,5 +1,6 @@
 from abc import abstractmethod
-from sqlalchemy import Column, Boolean, DateTime
+from typing import Any, Dict, List, Tuple
+from sqlalchemy import Column, Boolean, DateTime, Integer
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import declarative_base
 from uuid import uuid4
@@ -13,10 +14,16 @@ Base = declarative_base()
 class BaseModel(Base):
     __abstract__ = True
 
+    # Entity fields stored under another column name, used to write only the changed columns
+    ENTITY_FIELD_COLUMNS: Dict[str, str] = {}
+    # Columns selected to build the read model of the list views, instead of the whole row
+    SUMMARY_COLUMNS: Tuple[str, ...] = ()
+
     uuid = Column(UUID(as_uuid=True), primary_key=True, default=uuid4, nullable=False)
     active = Column(Boolean, default=True, nullable=False)
     created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(pytz.utc), nullable=False)
     updated_at = Column(DateTime(timezone=True), default=lambda: datetime.now(pytz.utc), onupdate=lambda: datetime.now(pytz.utc), nullable=False)
+    version = Column(Integer, default=1, server_default='1', nullable=False)
 
     def from_entity(self, entity: BaseEntity) -> None:
         '''Handle common fields for all models derived from BaseModel.'''
@@ -24,12 +31,24 @@ class BaseModel(Base):
         self.active = entity.active
         self.created_at = entity.created_at
         self.updated_at = entity.updated_at
+        self.version = entity.version
         self._from_entity(entity)
 
+    @classmethod
+    def summary_columns(cls, prefix: str = '') -> List[Any]:
+        '''The SUMMARY_COLUMNS labelled with `prefix`, so they can be selected next to the columns of other tables.'''
+        return [getattr(cls, column).label(f'{prefix}{column}') for column in cls.SUMMARY_COLUMNS]
+
+    @classmethod
+    def summary_values(cls, row: Any, prefix: str = '') -> Dict[str, Any]:
+        '''Read back the columns selected with `summary_columns(prefix)` from a result row.'''
+        return {column: getattr(row, f'{prefix}{column}') for column in cls.SUMMARY_COLUMNS}
+
     def to_entity(self) -> BaseEntity:
         '''Handle common fields and delegate specific fields to child class.'''
         entity = self._to_entity()
-        entity.set_base_properties(self.uuid, self.active, self.created_at, self.updated_at)
+        entity.set_base_properties(self.uuid, self.active, self.created_at, self.updated_at, self.version)
+        entity.mark_clean()
         return entity
 
     @abstractmethod
@@ -0,0 +1,18 @@
+from datetime import datetime
+import pytz
+from sqlalchemy import Column, DateTime, Index, String
+from sqlalchemy.dialects.postgresql import JSONB
+from api.infrastructure.models.base_model import Base
+
+
+class CepCacheModel(Base):
+    '''Raw ViaCEP answers by CEP, including the `{"erro": true}` answers for unknown CEPs.'''
+    __tablename__ = 'cep_cache'
+    __table_args__ = (
+        Index('ix_cep_cache_expires_at', 'expires_at'),
+    )
+
+    cep = Column(String(8), primary_key=True)
+    data = Column(JSONB, nullable=False)
+    expires_at = Column(DateTime(timezone=True), nullable=False)
+    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(pytz.utc), nullable=False)
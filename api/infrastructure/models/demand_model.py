@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Enum, Integer, String, DateTime, ForeignKey
+from sqlalchemy import Column, Enum, Index, Integer, String, DateTime, ForeignKey, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from api.enums.demand_status import DemandStatus
@@ -12,6 +12,15 @@ from sqlalchemy.orm import Mapped
 
 class DemandModel(BaseModel):
     __tablename__ = 'demand'
+    __table_args__ = (
+        Index('ix_demand_store_uuid_created_at_active', 'store_uuid', 'created_at', 'uuid', postgresql_where=text('active')),
+        Index('ix_demand_created_at_active', 'created_at', 'uuid', postgresql_where=text('active')),
+        Index('ix_demand_product_uuid', 'product_uuid'),
+    )
+    ENTITY_FIELD_COLUMNS = {'store': 'store_uuid', 'product': 'product_uuid', 'responsible': 'responsible_uuid'}
+    SUMMARY_COLUMNS = (
+        'uuid', 'created_at', 'updated_at', 'version', 'needed_count', 'description', 'deadline', 'status', 'minimum_count'
+    )
 
     store_uuid = Column(UUID(as_uuid=True), ForeignKey('store.uuid'), nullable=False)
     product_uuid = Column(UUID(as_uuid=True), ForeignKey('product.uuid'), nullable=False)
@@ -0,0 +1,18 @@
+from datetime import datetime
+import pytz
+from sqlalchemy import Column, DateTime, Float, Index, String
+from api.infrastructure.models.base_model import Base
+
+
+class GeocodeCacheModel(Base):
+    '''Nominatim coordinates by normalized query (see OpenStreetMapsClient.cache_key).'''
+    __tablename__ = 'geocode_cache'
+    __table_args__ = (
+        Index('ix_geocode_cache_expires_at', 'expires_at'),
+    )
+
+    query = Column(String(512), primary_key=True)
+    latitude = Column(Float, nullable=False)
+    longitude = Column(Float, nullable=False)
+    expires_at = Column(DateTime(timezone=True), nullable=False)
+    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(pytz.utc), nullable=False)
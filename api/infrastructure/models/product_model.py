@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Enum, String
+from sqlalchemy import Column, Computed, Enum, Index, String, text
 from sqlalchemy.dialects.postgresql import ARRAY
 from api.infrastructure.models.base_model import BaseModel
 from api.domain.entities.product import Product
@@ -8,12 +8,17 @@ from api.enums.product_type import ProductType
 
 class ProductModel(BaseModel):
     __tablename__ = 'product'
+    __table_args__ = (
+        Index('ix_product_search_key_trgm', 'search_key', postgresql_using='gin', postgresql_ops={'search_key': 'gin_trgm_ops'}),
+        Index('ix_product_created_at_active', 'created_at', 'uuid', postgresql_where=text('active')),
+    )
 
     name = Column(String(256), nullable=False)
     unit_type = Column(Enum(UnitType), nullable=False)
     type = Column(Enum(ProductType), nullable=False)
     images = Column(ARRAY(String), nullable=False, default=[])
     search_name = Column(String, nullable=False, default='')
+    search_key = Column(String, Computed('lower(immutable_unaccent(search_name))', persisted=True), nullable=False)
 
     def _from_entity(self, entity: Product) -> None:
         '''Convert a Product entity to the ProductModel.'''
@@ -0,0 +1,23 @@
+from datetime import datetime
+import pytz
+from sqlalchemy import Column, DateTime, Index, String
+from api.infrastructure.models.base_model import Base
+
+
+class SignedUrlCacheModel(Base):
+    '''Signed image URLs shared by every API worker, keyed by bucket and blob name.
+
+    The table is UNLOGGED: it is rebuilt by signing again, so it does not need to survive a crash
+    and skipping the WAL keeps the writes cheap.
+    '''
+    __tablename__ = 'signed_url_cache'
+    __table_args__ = (
+        Index('ix_signed_url_cache_expires_at', 'expires_at'),
+        {'prefixes': ['UNLOGGED']},
+    )
+
+    bucket_name = Column(String(128), primary_key=True)
+    blob_name = Column(String(512), primary_key=True)
+    signed_url = Column(String(4096), nullable=False)
+    expires_at = Column(DateTime(timezone=True), nullable=False)
+    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(pytz.utc), nullable=False)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Date, Enum, String, Float, ForeignKey
+from sqlalchemy import Column, Date, Enum, Index, String, Float, ForeignKey, text
 from sqlalchemy.dialects.postgresql import ARRAY, UUID
 from sqlalchemy.orm import relationship
 from api.enums.store_type import StoreType
@@ -11,6 +11,17 @@ from sqlalchemy.orm import Mapped
 
 class StoreModel(BaseModel):
     __tablename__ = 'store'
+    __table_args__ = (
+        Index('ix_store_owner_uuid_created_at_active', 'owner_uuid', 'created_at', 'uuid', postgresql_where=text('active')),
+        Index('ix_store_cnpj_active', 'cnpj', postgresql_where=text('active')),
+        Index('ix_store_address_uuid', 'address_uuid'),
+        Index('ix_store_created_at_active', 'created_at', 'uuid', postgresql_where=text('active')),
+    )
+    ENTITY_FIELD_COLUMNS = {'address': 'address_uuid', 'owner': 'owner_uuid'}
+    SUMMARY_COLUMNS = (
+        'uuid', 'created_at', 'updated_at', 'version', 'trade_name', 'images', 'reputation', 'store_type',
+        'preferred_phone_contact', 'preferred_email_contact'
+    )
 
     images = Column(ARRAY(String), nullable=False, default=[])
     cnpj = Column(String(18), nullable=False, unique=False)
@@ -8,6 +8,7 @@ from api.enums.gender_type import GenderType
 
 class UserModel(BaseModel):
     __tablename__ = 'user'
+    SUMMARY_COLUMNS = ('uuid', 'name', 'profile_picture')
 
     name = Column(String(256), nullable=False)
     email = Column(String(256), nullable=False, unique=True)
@@ -1,12 +1,16 @@
-from typing import TypeVar, Generic, List
+from typing import Optional, TypeVar, Generic, List
 from uuid import UUID
+from sqlalchemy import Select, func, insert, inspect, literal, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from api.domain.entities.base_entity import BaseEntity
+from api.exceptions.conflict_exception import ConflictException
 from api.exceptions.not_found_exception import NotFoundException
 from api.infrastructure.models.base_model import BaseModel
 from api.infrastructure.repositories.i_repository import IRepository
 from api.infrastructure.repositories.repository_exception_catcher import RepositoryExceptionCatcher
+from api.infrastructure.request_identity_map import RequestIdentityMap
+from api.shared.keyset_cursor import KeysetCursor
 from api.shared.logger import Logger
 
 T = TypeVar('T', bound=BaseEntity)
@@ -15,6 +19,7 @@ M = TypeVar('M', bound=BaseModel)
 class BaseRepository(IRepository[T], Generic[T, M]):
 
     catcher = RepositoryExceptionCatcher(f'{str(M)}Repository')
+    NOT_FOUND_MESSAGE = 'Nenhum registro com o id {} foi encontrado'
 
     def __init__(self, session: AsyncSession, model_class: type[M]):
         self.session = session
@@ -29,35 +34,175 @@ class BaseRepository(IRepository[T], Generic[T, M]):
             model.from_entity(obj)
             self.session.add(model)
             await self.session.commit()
+            self._forget_loaded()
+            obj.mark_clean()
+
+    @catcher
+    async def create_many(self, objs: List[T]) -> None:
+        '''Insert every entity with one multi-row INSERT, committed as a single transaction.'''
+        if not objs:
+            return
+        self.logger.log_debug(f'Creating {len(objs)} records')
+        rows = []
+        for obj in objs:
+            model = self.model_class()
+            model.from_entity(obj)
+            rows.append(self._insert_values(model))
+        await self.session.execute(insert(self.model_class).values(rows))
+        await self.session.commit()
+        self._forget_loaded()
+        for obj in objs:
+            obj.mark_clean()
 
     @catcher
     async def get(self, obj_id: UUID) -> T:
+        '''Load one active record; inside a request scope the read is batched and memoized by the identity map.'''
         self.logger.log_debug(f'Retrieving record: {obj_id}')
-        result = await self.session.execute(
-            select(self.model_class).filter_by(uuid=obj_id, active=True)
-        )
-        model = result.scalars().one_or_none()
-        if model is None:
+        identity_map = RequestIdentityMap.current()
+        if identity_map is None:
+            result = await self.session.execute(self._select_active().filter_by(uuid=obj_id))
+            model = result.scalars().one_or_none()
+            entity = model.to_entity() if model else None
+        else:
+            entity = await identity_map.loader(self, self._fetch_many).load(obj_id)
+        if entity is None:
             self.logger.log_warning(f'No active record found for UUID: {obj_id}')
-            raise NotFoundException(f'Nenhum registro com o id {obj_id} foi encontrado')
-        return model.to_entity()
+            raise NotFoundException(self.NOT_FOUND_MESSAGE.format(obj_id))
+        return entity
 
     @catcher
-    async def list(self, page: int = 1, per_page: int = 10) -> List[T]:
-        self.logger.log_debug(f'Listing records (page {page}, per_page {per_page})')
-        if page < 1:
-            page = 1
-        query = select(self.model_class).filter_by(active=True).offset((page - 1) * per_page).limit(per_page)
+    async def get_many(self, obj_ids: List[UUID]) -> List[T]:
+        obj_ids = list(dict.fromkeys(obj_ids))
+        if not obj_ids:
+            return []
+        identity_map = RequestIdentityMap.current()
+        if identity_map is None:
+            return await self._fetch_many(obj_ids)
+        loaded = await identity_map.loader(self, self._fetch_many).load_many(obj_ids)
+        return list(loaded.values())
+
+    @catcher
+    async def list(self, page: int = 1, per_page: int = 10, cursor: Optional[str] = None) -> List[T]:
+        self.logger.log_debug(f'Listing records (page {page}, per_page {per_page}, cursor {cursor})')
+        query = self._paginate(select(self.model_class).filter_by(active=True), page, per_page, cursor)
         result = await self.session.execute(query)
         models = result.scalars().all()
         return [model.to_entity() for model in models]
 
     @catcher
     async def update(self, obj: T) -> None:
-        self.logger.log_debug(f'Updating the record: {obj.uuid}')
-        await self.get(obj.uuid)
+        '''Write the changed fields of the entity with a single UPDATE ... RETURNING guarded by its version.
+
+        Only the columns behind the entity's dirty fields are set, and list fields changed element
+        by element become array_append/array_remove calls. The row is only written while it is
+        still active and nobody else changed it since; the new version and timestamp are copied
+        back to the entity. Otherwise a NotFoundException or a ConflictException is raised.
+        '''
         model = self.model_class()
         model.from_entity(obj)
-        await self.session.merge(model)
+        values = self._changed_values(model, obj)
+        if not values:
+            self.logger.log_debug(f'The record {obj.uuid} has no changes to write')
+            return
+        self.logger.log_debug(f'Updating the columns {sorted(values)} of the record {obj.uuid} (version {obj.version})')
+        statement = (
+            update(self.model_class)
+            .where(
+                self.model_class.uuid == obj.uuid,
+                self.model_class.version == obj.version,
+                self.model_class.active.is_(True)
+            )
+            .values(**values, version=self.model_class.version + 1)
+            .returning(self.model_class.updated_at, self.model_class.version)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.session.execute(statement)
+        row = result.one_or_none()
+        if row is None:
+            await self._raise_update_rejected(obj)
         await self.session.commit()
-        self.logger.log_debug(f'The record {obj.uuid} was updated successfully')
\ No newline at end of file
+        self._forget_loaded()
+        obj.set_base_properties(obj.uuid, obj.active, obj.created_at, row.updated_at, row.version)
+        obj.mark_clean()
+        self.logger.log_debug(f'The record {obj.uuid} was updated successfully (version {row.version})')
+
+    async def _fetch_many(self, obj_ids: List[UUID]) -> List[T]:
+        '''Load the active records among `obj_ids` with one `WHERE uuid IN (...)` query.'''
+        self.logger.log_debug(f'Retrieving {len(obj_ids)} records')
+        result = await self.session.execute(self._select_active().filter(self.model_class.uuid.in_(obj_ids)))
+        return [model.to_entity() for model in result.scalars().unique().all()]
+
+    def _select_active(self) -> Select:
+        return select(self.model_class).filter_by(active=True).options(*self._load_options())
+
+    def _load_options(self) -> list:
+        '''Loader options for the relationships the entity needs, used by get and get_many.'''
+        return []
+
+    def _forget_loaded(self) -> None:
+        '''Drop the entities memoized for the current request, since a write may have made them stale.'''
+        identity_map = RequestIdentityMap.current()
+        if identity_map is not None:
+            identity_map.clear()
+
+    def _insert_values(self, model: M) -> dict:
+        return {
+            attribute.key: getattr(model, attribute.key)
+            for attribute in inspect(self.model_class).column_attrs
+            if attribute.columns[0].computed is None and attribute.key in inspect(model).dict
+        }
+
+    def _changed_values(self, model: M, obj: T) -> dict:
+        '''Map the dirty entity fields to their column values, and the element changes to array function calls.
+
+        A dirty field with no column of its own (e.g. `store_uuid` set on an entity that keeps a
+        `store`) raises a ValueError, since the model would write the unchanged value instead.
+        '''
+        column_attributes = inspect(self.model_class).column_attrs
+        writable_columns = {
+            attribute.key for attribute in column_attributes
+            if attribute.key not in ('uuid', 'created_at', 'version') and attribute.columns[0].computed is None
+        }
+        columns = self.model_class.ENTITY_FIELD_COLUMNS
+        entity_columns = set(columns.values())
+        values = {}
+        for field in obj.dirty_fields:
+            if field not in columns and (field in entity_columns or field not in column_attributes):
+                raise ValueError(f'The field {field} of {type(obj).__name__} is not mapped to a column of {self.model_class.__tablename__}')
+            column = columns.get(field, field)
+            if column in writable_columns:
+                values[column] = getattr(model, column)
+        for field, changes in obj.array_changes.items():
+            column = columns.get(field, field)
+            if column not in writable_columns:
+                continue
+            attribute = getattr(self.model_class, column)
+            expression = attribute
+            for operation, element in changes:
+                array_function = func.array_append if operation == 'append' else func.array_remove
+                expression = array_function(expression, literal(element, attribute.type.item_type), type_=attribute.type)
+            values[column] = expression
+        return values
+
+    async def _raise_update_rejected(self, obj: T) -> None:
+        result = await self.session.execute(
+            select(self.model_class.version).filter_by(uuid=obj.uuid, active=True)
+        )
+        current_version = result.scalars().one_or_none()
+        if current_version is None:
+            self.logger.log_warning(f'No active record found for UUID: {obj.uuid}')
+            raise NotFoundException(f'Nenhum registro com o id {obj.uuid} foi encontrado')
+        self.logger.log_warning(f'The record {obj.uuid} is at version {current_version}, not {obj.version}')
+        raise ConflictException(f'O registro {obj.uuid} foi alterado por outra requisição, carregue-o novamente e tente outra vez')
+
+    def _paginate(self, query: Select, page: int, per_page: int, cursor: Optional[str] = None) -> Select:
+        '''Order by (created_at, uuid), newest first, and apply either the keyset cursor or the page offset.'''
+        query = query.order_by(self.model_class.created_at.desc(), self.model_class.uuid.desc())
+        if cursor:
+            position = KeysetCursor.decode(cursor)
+            return query.filter(
+                tuple_(self.model_class.created_at, self.model_class.uuid) < tuple_(position.created_at, position.uuid)
+            ).limit(per_page)
+        if page < 1:
+            page = 1
+        return query.offset((page - 1) * per_page).limit(per_page)
@@ -0,0 +1,40 @@
+from datetime import datetime
+from typing import Optional
+import pytz
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from api.infrastructure.models.cep_cache_model import CepCacheModel
+from api.infrastructure.repositories.repository_exception_catcher import RepositoryExceptionCatcher
+from api.shared.logger import Logger
+
+
+class CepCacheRepository:
+
+    catcher = RepositoryExceptionCatcher('CepCacheRepository')
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        self.logger = Logger('CepCacheRepository')
+
+    @catcher
+    async def get(self, cep: str) -> Optional[dict]:
+        '''Return the stored ViaCEP answer for the CEP while it has not expired.'''
+        self.logger.log_debug(f'Reading the cached CEP {cep}')
+        query = select(CepCacheModel.data).where(
+            CepCacheModel.cep == cep,
+            CepCacheModel.expires_at > datetime.now(pytz.utc)
+        )
+        result = await self.session.execute(query)
+        return result.scalar_one_or_none()
+
+    @catcher
+    async def save(self, cep: str, data: dict, expires_at: datetime) -> None:
+        self.logger.log_debug(f'Caching the CEP {cep} until {expires_at}')
+        statement = insert(CepCacheModel).values(cep=cep, data=data, expires_at=expires_at)
+        statement = statement.on_conflict_do_update(
+            index_elements=[CepCacheModel.cep],
+            set_={'data': statement.excluded.data, 'expires_at': statement.excluded.expires_at}
+        )
+        await self.session.execute(statement)
+        await self.session.commit()
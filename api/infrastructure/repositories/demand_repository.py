@@ -1,7 +1,11 @@
-from typing import List
+import math
+from typing import List, Optional, Tuple
 from uuid import UUID
-from sqlalchemy import func, literal
+from sqlalchemy import func, literal, update
 from api.domain.entities.demand import Demand
+from api.domain.read_models.demand_summary import DemandSummary
+from api.domain.read_models.store_summary import StoreSummary
+from api.domain.read_models.user_summary import UserSummary
 from api.enums.demand_status import DemandStatus
 from api.enums.product_type import ProductType
 from api.enums.store_type import StoreType
@@ -11,6 +15,7 @@ from api.infrastructure.models.demand_model import DemandModel
 from api.infrastructure.repositories.repository_exception_catcher import RepositoryExceptionCatcher
 from api.infrastructure.models.product_model import ProductModel
 from api.infrastructure.models.store_model import StoreModel
+from api.infrastructure.models.user_model import UserModel
 from api.infrastructure.repositories.base_repository import BaseRepository
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
@@ -20,6 +25,9 @@ from sqlalchemy.future import select
 class DemandRepository(BaseRepository[Demand, DemandModel]):
 
     catcher = RepositoryExceptionCatcher('DemandRepository')
+    NOT_FOUND_MESSAGE = 'Nenhuma demanda com o id {} foi encontrada'
+
+    EARTH_RADIUS_METERS = 6371000
 
     def __init__(self, session: AsyncSession):
         super().__init__(session, DemandModel)
@@ -28,9 +36,13 @@ class DemandRepository(BaseRepository[Demand, DemandModel]):
     async def list_by_store(self, store_uuid: UUID, status: DemandStatus = DemandStatus.ANY,
                             page: int = 1, per_page: int = 10,
                             radius_meters: int = 10000,
-                            product_type: ProductType = ProductType.ANY) -> List[Demand]:
+                            product_type: ProductType = ProductType.ANY,
+                            cursor: Optional[str] = None) -> List[DemandSummary]:
         """
-        Retrieve a paginated list of demands based on a store UUID with optional filters.
+        Retrieve a paginated list of demand summaries based on a store UUID with optional filters.
+
+        Only the columns shown in the reel are selected (see `_summary_columns`), so the rows
+        never carry the legal data of the stores nor the users' password hashes.
 
         Args:
             store_uuid (UUID): The UUID of the store to filter demands by.
@@ -39,16 +51,15 @@ class DemandRepository(BaseRepository[Demand, DemandModel]):
             per_page (int): Number of items per page (default: 10).
             radius_meters (int): Radius in meters for supplier stores (default: 10000).
             product_type (ProductType): Filter by product type (default: ANY).
+            cursor (Optional[str]): Keyset cursor from the previous page, replaces `page` when informed.
 
         Returns:
-            List[Demand]: A list of Demand entities matching the criteria.
+            List[DemandSummary]: A list of DemandSummary read models matching the criteria.
 
         Raises:
             ValueError: If the store or its address is not found.
         """
-        self.logger.log_debug(f'Listing demands by store: {store_uuid}, status: {status.value}, page: {page}, per_page: {per_page}')
-        if page < 1:
-            page = 1
+        self.logger.log_debug(f'Listing demands by store: {store_uuid}, status: {status.value}, page: {page}, per_page: {per_page}, cursor: {cursor}')
         store_query = select(StoreModel).options(joinedload(StoreModel.address)).filter_by(uuid=store_uuid)
         store_result = await self.session.execute(store_query)
         store_model: StoreModel = store_result.scalar_one_or_none()
@@ -58,7 +69,16 @@ class DemandRepository(BaseRepository[Demand, DemandModel]):
             raise ValueError(f"Store address for UUID {store_uuid} is invalid")
 
         is_supplier = store_model.store_type == StoreType.SUPPLIER
-        
+        query = (
+            select(*self._summary_columns())
+            .select_from(DemandModel)
+            .join(StoreModel, DemandModel.store_uuid == StoreModel.uuid)
+            .join(AddressModel, StoreModel.address_uuid == AddressModel.uuid)
+            .join(ProductModel, DemandModel.product_uuid == ProductModel.uuid)
+            .join(UserModel, DemandModel.responsible_uuid == UserModel.uuid)
+            .filter(DemandModel.active == True)
+        )
+
         if is_supplier:
             supplier_lat = store_model.address.latitude
             supplier_lon = store_model.address.longitude
@@ -74,56 +94,107 @@ class DemandRepository(BaseRepository[Demand, DemandModel]):
                 func.pow(func.sin(func.radians(delta_lon) / 2), 2)
             )
             c = 2 * func.atan2(func.sqrt(a), func.sqrt(1 - a))
-            distance = literal(6371000) * c
+            distance = literal(self.EARTH_RADIUS_METERS) * c
+            min_lat, max_lat, min_lon, max_lon = self._bounding_box(supplier_lat, supplier_lon, radius_meters)
             
             query = (
-                select(DemandModel)
-                .join(StoreModel, DemandModel.store_uuid == StoreModel.uuid)
-                .join(AddressModel, StoreModel.address_uuid == AddressModel.uuid)
-                .filter(DemandModel.active == True)
-                .filter(AddressModel.latitude.isnot(None), AddressModel.longitude.isnot(None))
+                query
+                .filter(AddressModel.latitude.between(min_lat, max_lat))
+                .filter(AddressModel.longitude.between(min_lon, max_lon))
                 .filter(distance <= radius_meters)
             )
         else:
-            query = select(DemandModel).filter(
-                DemandModel.store_uuid == store_uuid,
-                DemandModel.active == True
-            )
+            query = query.filter(DemandModel.store_uuid == store_uuid)
         
         if status != DemandStatus.ANY:
             query = query.filter(DemandModel.status == status)
         if product_type != ProductType.ANY:
-            query = query.join(ProductModel, DemandModel.product_uuid == ProductModel.uuid).filter(
-                ProductModel.type == product_type
-            )
-        
-        query = query.options(
-            joinedload(DemandModel.store).joinedload(StoreModel.address),
-            joinedload(DemandModel.product),
-            joinedload(DemandModel.responsible)
-        ).offset((page - 1) * per_page).limit(per_page)
+            query = query.filter(ProductModel.type == product_type)
+        query = self._paginate(query, page, per_page, cursor)
         
         result = await self.session.execute(query)
-        models = result.scalars().all()
-        self.logger.log_debug(f"Found {len(models)} demands")
-        demands = [model.to_entity() for model in models]
-        return demands
+        rows = result.all()
+        self.logger.log_debug(f"Found {len(rows)} demands")
+        return [self._to_summary(row) for row in rows]
+
+    def _summary_columns(self) -> list:
+        '''The demand, store, address and responsible columns of DemandSummary, plus the whole (small) product row.'''
+        return [
+            *DemandModel.summary_columns(),
+            ProductModel,
+            *StoreModel.summary_columns('store_'),
+            *AddressModel.summary_columns('store_'),
+            *UserModel.summary_columns('responsible_')
+        ]
+
+    def _to_summary(self, row) -> DemandSummary:
+        return DemandSummary(
+            store=StoreSummary(**StoreModel.summary_values(row, 'store_'), **AddressModel.summary_values(row, 'store_')),
+            product=row.ProductModel.to_entity(),
+            responsible=UserSummary(**UserModel.summary_values(row, 'responsible_')),
+            **DemandModel.summary_values(row)
+        )
     
-    async def get(self, obj_id: UUID) -> Demand:
-        self.logger.log_debug(f'Retrieving the demand: {obj_id}')
-        query = (
-            select(self.model_class)
-            .filter_by(uuid=obj_id, active=True)
-            .options(
-                joinedload(DemandModel.responsible),
-                joinedload(DemandModel.product),
-                joinedload(DemandModel.store).joinedload(StoreModel.address),
-                joinedload(DemandModel.store).joinedload(StoreModel.owner)
+    def _bounding_box(self, latitude: float, longitude: float, radius_meters: int) -> Tuple[float, float, float, float]:
+        """
+        Compute the latitude/longitude box that encloses a circle of `radius_meters` around a point.
+
+        The box is a cheap, index friendly prefilter (see ix_address_latitude_longitude), the
+        haversine expression then only runs on the rows that fall inside it.
+
+        Returns:
+            Tuple[float, float, float, float]: min_lat, max_lat, min_lon, max_lon.
+        """
+        lat_delta = math.degrees(radius_meters / self.EARTH_RADIUS_METERS)
+        min_lat = max(latitude - lat_delta, -90.0)
+        max_lat = min(latitude + lat_delta, 90.0)
+        cos_lat = math.cos(math.radians(latitude))
+        if max_lat >= 90.0 or min_lat <= -90.0 or cos_lat <= 0:
+            return min_lat, max_lat, -180.0, 180.0
+        lon_delta = math.degrees(radius_meters / (self.EARTH_RADIUS_METERS * cos_lat))
+        if lon_delta >= 180.0 or longitude - lon_delta < -180.0 or longitude + lon_delta > 180.0:
+            return min_lat, max_lat, -180.0, 180.0
+        return min_lat, max_lat, longitude - lon_delta, longitude + lon_delta
+
+    @catcher
+    async def update_status_many(self, demand_uuids: List[UUID], status: DemandStatus, owner_uuid: UUID) -> List[UUID]:
+        '''Set the status of every demand in one UPDATE, only if all of them belong to stores of `owner_uuid`.
+
+        Returns the changed demands. When any of them is missing, inactive or from another
+        owner's store nothing is changed and a NotFoundException lists them.
+        '''
+        demand_uuids = list(dict.fromkeys(demand_uuids))
+        self.logger.log_debug(f'Changing the status of {len(demand_uuids)} demands to {status.value}')
+        statement = (
+            update(DemandModel)
+            .where(
+                DemandModel.uuid.in_(demand_uuids),
+                DemandModel.active.is_(True),
+                DemandModel.store_uuid == StoreModel.uuid,
+                StoreModel.owner_uuid == owner_uuid,
+                StoreModel.active.is_(True)
             )
+            .values(status=status, version=DemandModel.version + 1)
+            .returning(DemandModel.uuid)
+            .execution_options(synchronize_session=False)
         )
-        result = await self.session.execute(query)
-        model = result.scalars().one_or_none()
-        if model is None:
-            self.logger.log_warning(f'No active demand found for UUID: {obj_id}')
-            raise NotFoundException(f'Nenhuma demanda com o id {obj_id} foi encontrada')
-        return model.to_entity()
\ No newline at end of file
+        result = await self.session.execute(statement)
+        updated = list(result.scalars().all())
+        missing = set(demand_uuids) - set(updated)
+        if missing:
+            await self.session.rollback()
+            self.logger.log_warning(f'{len(missing)} demands were not found for the owner {owner_uuid}, no status was changed')
+            raise NotFoundException(
+                f'As demandas {", ".join(sorted(str(uuid) for uuid in missing))} não foram encontradas nas lojas do usuário'
+            )
+        await self.session.commit()
+        self._forget_loaded()
+        return updated
+
+    def _load_options(self) -> list:
+        return [
+            joinedload(DemandModel.responsible),
+            joinedload(DemandModel.product),
+            joinedload(DemandModel.store).joinedload(StoreModel.address),
+            joinedload(DemandModel.store).joinedload(StoreModel.owner)
+        ]
@@ -0,0 +1,51 @@
+from datetime import datetime
+from typing import Optional
+import pytz
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from api.infrastructure.models.geocode_cache_model import GeocodeCacheModel
+from api.infrastructure.repositories.repository_exception_catcher import RepositoryExceptionCatcher
+from api.shared.logger import Logger
+
+
+class GeocodeCacheRepository:
+
+    catcher = RepositoryExceptionCatcher('GeocodeCacheRepository')
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        self.logger = Logger('GeocodeCacheRepository')
+
+    @catcher
+    async def get(self, query: str) -> Optional[tuple[float, float]]:
+        '''Return the stored (latitude, longitude) for the query while it has not expired.'''
+        self.logger.log_debug(f'Reading the cached coordinates of "{query}"')
+        statement = select(GeocodeCacheModel.latitude, GeocodeCacheModel.longitude).where(
+            GeocodeCacheModel.query == query,
+            GeocodeCacheModel.expires_at > datetime.now(pytz.utc)
+        )
+        result = await self.session.execute(statement)
+        row = result.one_or_none()
+        return None if row is None else (row.latitude, row.longitude)
+
+    @catcher
+    async def save(self, query: str, coordinates: tuple[float, float], expires_at: datetime) -> None:
+        self.logger.log_debug(f'Caching the coordinates of "{query}" until {expires_at}')
+        latitude, longitude = coordinates
+        statement = insert(GeocodeCacheModel).values(
+            query=query,
+            latitude=latitude,
+            longitude=longitude,
+            expires_at=expires_at
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=[GeocodeCacheModel.query],
+            set_={
+                'latitude': statement.excluded.latitude,
+                'longitude': statement.excluded.longitude,
+                'expires_at': statement.excluded.expires_at
+            }
+        )
+        await self.session.execute(statement)
+        await self.session.commit()
@@ -1,5 +1,5 @@
 from abc import abstractmethod
-from typing import TypeVar, Generic, List
+from typing import Optional, TypeVar, Generic, List
 from uuid import UUID
 from api.domain.entities.base_entity import BaseEntity
 
@@ -30,6 +30,21 @@ class IRepository(Generic[T]):
         '''
         raise NotImplementedError("Subclasses must implement 'create'")
 
+    @abstractmethod
+    async def create_many(self, objs: List[T]) -> None:
+        '''Create many entities with a single statement, in one transaction.
+
+        Args:
+            objs: The entities to create.
+
+        Returns:
+            None
+
+        Raises:
+            NotImplementedError: If not implemented by a subclass.
+        '''
+        raise NotImplementedError("Subclasses must implement 'create_many'")
+
     @abstractmethod
     async def get(self, obj_id: UUID) -> T:
         '''Retrieve an active entity by its UUID.
@@ -47,12 +62,29 @@ class IRepository(Generic[T]):
         raise NotImplementedError("Subclasses must implement 'get'")
 
     @abstractmethod
-    async def list(self, page: int = 1, per_page: int = 10) -> List[T]:
+    async def get_many(self, obj_ids: List[UUID]) -> List[T]:
+        '''Retrieve the active entities among the given UUIDs with a single query.
+
+        Args:
+            obj_ids: The UUIDs of the entities to retrieve.
+
+        Returns:
+            List[T]: The entities found, in no particular order. Missing or inactive
+            UUIDs are left out, it is up to the caller to check for them.
+
+        Raises:
+            NotImplementedError: If not implemented by a subclass.
+        '''
+        raise NotImplementedError("Subclasses must implement 'get_many'")
+
+    @abstractmethod
+    async def list(self, page: int = 1, per_page: int = 10, cursor: Optional[str] = None) -> List[T]:
         '''List all active entities with pagination.
 
         Args:
             page: The page number to retrieve (1-indexed). Defaults to 1.
             per_page: The number of entities per page. Defaults to 10.
+            cursor: Opaque keyset cursor returned by the previous page. When informed, `page` is ignored.
 
         Returns:
             A list of active entities for the specified page.
@@ -67,13 +99,15 @@ class IRepository(Generic[T]):
         '''Update an existing active entity in the data store.
 
         Args:
-            obj: The entity with updated data. Must match an existing active record by UUID.
+            obj: The entity with updated data. Must match an existing active record by UUID
+                and still carry the version that record is at.
 
         Returns:
             None
 
         Raises:
             NotFoundException: If no active entity with the given UUID exists.
+            ConflictException: If the record was changed since the entity was read.
             NotImplementedError: If not implemented by a subclass.
         '''
         raise NotImplementedError("Subclasses must implement 'update'")
\ No newline at end of file
@@ -1,9 +1,10 @@
 from sqlalchemy.future import select
-from sqlalchemy import func
-from typing import List
+from sqlalchemy import Select, func
+from typing import List, Optional
 from api.infrastructure.repositories.repository_exception_catcher import RepositoryExceptionCatcher
 from api.domain.entities.product import Product
 from api.enums.product_type import ProductType
+from api.exceptions.validation_exception import ValidationException
 from api.infrastructure.models.product_model import ProductModel
 from api.infrastructure.repositories.base_repository import BaseRepository
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -22,15 +23,43 @@ class ProductRepository(BaseRepository[Product, ProductModel]):
         name: str = '*',
         type: ProductType = ProductType.ANY,
         page: int = 1,
-        per_page: int = 30
+        per_page: int = 30,
+        cursor: Optional[str] = None
     ) -> List[Product]:
+        '''List the active products, the ones whose name best matches `name` first when it is given.
+
+        The name is matched against `search_key`, the accent-folded and lower-cased search name
+        kept by the database, so the trigram index can serve the substring match. Results ranked
+        by similarity can only be paginated by page, not by cursor.
+        '''
         self.logger.log_debug(f'Listing products by name="{name}" and type="{type.name}"')
         query = select(self.model_class).filter(self.model_class.active.is_(True))
-        if name != '*':
-            query = query.filter(func.unaccent(self.model_class.search_name).ilike(f'%{name}%'))
         if type != ProductType.ANY:
             query = query.filter(self.model_class.type == type)
-        query = query.offset((page - 1) * per_page).limit(per_page)
+        if name != '*':
+            if cursor:
+                raise ValidationException('A busca por nome é paginada por página, não por cursor')
+            query = self._search_by_name(query, name, page, per_page)
+        else:
+            query = self._paginate(query, page, per_page, cursor)
         result = await self.session.execute(query)
         models = result.scalars().all()
         return [model.to_entity() for model in models]
+
+    @catcher
+    async def list_active(self) -> List[Product]:
+        '''Return every active product, used to load the in-memory ProductCatalog.'''
+        self.logger.log_debug('Listing every active product')
+        result = await self.session.execute(select(self.model_class).filter(self.model_class.active.is_(True)))
+        return [model.to_entity() for model in result.scalars().all()]
+
+    def _search_by_name(self, query: Select, name: str, page: int, per_page: int) -> Select:
+        search_key = func.lower(func.immutable_unaccent(name))
+        pattern = name.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+        query = query.filter(self.model_class.search_key.contains(func.lower(func.immutable_unaccent(pattern)), escape='\\'))
+        query = query.order_by(
+            func.similarity(self.model_class.search_key, search_key).desc(),
+            self.model_class.created_at.desc(),
+            self.model_class.uuid.desc()
+        )
+        return query.offset((max(page, 1) - 1) * per_page).limit(per_page)
@@ -0,0 +1,65 @@
+from datetime import datetime
+from typing import Dict, Iterable, Tuple
+import pytz
+from sqlalchemy import delete
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from api.infrastructure.models.signed_url_cache_model import SignedUrlCacheModel
+from api.infrastructure.repositories.repository_exception_catcher import RepositoryExceptionCatcher
+from api.shared.logger import Logger
+
+
+class SignedUrlCacheRepository:
+
+    catcher = RepositoryExceptionCatcher('SignedUrlCacheRepository')
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        self.logger = Logger('SignedUrlCacheRepository')
+
+    @catcher
+    async def get_many(self, bucket_name: str, blob_names: Iterable[str]) -> Dict[str, Tuple[str, datetime]]:
+        '''Return the unexpired (signed URL, expiration) of each requested blob of the bucket that is stored.'''
+        blob_names = list(blob_names)
+        self.logger.log_debug(f'Reading the cached signed URLs of {len(blob_names)} blobs of {bucket_name}')
+        statement = select(SignedUrlCacheModel.blob_name, SignedUrlCacheModel.signed_url, SignedUrlCacheModel.expires_at).where(
+            SignedUrlCacheModel.bucket_name == bucket_name,
+            SignedUrlCacheModel.blob_name.in_(blob_names),
+            SignedUrlCacheModel.expires_at > datetime.now(pytz.utc)
+        )
+        result = await self.session.execute(statement)
+        return {row.blob_name: (row.signed_url, row.expires_at) for row in result.all()}
+
+    @catcher
+    async def save_many(self, bucket_name: str, signed_urls: Dict[str, str], expires_at: datetime) -> None:
+        self.logger.log_debug(f'Caching {len(signed_urls)} signed URLs of {bucket_name} until {expires_at}')
+        statement = insert(SignedUrlCacheModel).values([
+            {'bucket_name': bucket_name, 'blob_name': blob_name, 'signed_url': signed_url, 'expires_at': expires_at}
+            for blob_name, signed_url in signed_urls.items()
+        ])
+        statement = statement.on_conflict_do_update(
+            index_elements=[SignedUrlCacheModel.bucket_name, SignedUrlCacheModel.blob_name],
+            set_={
+                'signed_url': statement.excluded.signed_url,
+                'expires_at': statement.excluded.expires_at
+            }
+        )
+        await self.session.execute(statement)
+        await self.session.commit()
+
+    @catcher
+    async def delete(self, bucket_name: str, blob_name: str) -> None:
+        self.logger.log_debug(f'Removing the cached signed URL of {blob_name} of {bucket_name}')
+        await self.session.execute(delete(SignedUrlCacheModel).where(
+            SignedUrlCacheModel.bucket_name == bucket_name,
+            SignedUrlCacheModel.blob_name == blob_name
+        ))
+        await self.session.commit()
+
+    @catcher
+    async def delete_expired(self) -> int:
+        statement = delete(SignedUrlCacheModel).where(SignedUrlCacheModel.expires_at <= datetime.now(pytz.utc))
+        result = await self.session.execute(statement)
+        await self.session.commit()
+        return result.rowcount
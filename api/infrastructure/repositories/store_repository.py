@@ -1,10 +1,14 @@
 from typing import List, Optional
 from uuid import UUID
-from api.exceptions.not_found_exception import NotFoundException
 from api.infrastructure.models.store_model import StoreModel
 from api.infrastructure.repositories.base_repository import BaseRepository
 from sqlalchemy.ext.asyncio import AsyncSession
 from api.domain.entities.store import Store
+from api.domain.read_models.store_summary import StoreSummary
+from api.domain.read_models.user_summary import UserSummary
+from api.infrastructure.models.address_model import AddressModel
+from api.infrastructure.models.user_model import UserModel
+from sqlalchemy import exists
 from sqlalchemy.future import select
 from sqlalchemy.orm import joinedload
 
@@ -14,52 +18,52 @@ from api.infrastructure.repositories.repository_exception_catcher import Reposit
 class StoreRepository(BaseRepository[Store, StoreModel]):
 
     catcher = RepositoryExceptionCatcher('StoreRepository')
+    NOT_FOUND_MESSAGE = 'Nenhuma loja com o id {} foi encontrada'
 
     def __init__(self, session: AsyncSession):
         super().__init__(session, StoreModel)
 
     @catcher
-    async def get(self, obj_id: UUID) -> Store:
-        self.logger.log_debug(f'Retrieving store: {obj_id}')
+    async def list(self, page: int = 1, per_page: int = 10, cursor: Optional[str] = None) -> List[Store]:
+        self.logger.log_debug(f'Listing stores (page {page}, per_page {per_page}, cursor {cursor})')
         query = (
             select(self.model_class)
-            .filter_by(uuid=obj_id, active=True)
+            .filter_by(active=True)
             .options(
                 joinedload(StoreModel.address),
                 joinedload(StoreModel.owner)
             )
         )
+        query = self._paginate(query, page, per_page, cursor)
         result = await self.session.execute(query)
-        model = result.scalars().one_or_none()
-        if model is None:
-            self.logger.log_warning(f'No active store found for UUID: {obj_id}')
-            raise NotFoundException(f'Nenhuma loja com o id {obj_id} foi encontrada')
-        return model.to_entity()
+        models = result.scalars().all()
+        return [model.to_entity() for model in models]
 
     @catcher
-    async def list(self, page: int = 1, per_page: int = 10) -> List[Store]:
-        self.logger.log_debug(f'Listing stores (page {page}, per_page {per_page})')
-        if page < 1:
-            page = 1
+    async def list_summaries(self, page: int = 1, per_page: int = 10, cursor: Optional[str] = None) -> List[StoreSummary]:
+        '''List the active stores as StoreSummary, selecting only the store, address and owner columns it shows.'''
+        self.logger.log_debug(f'Listing store summaries (page {page}, per_page {per_page}, cursor {cursor})')
         query = (
-            select(self.model_class)
-            .filter_by(active=True)
-            .options(
-                joinedload(StoreModel.address),
-                joinedload(StoreModel.owner)
-            )
-            .offset((page - 1) * per_page)
-            .limit(per_page)
+            select(*StoreModel.summary_columns(), *AddressModel.summary_columns(), *UserModel.summary_columns('owner_'))
+            .select_from(StoreModel)
+            .join(AddressModel, StoreModel.address_uuid == AddressModel.uuid)
+            .join(UserModel, StoreModel.owner_uuid == UserModel.uuid)
+            .filter(StoreModel.active.is_(True))
         )
+        query = self._paginate(query, page, per_page, cursor)
         result = await self.session.execute(query)
-        models = result.scalars().all()
-        return [model.to_entity() for model in models]
+        return [
+            StoreSummary(
+                owner=UserSummary(**UserModel.summary_values(row, 'owner_')),
+                **StoreModel.summary_values(row),
+                **AddressModel.summary_values(row)
+            )
+            for row in result.all()
+        ]
 
     @catcher
-    async def list_by_owner(self, owner_uuid: UUID, page: int = 1, per_page: int = 10) -> List[Store]:
-            self.logger.log_debug(f'Listing companies by the owner: {owner_uuid} (page {page}, per_page {per_page})')
-            if page < 1:
-                page = 1
+    async def list_by_owner(self, owner_uuid: UUID, page: int = 1, per_page: int = 10, cursor: Optional[str] = None) -> List[Store]:
+            self.logger.log_debug(f'Listing companies by the owner: {owner_uuid} (page {page}, per_page {per_page}, cursor {cursor})')
             query = (
                 select(self.model_class)
                 .filter_by(active=True)
@@ -68,9 +72,8 @@ class StoreRepository(BaseRepository[Store, StoreModel]):
                     joinedload(StoreModel.address),
                     joinedload(StoreModel.owner)
                 )
-                .offset((page - 1) * per_page)
-                .limit(per_page)
             )
+            query = self._paginate(query, page, per_page, cursor)
             result = await self.session.execute(query)
             models = result.scalars().all()
             stores: List[Store] = []
@@ -95,4 +98,21 @@ class StoreRepository(BaseRepository[Store, StoreModel]):
         model = result.scalars().first()
         if model:
             return model.to_entity()
-        return None
\ No newline at end of file
+        return None
+
+    @catcher
+    async def is_owned_by(self, store_uuid: UUID, owner_uuid: UUID) -> bool:
+        '''The uuid primary key finds the one row the EXISTS has to check, so it needs no index of its own.'''
+        self.logger.log_debug(f'Checking if the store {store_uuid} is owned by {owner_uuid}')
+        query = select(
+            exists().where(
+                self.model_class.uuid == store_uuid,
+                self.model_class.owner_uuid == owner_uuid,
+                self.model_class.active.is_(True)
+            )
+        )
+        result = await self.session.execute(query)
+        return bool(result.scalar())
+
+    def _load_options(self) -> list:
+        return [joinedload(StoreModel.address), joinedload(StoreModel.owner)]
@@ -0,0 +1,98 @@
+import asyncio
+import copy
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Awaitable, Callable, Dict, Generic, Hashable, Iterable, Iterator, List, Optional, TypeVar
+from uuid import UUID
+from api.domain.entities.base_entity import BaseEntity
+
+T = TypeVar('T', bound=BaseEntity)
+
+
+class EntityLoader(Generic[T]):
+    '''Loads the entities of one repository for one request, batching and memoizing the reads.
+
+    Every key asked for while a batch is waiting to run joins it, so loads awaited
+    together (e.g. with asyncio.gather) become a single `WHERE uuid IN (...)` query.
+    Loaded entities, and the keys found missing, are remembered until `clear`. Each
+    caller gets its own deep copy, so changing a loaded entity never changes the memo.
+    '''
+
+    def __init__(self, fetch_many: Callable[[List[UUID]], Awaitable[List[T]]]):
+        self._fetch_many = fetch_many
+        self._entities: Dict[UUID, Optional[T]] = {}
+        self._queued: Dict[UUID, None] = {}
+        self._batch: Optional[asyncio.Future] = None
+        self._generation = 0
+
+    async def load(self, key: UUID | str) -> Optional[T]:
+        return (await self.load_many([key])).get(UUID(str(key)))
+
+    async def load_many(self, keys: Iterable[UUID | str]) -> Dict[UUID, T]:
+        '''Return the entities found among `keys`, leaving the missing ones out.'''
+        keys = list(dict.fromkeys(UUID(str(key)) for key in keys))
+        while True:
+            pending = [key for key in keys if key not in self._entities]
+            if not pending:
+                break
+            for key in pending:
+                self._queued.setdefault(key)
+            if self._batch is None:
+                self._batch = asyncio.ensure_future(self._dispatch())
+            await asyncio.shield(self._batch)
+        return {key: copy.deepcopy(self._entities[key]) for key in keys if self._entities[key] is not None}
+
+    def clear(self) -> None:
+        '''Forget every loaded entity, e.g. after a write made them stale.'''
+        self._entities = {}
+        self._generation += 1
+
+    async def _dispatch(self) -> None:
+        await asyncio.sleep(0)
+        keys = list(self._queued)
+        self._queued.clear()
+        self._batch = None
+        generation = self._generation
+        entities = {entity.uuid: entity for entity in await self._fetch_many(keys)}
+        if generation != self._generation:
+            return
+        for key in keys:
+            self._entities[key] = entities.get(key)
+
+
+class RequestIdentityMap:
+    '''The entity loaders of the unit of work running in the current context (usually one HTTP request).
+
+    RequestSessionScope opens one per scope; the repositories look it up with `current`
+    and read through it when it is there.
+    '''
+
+    _current: ContextVar[Optional['RequestIdentityMap']] = ContextVar('request_identity_map', default=None)
+
+    def __init__(self):
+        self._loaders: Dict[Hashable, EntityLoader] = {}
+
+    @classmethod
+    def current(cls) -> Optional['RequestIdentityMap']:
+        return cls._current.get()
+
+    @classmethod
+    @contextmanager
+    def open(cls, identity_map: Optional['RequestIdentityMap'] = None) -> Iterator['RequestIdentityMap']:
+        identity_map = identity_map or cls()
+        token = cls._current.set(identity_map)
+        try:
+            yield identity_map
+        finally:
+            cls._current.reset(token)
+
+    def loader(self, owner: Hashable, fetch_many: Callable[[List[UUID]], Awaitable[List[T]]]) -> EntityLoader[T]:
+        loader = self._loaders.get(owner)
+        if loader is None:
+            loader = self._loaders[owner] = EntityLoader(fetch_many)
+        return loader
+
+    def clear(self) -> None:
+        '''Forget what every loader read; entities embed each other, so one write can make any of them stale.'''
+        for loader in self._loaders.values():
+            loader.clear()
@@ -0,0 +1,88 @@
+import asyncio
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Awaitable, List, Optional
+from uuid import uuid4
+from sqlalchemy.ext.asyncio import AsyncSession, async_scoped_session, async_sessionmaker
+from api.infrastructure.request_identity_map import RequestIdentityMap
+from api.shared.logger import Logger
+
+
+class RequestSessionScope:
+    '''Hands out one AsyncSession per unit of work (usually one HTTP request).
+
+    The repositories receive the `session` proxy once, at build time. Every call made
+    on it is routed to the session that belongs to the scope currently running, so
+    concurrent requests never share (and serialize on) the same AsyncSession. Each scope
+    also gets its own RequestIdentityMap, so repeated reads of a record in it hit the
+    database once.
+    '''
+
+    def __init__(self, sessionmaker: async_sessionmaker[AsyncSession]):
+        self.logger = Logger('RequestSessionScope')
+        self._scope_id: ContextVar[Optional[str]] = ContextVar('request_session_scope_id', default=None)
+        self.session = async_scoped_session(sessionmaker, scopefunc=self._scope_id.get)
+
+    @asynccontextmanager
+    async def begin(self, identity_map: Optional[RequestIdentityMap] = None) -> AsyncIterator[AsyncSession]:
+        '''Open a new scope, yield its session and close it when the scope ends.
+
+        The scope gets a new identity map unless one is given to share.
+        '''
+        token = self._scope_id.set(str(uuid4()))
+        try:
+            with RequestIdentityMap.open(identity_map):
+                yield self.session()
+        finally:
+            try:
+                await self.session.remove()
+            except Exception as ex:
+                self.logger.log_error(f'Failed to close the scoped session: {ex}')
+            self._scope_id.reset(token)
+
+    async def gather(self, *lookups: Awaitable[Any]) -> List[Any]:
+        '''Await independent read-only lookups concurrently, each on a session (and pooled connection) of its own.
+
+        The lookups run in child scopes that share the identity map of the current one, so
+        what they load stays memoized for it. The current session hands its connection back to
+        the pool first, so a request never holds one connection while waiting for others. Every
+        lookup is awaited before the first error, if any, is raised, so no child scope outlives
+        the call.
+        '''
+        await self._release_connection()
+        identity_map = RequestIdentityMap.current()
+
+        async def run_in_child_scope(lookup: Awaitable[Any]) -> Any:
+            async with self.begin(identity_map):
+                return await lookup
+
+        results = await asyncio.gather(*[run_in_child_scope(lookup) for lookup in lookups], return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return results
+
+    async def _release_connection(self) -> None:
+        '''End the read-only transaction of the current session, if any, returning its connection to the pool.'''
+        if not self.session.registry.has():
+            return
+        session = self.session()
+        if session.new or session.dirty or session.deleted:
+            return
+        if session.in_transaction():
+            await session.commit()
+
+
+class RequestSessionMiddleware:
+    '''ASGI middleware that wraps every HTTP request in its own RequestSessionScope.'''
+
+    def __init__(self, app, session_scope: RequestSessionScope):
+        self.app = app
+        self.session_scope = session_scope
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+        async with self.session_scope.begin():
+            await self.app(scope, receive, send)
@@ -1,5 +1,8 @@
 from http import HTTPStatus
+from typing import Optional
 from uuid import UUID
+from api.clients.cep_cache import CepCache
+from api.clients.geocode_cache import GeocodeCache
 from api.clients.open_street_map_client import OpenStreetMapsClient
 from api.clients.correios_client import CorreiosClient
 from api.controllers.models.address.address_request_model import AddressRequestModel
@@ -8,6 +11,7 @@ from api.controllers.models.address.coordinates_response_model import Coordinate
 from api.domain.entities.address import Address
 from api.infrastructure.repositories.address_repository import AddressRepository
 from api.services.base_service import BaseService
+from api.services.geocoding_queue import GeocodingQueue
 from api.services.service_exception_catcher import ServiceExceptionCatcher
 from api.services.service_response import ServiceResponse
 
@@ -16,14 +20,23 @@ class AddressService(BaseService[AddressRequestModel, AddressResponseModel, Addr
     
     catch = ServiceExceptionCatcher('AddressServiceExceptionCatcher')
 
-    def __init__(self, address_repository: AddressRepository):
+    def __init__(self,
+                 address_repository: AddressRepository,
+                 cep_cache: Optional[CepCache] = None,
+                 geocode_cache: Optional[GeocodeCache] = None,
+                 geocoding_queue: Optional[GeocodingQueue] = None):
         super().__init__(address_repository, Address, AddressResponseModel)
+        self.cep_cache = cep_cache
+        self.geocode_cache = geocode_cache
+        self.geocoding_queue = geocoding_queue
 
     async def create(self, request: AddressResponseModel) -> ServiceResponse[AddressResponseModel]:
         address = Address(**request.model_dump())
         address.validate()
+        if self.geocoding_queue is None:
+            await self._update_coordinates(address)
         await self.repository.create(address)
-        await self._update_coordinates(address)
+        self._schedule_geocoding(address)
         return ServiceResponse(
             status=HTTPStatus.CREATED,
             message=f'O endereço {address.uuid} foi criado com sucesso',
@@ -32,7 +45,7 @@ class AddressService(BaseService[AddressRequestModel, AddressResponseModel, Addr
 
     @catch
     async def fresh_fill(self, cep: str) -> ServiceResponse[AddressResponseModel]:
-        correios_client = CorreiosClient()
+        correios_client = CorreiosClient(cache=self.cep_cache)
         partially_filled_address_response_model = await correios_client.get_by_cep(cep)
         return ServiceResponse(
             status=HTTPStatus.OK,
@@ -43,32 +56,54 @@ class AddressService(BaseService[AddressRequestModel, AddressResponseModel, Addr
     @catch
     async def get_approximate_coordinates(self, uuid: UUID) -> ServiceResponse[CoordinatesResponseModel]:
         address = await self.repository.get(uuid)
-        opens_street_client = OpenStreetMapsClient()
-        coordinates = await opens_street_client.get_coordinates(address)
-        message = f'As coordenadas aproximadas lat, lon: {coordinates} foram encontradas para o endereço {address.uuid}'
+        coordinates = await self._geocode(address)
+        message = f'As coordenadas aproximadas lat, lon: {(coordinates.latitude, coordinates.longitude)} foram encontradas para o endereço {address.uuid}'
         self.logger.log_debug(message)
         return ServiceResponse(
             status=HTTPStatus.OK,
             message=message,
-            payload=CoordinatesResponseModel(latitude=coordinates[0], longitude=coordinates[1])
+            payload=coordinates
         )
     
     @catch
     async def update(self, uuid: UUID, request: AddressRequestModel) -> ServiceResponse[AddressResponseModel]:
         address = await self.repository.get(uuid)
-        address.update(**request.model_dump())
-        address.validate()
-        await self._update_coordinates(address)
-        await self.repository.update(address)
+        await self._apply_patch(address, request.model_dump())
         return ServiceResponse(
             status=HTTPStatus.OK,
             message=f'O endereço {address.uuid} foi atualizado com sucesso',
             payload=AddressResponseModel(**address.to_dict())
         )
         
+    async def _apply_patch(self, address: Address, values: dict) -> None:
+        '''Write the changes, geocoding the address again when its location changed.'''
+        geocoder = OpenStreetMapsClient(cache=self.geocode_cache)
+        previous_location = geocoder.cache_key(address)
+        address.update(**values)
+        address.validate()
+        location_changed = geocoder.cache_key(address) != previous_location
+        if not location_changed:
+            self.logger.log_debug(f'The location of the address {address.uuid} did not change, skipping the geocoding')
+        elif self.geocoding_queue is None:
+            await self._update_coordinates(address)
+        await self.repository.update(address)
+        if location_changed:
+            self._schedule_geocoding(address)
+
+    def _schedule_geocoding(self, address: Address) -> None:
+        if self.geocoding_queue is not None:
+            self.geocoding_queue.enqueue(address.uuid)
+
+    async def _geocode(self, address: Address) -> CoordinatesResponseModel:
+        geocoder = OpenStreetMapsClient(cache=self.geocode_cache)
+        latitude, longitude = await geocoder.get_coordinates(address)
+        return CoordinatesResponseModel(latitude=latitude, longitude=longitude)
+
     async def _update_coordinates(self, address: Address) -> None:
-        service_response = await self.get_approximate_coordinates(address.uuid)
-        if service_response.status == HTTPStatus.OK:
-            coordinates = service_response.payload
-            address.update(latitude=coordinates.longitude, longitude=coordinates.latitude)
-            await self.repository.update(address)
\ No newline at end of file
+        '''Geocode the address in place, keeping the current coordinates when the lookup fails.'''
+        try:
+            coordinates = await self._geocode(address)
+        except Exception as ex:
+            self.logger.log_warning(f'The coordinates of the address {address.uuid} could not be updated: {ex}')
+            return
+        address.update(latitude=coordinates.latitude, longitude=coordinates.longitude)
\ No newline at end of file
@@ -1,14 +1,16 @@
 from datetime import datetime, timedelta
+from time import time
+from typing import Optional
 from jose import ExpiredSignatureError, JWTError, jwt
 from fastapi import HTTPException, status
 from api.controllers.models.user.user_response_model import UserResponseModel
-from api.domain.entities.user import User
 from api.enums.user_access import UserAccess
 from api.services.service_exception_catcher import ServiceExceptionCatcher
 from api.services.service_response import ServiceResponse
 from api.services.user_service import UserService
 from api.shared.env_variable_manager import EnvVariableManager
 from api.shared.logger import Logger
+from api.shared.lru_ttl_cache import LruTtlCache
 from api.shared.password_hasher import PasswordHasher
 from api.shared.validator import Validator
 
@@ -17,13 +19,16 @@ class AuthService:
 
     catch = ServiceExceptionCatcher('AuthServiceExceptionCatcher')
 
-    def __init__(self, user_service: UserService):
+    def __init__(self, user_service: UserService, sessions_cache: Optional[LruTtlCache[str, UserResponseModel]] = None):
         env = EnvVariableManager()
         self.user_service = user_service
         self.secret_key = env.load('JWT_SECRET_KEY', is_sensitive=True).string()
         self.algorithm = 'HS256'
         self.token_expire_minutes = env.load('USER_TOKEN_EXPIRATION_MINUTES', 60).integer()
-        self.sessions_cache: dict[str, User] = {}
+        self.sessions_cache: LruTtlCache[str, UserResponseModel] = sessions_cache or LruTtlCache(
+            max_size=10000,
+            ttl_seconds=self.token_expire_minutes * 60
+        )
         self.logger = Logger('AuthService')
         self.validator = Validator()
 
@@ -39,7 +44,7 @@ class AuthService:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f'O usuário {email} não possui cadastro')
         if not user:
             raise HTTPException(status_code=status.HTTP_424_FAILED_DEPENDENCY, detail=f'Não foi possível encontrar o usuário {email}, tentar novamente em alguns minutos')
-        valid_password: bool = PasswordHasher.verify(password, user.password)
+        valid_password: bool = await PasswordHasher.verify_async(password, user.password)
         if not valid_password:
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail='Credenciais inválidas, verifique o seu e-mail e senha')
         jwt_body: dict = {
@@ -72,6 +77,9 @@ class AuthService:
         return ServiceResponse(status=status.HTTP_200_OK, message=f'O usuário {user.email} está autenticado', payload=user)
         
     async def _get_user_from_token(self, token: str) -> UserResponseModel:
+        cached_user: UserResponseModel | None = self.sessions_cache.get(token)
+        if cached_user is not None:
+            return cached_user
         credentials_exception = HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail='Credenciais inválidas',
@@ -97,8 +105,15 @@ class AuthService:
         user: UserResponseModel = service_response.payload
         if user is None:
             raise credentials_exception
+        self._cache_session(token, payload, user)
         return user
 
+    def _cache_session(self, token: str, payload: dict, user: UserResponseModel) -> None:
+        '''Keep the resolved user for the token, never beyond the moment the token expires.'''
+        expires_at = payload.get('exp')
+        ttl_seconds = None if expires_at is None else float(expires_at) - time()
+        self.sessions_cache.set(token, user, ttl_seconds)
+
     def _create_access_token(self, data: dict, expires_delta: timedelta | None = None) -> str:
         to_encode = data.copy()
         expire = datetime.now().astimezone() + (expires_delta or timedelta(minutes=self.token_expire_minutes))
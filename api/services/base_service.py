@@ -1,13 +1,15 @@
 from api.controllers.models.base_request_model import BaseRequestModel
 from api.controllers.models.base_response_model import BaseResponseModel
 from api.domain.entities.base_entity import BaseEntity
+from api.exceptions.conflict_exception import ConflictException
 from api.exceptions.not_found_exception import NotFoundException
 from api.infrastructure.repositories.i_repository import IRepository
 from api.services.i_service import IService
 from api.services.service_exception_catcher import ServiceExceptionCatcher
 from api.services.service_response import ServiceResponse
+from api.shared.keyset_cursor import KeysetCursor
 from api.shared.logger import Logger
-from typing import TypeVar, Generic, List
+from typing import Optional, TypeVar, Generic, List
 from http import HTTPStatus
 from uuid import UUID
 
@@ -44,11 +46,16 @@ class BaseService(IService[REQUEST, RESPONSE], Generic[REQUEST, RESPONSE, T]):
         return ServiceResponse(status=HTTPStatus.OK, message=f'O registro {obj_id} foi encontrado com sucesso', payload=response)
 
     @catch
-    async def list(self, page: int = 1, per_page: int = 10) -> ServiceResponse[List[RESPONSE]]:
-        self.logger.log_info(f'Reading many. Page: {page}, per page: {per_page}')
-        entities = await self.repository.list(page, per_page)
+    async def list(self, page: int = 1, per_page: int = 10, cursor: Optional[str] = None) -> ServiceResponse[List[RESPONSE]]:
+        self.logger.log_info(f'Reading many. Page: {page}, per page: {per_page}, cursor: {cursor}')
+        entities = await self.repository.list(page, per_page, cursor)
         entities_response = self._convert_many_to_response(entities)
-        return ServiceResponse(status=HTTPStatus.OK, message=f'Leu {len(entities_response)} registros com sucesso', payload=entities_response)
+        return ServiceResponse(
+            status=HTTPStatus.OK,
+            message=f'Leu {len(entities_response)} registros com sucesso',
+            payload=entities_response,
+            next_cursor=KeysetCursor.next_after(entities, per_page)
+        )
 
     @catch
     async def update(self, obj_id: UUID, request: REQUEST) -> ServiceResponse[RESPONSE]:
@@ -60,6 +67,18 @@ class BaseService(IService[REQUEST, RESPONSE], Generic[REQUEST, RESPONSE, T]):
         response = self.response_model(**original_entity.to_dict())
         return ServiceResponse(status=HTTPStatus.OK, message='O registro foi atualizado com sucesso', payload=response)
 
+    @catch
+    async def patch(self, obj_id: UUID, request: BaseRequestModel) -> ServiceResponse[RESPONSE]:
+        '''Change only the fields sent in the request, refusing it when `version` is sent and is stale.'''
+        self.logger.log_info(f'Patching the record {obj_id}')
+        entity: BaseEntity = await self.repository.get(obj_id)
+        self._raise_not_found_when_none(entity, obj_id)
+        values = request.model_dump(exclude_unset=True)
+        self._raise_conflict_when_stale(entity, values.pop('version', None))
+        await self._apply_patch(entity, values)
+        response = self.response_model(**entity.to_dict())
+        return ServiceResponse(status=HTTPStatus.OK, message='O registro foi atualizado com sucesso', payload=response)
+
     @catch
     async def delete(self, obj_id: UUID) -> ServiceResponse[None]:
         self.logger.log_info(f'Deleting the record {obj_id}')
@@ -73,6 +92,16 @@ class BaseService(IService[REQUEST, RESPONSE], Generic[REQUEST, RESPONSE, T]):
         if not entity:
             raise NotFoundException(f'O registro {expected_id} não foi encontrado')
 
+    def _raise_conflict_when_stale(self, entity: BaseEntity, expected_version: Optional[int]) -> None:
+        if expected_version is not None and expected_version != entity.version:
+            raise ConflictException(f'O registro {entity.uuid} está na versão {entity.version}, não na versão {expected_version}; carregue-o novamente')
+
+    async def _apply_patch(self, entity: T, values: dict) -> None:
+        '''Set the patched fields and write them; services with side effects on updates extend it.'''
+        entity.update(**values)
+        entity.validate()
+        await self.repository.update(entity)
+
     def _convert_many_to_response(self, entities: List[BaseEntity]) -> List[RESPONSE]:
         entities_response = []
         for entity in entities:
@@ -1,21 +1,33 @@
-from typing import List
+from typing import Dict, Iterable, List, Optional
 from uuid import UUID
 from api.controllers.models.user.user_response_model import UserResponseModel
 from api.enums.demand_status import DemandStatus
 from api.enums.product_type import ProductType
+from api.exceptions.not_found_exception import NotFoundException
 from api.exceptions.unauthorized_exception import UnauthorizedException
+from api.exceptions.validation_exception import ValidationException
 from api.infrastructure.repositories.demand_repository import DemandRepository
+from api.infrastructure.repositories.i_repository import IRepository
 from api.infrastructure.repositories.product_repository import ProductRepository
 from api.infrastructure.repositories.store_repository import StoreRepository
 from api.infrastructure.repositories.user_repository import UserRepository
+from api.infrastructure.request_session_scope import RequestSessionScope
+from api.controllers.models.demand.demand_bulk_request_model import DemandBulkRequestModel
+from api.controllers.models.demand.demand_bulk_status_request_model import DemandBulkStatusRequestModel
+from api.controllers.models.demand.demand_bulk_status_response_model import DemandBulkStatusResponseModel
 from api.controllers.models.demand.demand_response_model import DemandResponseModel
+from api.controllers.models.demand.demand_summary_response_model import DemandSummaryResponseModel
 from http import HTTPStatus
 from api.controllers.models.demand.demand_request_model import DemandRequestModel
+from api.domain.entities.base_entity import BaseEntity
 from api.domain.entities.demand import Demand
+from api.domain.entities.store import Store
+from api.domain.read_models.demand_summary import DemandSummary
 from api.services.base_service import BaseService
 from api.services.product_service import ProductService
 from api.services.service_exception_catcher import ServiceExceptionCatcher
 from api.services.service_response import ServiceResponse
+from api.shared.keyset_cursor import KeysetCursor
 
 
 class DemandService(BaseService[DemandRequestModel, DemandResponseModel, Demand]):
@@ -28,25 +40,29 @@ class DemandService(BaseService[DemandRequestModel, DemandResponseModel, Demand]
         store_repository: StoreRepository,
         product_repository: ProductRepository,
         user_repository: UserRepository,
-        product_service: ProductService
+        product_service: ProductService,
+        session_scope: RequestSessionScope
     ):
         super().__init__(demand_repository, Demand, DemandResponseModel)
         self.store_repo = store_repository
         self.product_repo = product_repository
         self.user_repo = user_repository
         self.product_service = product_service
+        self.session_scope = session_scope
 
     async def create(self, user: UserResponseModel, request: DemandRequestModel) -> ServiceResponse[DemandResponseModel]:
         self.logger.log_info('Creating a Demand')
         if not request.responsible_uuid:
             request.responsible_uuid = user.uuid
             self.logger.log_warning(f'No responsible user was informed for this demand, the responsible will be the creator {user.email}: {user.uuid}')
-        await self._raise_if_user_is_not_authorized(user, request.store_uuid)
         store = await self.store_repo.get(request.store_uuid)
         self._raise_not_found_when_none(store, request.store_uuid)
-        product = await self.product_repo.get(request.product_uuid)
+        self._raise_unless_owner_of_stores(user, [store])
+        product, responsible = await self.session_scope.gather(
+            self.product_repo.get(request.product_uuid),
+            self.user_repo.get(request.responsible_uuid)
+        )
         self._raise_not_found_when_none(product, request.product_uuid)
-        responsible = await self.user_repo.get(request.responsible_uuid)
         self._raise_not_found_when_none(responsible, request.responsible_uuid)
         demand = Demand(
             store=store,
@@ -66,6 +82,55 @@ class DemandService(BaseService[DemandRequestModel, DemandResponseModel, Demand]
             payload=response
         )
     
+    @catch
+    async def create_many(self, user: UserResponseModel, request: DemandBulkRequestModel) -> ServiceResponse[List[DemandResponseModel]]:
+        '''Create a whole list of demands at once, checking the stores, products and responsibles with one query each.
+
+        The stores are checked first, so nobody learns which products or users exist through stores they do not own.
+        '''
+        items = request.demands
+        self.logger.log_info(f'Creating {len(items)} demands')
+        for item in items:
+            if not item.responsible_uuid:
+                item.responsible_uuid = UUID(str(user.uuid))
+        stores = await self._get_all(self.store_repo, [item.store_uuid for item in items], 'lojas')
+        self._raise_unless_owner_of_stores(user, stores.values())
+        products, responsibles = await self.session_scope.gather(
+            self._get_all(self.product_repo, [item.product_uuid for item in items], 'produtos'),
+            self._get_all(self.user_repo, [item.responsible_uuid for item in items], 'usuários')
+        )
+        demands = [
+            Demand(
+                store=stores[item.store_uuid],
+                product=products[item.product_uuid],
+                responsible=responsibles[item.responsible_uuid],
+                needed_count=item.needed_count,
+                description=item.description,
+                deadline=item.deadline,
+                status=DemandStatus.OPENED,
+                minimum_count=item.minimum_count
+            )
+            for item in items
+        ]
+        await self.repository.create_many(demands)
+        return ServiceResponse(
+            status=HTTPStatus.CREATED,
+            message=f'{len(demands)} demandas foram criadas com sucesso',
+            payload=self._convert_many_to_response(demands)
+        )
+
+    @catch
+    async def update_status_many(self, user: UserResponseModel, request: DemandBulkStatusRequestModel) -> ServiceResponse[DemandBulkStatusResponseModel]:
+        if request.status == DemandStatus.ANY:
+            raise ValidationException(f'O status {DemandStatus.ANY.value} serve apenas como filtro de busca')
+        self.logger.log_info(f'Changing the status of {len(request.demand_uuids)} demands to {request.status.value}')
+        updated = await self.repository.update_status_many(request.demand_uuids, request.status, user.uuid)
+        return ServiceResponse(
+            status=HTTPStatus.OK,
+            message=f'{len(updated)} demandas foram alteradas para o status {request.status.value}',
+            payload=DemandBulkStatusResponseModel(status=request.status, demand_uuids=updated)
+        )
+
     @catch
     async def get(self, obj_id: UUID, user: UserResponseModel, store_uuid: UUID) -> ServiceResponse[DemandResponseModel]:
         self.logger.log_info(f'Reading from id {obj_id}')
@@ -80,6 +145,32 @@ class DemandService(BaseService[DemandRequestModel, DemandResponseModel, Demand]
             payload=response
             )
 
+    @catch
+    async def update(self, obj_id: UUID, request: DemandRequestModel, user: UserResponseModel) -> ServiceResponse[DemandResponseModel]:
+        self.logger.log_info(f'Updating the demand {obj_id}')
+        demand = await self.repository.get(obj_id)
+        self._raise_unless_owner_of_stores(user, [demand.store])
+        await self._apply_patch(demand, request.model_dump(), user)
+        return ServiceResponse(
+            status=HTTPStatus.OK,
+            message=f'A demanda {obj_id} foi atualizada com sucesso',
+            payload=DemandResponseModel(**demand.to_dict())
+        )
+
+    @catch
+    async def patch(self, obj_id: UUID, request: DemandRequestModel, user: UserResponseModel) -> ServiceResponse[DemandResponseModel]:
+        self.logger.log_info(f'Patching the demand {obj_id}')
+        demand = await self.repository.get(obj_id)
+        self._raise_unless_owner_of_stores(user, [demand.store])
+        values = request.model_dump(exclude_unset=True)
+        self._raise_conflict_when_stale(demand, values.pop('version', None))
+        await self._apply_patch(demand, values, user)
+        return ServiceResponse(
+            status=HTTPStatus.OK,
+            message=f'A demanda {obj_id} foi atualizada com sucesso',
+            payload=DemandResponseModel(**demand.to_dict())
+        )
+
     @catch
     async def list_by_store(self, user: UserResponseModel,
                             store_uuid: UUID,
@@ -87,29 +178,49 @@ class DemandService(BaseService[DemandRequestModel, DemandResponseModel, Demand]
                             page: int = 1,
                             per_page: int = 10,
                             radius_meters: int = 10000,
-                            product_type: ProductType = ProductType.ANY
-                            ) -> ServiceResponse[List[DemandResponseModel]]:
+                            product_type: ProductType = ProductType.ANY,
+                            cursor: Optional[str] = None
+                            ) -> ServiceResponse[List[DemandSummaryResponseModel]]:
         await self._raise_if_user_is_not_authorized(user, store_uuid)
         self.logger.log_debug(f'Listing by the stauts {status.value}')
-        demands: List[Demand] = []
-        demands = await self.repository.list_by_store(store_uuid, status, page, per_page, radius_meters, product_type)
-        for demand in demands:
-            await self.product_service.sign_product_images(demand.product)
+        demands: List[DemandSummary] = []
+        demands = await self.repository.list_by_store(store_uuid, status, page, per_page, radius_meters, product_type, cursor)
+        await self.product_service.sign_products_images([demand.product for demand in demands])
         return ServiceResponse(
             status=HTTPStatus.OK,
             message=f'{len(demands)} demandas com o status {status.value} foram encontrados para a loja selecionada',
-            payload=self._convert_many_to_response(demands)
+            payload=[DemandSummaryResponseModel(**demand.to_dict()) for demand in demands],
+            next_cursor=KeysetCursor.next_after(demands, per_page)
         )
     
+    async def _apply_patch(self, demand: Demand, values: dict, user: UserResponseModel) -> None:
+        '''Replace the store, product and responsible uuids sent by the entities they point to, which are what gets written.'''
+        references = (('store', self.store_repo), ('product', self.product_repo), ('responsible', self.user_repo))
+        for field, repository in references:
+            obj_id = values.pop(f'{field}_uuid', None)
+            if obj_id is not None and str(obj_id) != str(getattr(demand, field).uuid):
+                values[field] = await repository.get(obj_id)
+        if 'store' in values:
+            self._raise_unless_owner_of_stores(user, [values['store']])
+        await super()._apply_patch(demand, values)
+
+    async def _get_all(self, repository: IRepository, uuids: List[UUID], description: str) -> Dict[UUID, BaseEntity]:
+        entities = {entity.uuid: entity for entity in await repository.get_many(uuids)}
+        missing = set(uuids) - set(entities)
+        if missing:
+            raise NotFoundException(f'Não foram encontrados os {description}: {", ".join(sorted(str(uuid) for uuid in missing))}')
+        return entities
+
+    def _raise_unless_owner_of_stores(self, user: UserResponseModel, stores: Iterable[Store]) -> None:
+        foreign_stores = [str(store.uuid) for store in stores if str(store.owner.uuid) != str(user.uuid)]
+        if foreign_stores:
+            self.logger.log_warning(f'The user {user.uuid} does not have access to the stores {foreign_stores}')
+            raise UnauthorizedException('O usuário não possui acesso a loja requerida')
+
     async def _raise_if_user_is_not_authorized(self, user: UserResponseModel, store_uuid: UUID) -> None:
         self.logger.log_debug(f'Cheking if the user {user.uuid} has access to the store {store_uuid}')
-        stores = await self.store_repo.list_by_owner(user.uuid, 1, 1000000)
-        found_store = None 
-        for store in stores:
-            if str(store.owner.uuid) == str(user.uuid) and str(store.uuid) == str(store_uuid):
-                found_store = store
-                break
-        if not found_store:
+        is_owner: bool = await self.store_repo.is_owned_by(store_uuid, user.uuid)
+        if not is_owner:
             self.logger.log_warning(f'The user {user.uuid} does not have access to the store {store_uuid}')
             raise UnauthorizedException('O usuário não possui acesso a loja requerida')
         self.logger.log_debug(f'User {user.uuid} has access to the store {store_uuid}')
\ No newline at end of file
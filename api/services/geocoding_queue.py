@@ -0,0 +1,160 @@
+import asyncio
+from collections import OrderedDict
+from time import monotonic
+from typing import Optional
+from uuid import UUID
+from api.clients.geocode_cache import GeocodeCache
+from api.clients.open_street_map_client import OpenStreetMapsClient
+from api.exceptions.not_found_exception import NotFoundException
+from api.infrastructure.repositories.address_repository import AddressRepository
+from api.infrastructure.request_session_scope import RequestSessionScope
+from api.shared.logger import Logger
+
+
+class GeocodingJob:
+
+    def __init__(self, address_uuid: UUID, attempt: int = 1):
+        self.address_uuid: UUID = address_uuid
+        self.attempt: int = attempt
+
+
+class GeocodingQueue:
+    '''In-process worker that fills the coordinates of saved addresses in the background.
+
+    Upstream calls are spaced to respect Nominatim's usage policy (1 request per second by
+    default) and failed jobs are retried with exponential backoff. Each job runs in its own
+    session scope, so the repositories it uses never touch a request's session.
+    '''
+
+    def __init__(self,
+                 session_scope: RequestSessionScope,
+                 geocode_cache: Optional[GeocodeCache] = None,
+                 requests_per_second: float = 1.0,
+                 max_attempts: int = 5,
+                 backoff_seconds: float = 2.0,
+                 max_size: int = 10000):
+        self.session_scope = session_scope
+        self.geocode_cache = geocode_cache
+        self.min_interval_seconds = 1 / requests_per_second
+        self.max_attempts = max_attempts
+        self.backoff_seconds = backoff_seconds
+        self.max_size = max_size
+        self.logger = Logger('GeocodingQueue')
+        self._pending: OrderedDict[UUID, float] = OrderedDict()
+        self._jobs: Optional[asyncio.Queue[GeocodingJob]] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._next_call_at: float = 0.0
+        self.processed: int = 0
+        self.failed: int = 0
+        self.retried: int = 0
+        self.last_lag_seconds: float = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self._worker is not None and not self._worker.done()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._jobs = asyncio.Queue()
+        for address_uuid in self._pending:
+            self._jobs.put_nowait(GeocodingJob(address_uuid))
+        self._worker = asyncio.create_task(self._run(), name='geocoding-queue')
+        self.logger.log_info('The geocoding worker was started')
+
+    async def stop(self) -> None:
+        if not self.running:
+            return
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        self._worker = None
+        self.logger.log_info(f'The geocoding worker was stopped with {len(self._pending)} pending addresses')
+
+    def enqueue(self, address_uuid: UUID) -> bool:
+        '''Schedule the address to be geocoded; returns False when the queue is full.'''
+        if address_uuid in self._pending:
+            return True
+        if len(self._pending) >= self.max_size:
+            self.logger.log_warning(f'The geocoding queue is full, the address {address_uuid} was not scheduled')
+            return False
+        self._pending[address_uuid] = monotonic()
+        if self._jobs is not None:
+            self._jobs.put_nowait(GeocodingJob(address_uuid))
+        return True
+
+    def metrics(self) -> dict:
+        oldest = next(iter(self._pending.values()), None)
+        return {
+            'running': self.running,
+            'depth': len(self._pending),
+            'lag_seconds': round(monotonic() - oldest, 3) if oldest is not None else 0.0,
+            'last_lag_seconds': round(self.last_lag_seconds, 3),
+            'processed': self.processed,
+            'failed': self.failed,
+            'retried': self.retried,
+        }
+
+    async def join(self) -> None:
+        '''Wait until every scheduled job, retries included, has been handled.'''
+        while self._pending:
+            await self._jobs.join()
+            if self._pending:
+                await asyncio.sleep(self.backoff_seconds / 10)
+
+    async def _run(self) -> None:
+        while True:
+            job = await self._jobs.get()
+            try:
+                await self._throttle()
+                await self._process(job)
+            except Exception as ex:
+                self.logger.log_error(f'Unexpected error while geocoding the address {job.address_uuid}: {ex}')
+            finally:
+                self._jobs.task_done()
+
+    async def _throttle(self) -> None:
+        wait_seconds = self._next_call_at - monotonic()
+        if wait_seconds > 0:
+            await asyncio.sleep(wait_seconds)
+        self._next_call_at = monotonic() + self.min_interval_seconds
+
+    async def _process(self, job: GeocodingJob) -> None:
+        enqueued_at = self._pending.get(job.address_uuid)
+        try:
+            async with self.session_scope.begin() as session:
+                repository = AddressRepository(session)
+                address = await repository.get(job.address_uuid)
+                geocoder = OpenStreetMapsClient(cache=self.geocode_cache)
+                latitude, longitude = await geocoder.get_coordinates(address)
+                address.update(latitude=latitude, longitude=longitude)
+                await repository.update(address)
+        except NotFoundException:
+            self.logger.log_warning(f'The address {job.address_uuid} no longer exists, dropping its geocoding')
+            self._finish(job, enqueued_at)
+            return
+        except Exception as ex:
+            self._retry_or_give_up(job, enqueued_at, ex)
+            return
+        self.processed += 1
+        self._finish(job, enqueued_at)
+        self.logger.log_debug(f'The address {job.address_uuid} was geocoded')
+
+    def _retry_or_give_up(self, job: GeocodingJob, enqueued_at: Optional[float], error: Exception) -> None:
+        if job.attempt >= self.max_attempts:
+            self.failed += 1
+            self._finish(job, enqueued_at)
+            self.logger.log_error(f'Giving up geocoding the address {job.address_uuid} after {job.attempt} attempts: {error}')
+            return
+        delay = self.backoff_seconds * 2 ** (job.attempt - 1)
+        self.retried += 1
+        self.logger.log_warning(f'Geocoding the address {job.address_uuid} failed ({error}), retrying in {delay}s')
+        retry = GeocodingJob(job.address_uuid, job.attempt + 1)
+        asyncio.get_running_loop().call_later(delay, self._jobs.put_nowait, retry)
+
+    def _finish(self, job: GeocodingJob, enqueued_at: Optional[float]) -> None:
+        self._pending.pop(job.address_uuid, None)
+        if enqueued_at is not None:
+            self.last_lag_seconds = monotonic() - enqueued_at
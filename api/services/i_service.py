@@ -1,5 +1,5 @@
 from abc import abstractmethod
-from typing import TypeVar, Generic, List
+from typing import Optional, TypeVar, Generic, List
 from uuid import UUID
 from api.controllers.models.base_request_model import BaseRequestModel
 from api.controllers.models.base_response_model import BaseResponseModel
@@ -53,15 +53,16 @@ class IService(Generic[REQUEST, RESPONSE]):
         raise NotImplementedError("Subclasses must implement 'get'")
 
     @abstractmethod
-    async def list(self, page: int = 1, per_page: int = 10) -> ServiceResponse[List[RESPONSE]]:
+    async def list(self, page: int = 1, per_page: int = 10, cursor: Optional[str] = None) -> ServiceResponse[List[RESPONSE]]:
         '''List all active entities with pagination.
 
         Args:
             page: The page number to retrieve (1-indexed). Defaults to 1.
             per_page: The number of entities per page. Defaults to 10.
+            cursor: Opaque keyset cursor returned by the previous page. When informed, `page` is ignored.
 
         Returns:
-            A list of active entities for the specified page.
+            A list of active entities for the specified page, with the `next_cursor` of the following page.
 
         Raises:
             NotImplementedError: If not implemented by a subclass.
@@ -83,6 +84,25 @@ class IService(Generic[REQUEST, RESPONSE]):
             NotImplementedError: If not implemented by a subclass.
         '''
         raise NotImplementedError("Subclasses must implement 'update'")
+
+    @abstractmethod
+    async def patch(self, obj_id: UUID, request: BaseRequestModel) -> ServiceResponse[RESPONSE]:
+        '''Update only the fields set in the request of an existing active entity.
+
+        Args:
+            obj_id (UUID): The unique identifier of the entity to be changed.
+            request: A partial request model (see BaseRequestModel.partial), optionally
+                carrying the version of the entity the client read.
+
+        Returns:
+            ServiceResponse[RESPONSE]: The entity after the change.
+
+        Raises:
+            NotFoundException: If no active entity with the given UUID exists.
+            ConflictException: If the entity is no longer at the version sent.
+            NotImplementedError: If not implemented by a subclass.
+        '''
+        raise NotImplementedError("Subclasses must implement 'patch'")
     
     async def delete(self, obj_id: UUID) -> ServiceResponse[None]:
         '''Delete an existing active entity from the data store.
@@ -0,0 +1,72 @@
+from http import HTTPStatus
+from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncEngine
+from api.clients.cep_cache import CepCache
+from api.clients.google_buckets_client import GoogleStorageClientCacheManager
+from api.controllers.models.metrics.cep_cache_metrics_response_model import CepCacheMetricsResponseModel
+from api.controllers.models.metrics.db_pool_metrics_response_model import DbPoolMetricsResponseModel
+from api.controllers.models.metrics.geocoding_queue_metrics_response_model import GeocodingQueueMetricsResponseModel
+from api.controllers.models.metrics.signed_url_cache_metrics_response_model import SignedUrlCacheMetricsResponseModel
+from api.exceptions.not_found_exception import NotFoundException
+from api.services.geocoding_queue import GeocodingQueue
+from api.services.service_exception_catcher import ServiceExceptionCatcher
+from api.services.service_response import ServiceResponse
+from api.shared.logger import Logger
+
+
+class MetricsService:
+
+    catch = ServiceExceptionCatcher('MetricsService')
+
+    def __init__(self,
+                 engine: AsyncEngine,
+                 cep_cache: Optional[CepCache] = None,
+                 geocoding_queue: Optional[GeocodingQueue] = None,
+                 signed_url_cache: Optional[GoogleStorageClientCacheManager] = None):
+        self.engine = engine
+        self.cep_cache = cep_cache or CepCache()
+        self.geocoding_queue = geocoding_queue
+        self.signed_url_cache = signed_url_cache or GoogleStorageClientCacheManager.shared()
+        self.logger = Logger('MetricsService')
+
+    @catch
+    async def get_db_pool(self) -> ServiceResponse[DbPoolMetricsResponseModel]:
+        self.logger.log_debug('Reading the database connection pool metrics')
+        metrics = DbPoolMetricsResponseModel(**self.engine.pool.metrics())
+        return ServiceResponse(
+            status=HTTPStatus.OK,
+            message=f'{metrics.checked_out} conexões em uso e {metrics.idle} ociosas no pool',
+            payload=metrics
+        )
+
+    @catch
+    async def get_cep_cache(self) -> ServiceResponse[CepCacheMetricsResponseModel]:
+        self.logger.log_debug('Reading the CEP cache metrics')
+        metrics = CepCacheMetricsResponseModel(**self.cep_cache.stats())
+        return ServiceResponse(
+            status=HTTPStatus.OK,
+            message=f'{metrics.memory_hits + metrics.database_hits} consultas de CEP atendidas pelo cache e {metrics.misses} pelos Correios',
+            payload=metrics
+        )
+
+    @catch
+    async def get_geocoding_queue(self) -> ServiceResponse[GeocodingQueueMetricsResponseModel]:
+        self.logger.log_debug('Reading the geocoding queue metrics')
+        if self.geocoding_queue is None:
+            raise NotFoundException('A fila de geocodificação não está habilitada')
+        metrics = GeocodingQueueMetricsResponseModel(**self.geocoding_queue.metrics())
+        return ServiceResponse(
+            status=HTTPStatus.OK,
+            message=f'{metrics.depth} endereços aguardando geocodificação, o mais antigo há {metrics.lag_seconds}s',
+            payload=metrics
+        )
+
+    @catch
+    async def get_signed_url_cache(self) -> ServiceResponse[SignedUrlCacheMetricsResponseModel]:
+        self.logger.log_debug('Reading the signed URL cache metrics')
+        metrics = SignedUrlCacheMetricsResponseModel(**self.signed_url_cache.stats())
+        return ServiceResponse(
+            status=HTTPStatus.OK,
+            message=f'{metrics.size} URLs assinadas em cache, {metrics.hit_ratio:.1%} das leituras atendidas pelo cache',
+            payload=metrics
+        )
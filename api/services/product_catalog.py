@@ -0,0 +1,176 @@
+import asyncio
+import copy
+from bisect import bisect_left, insort
+from datetime import datetime
+from itertools import islice
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+from api.domain.entities.product import Product
+from api.enums.product_type import ProductType
+from api.exceptions.not_found_exception import NotFoundException
+from api.exceptions.validation_exception import ValidationException
+from api.infrastructure.repositories.product_repository import ProductRepository
+from api.infrastructure.request_session_scope import RequestSessionScope
+from api.shared.keyset_cursor import KeysetCursor
+from api.shared.logger import Logger
+from api.shared.prefix_index import PrefixIndex
+from api.shared.trigram_index import TrigramIndex
+
+
+class ProductCatalog:
+    '''In-memory copy of the active products, answering the product reads without the database.
+
+    The catalog is loaded when the app starts and kept up to date by ProductService on every
+    write it makes. Writes made by other workers are picked up by a periodic full reload, so
+    until then listings and searches may miss or show stale products for up to
+    `refresh_interval_seconds`. A product missing from the catalog is read from the database
+    by ProductService.get, so a product created by another worker can be opened right away.
+    Reads return copies, so callers can sign the images of a product without touching the
+    catalog. Listings follow the same order and pagination as ProductRepository.
+    '''
+
+    def __init__(self, session_scope: RequestSessionScope, refresh_interval_seconds: float = 300):
+        self.session_scope = session_scope
+        self.refresh_interval_seconds = refresh_interval_seconds
+        self.logger = Logger('ProductCatalog')
+        self.loaded: bool = False
+        self._products: Dict[UUID, Product] = {}
+        self._order: List[Tuple[datetime, UUID]] = []
+        self._index = TrigramIndex[UUID]()
+        self._prefixes = PrefixIndex[UUID]()
+        self._refresher: Optional[asyncio.Task] = None
+        self._writes_during_refresh: Optional[Dict[UUID, Optional[Product]]] = None
+
+    async def start(self) -> None:
+        try:
+            await self.refresh()
+        except Exception as ex:
+            self.logger.log_error(f'The product catalog could not be loaded, reading products from the database: {ex}')
+        if self._refresher is None or self._refresher.done():
+            self._refresher = asyncio.create_task(self._refresh_periodically(), name='product-catalog-refresher')
+
+    async def stop(self) -> None:
+        if self._refresher is None:
+            return
+        self._refresher.cancel()
+        try:
+            await self._refresher
+        except asyncio.CancelledError:
+            pass
+        self._refresher = None
+
+    async def refresh(self) -> None:
+        '''Reload every active product, replacing the catalog only once the new one is complete.
+
+        Writes recorded while the products are being read are replayed on the new catalog, so a
+        reload that started before a write committed does not bring the old version back.
+        '''
+        self._writes_during_refresh = {}
+        try:
+            async with self.session_scope.begin() as session:
+                products = await ProductRepository(session).list_active()
+            catalog = ProductCatalog(self.session_scope, self.refresh_interval_seconds)
+            for product in products:
+                catalog.upsert(product)
+            for product_uuid, product in self._writes_during_refresh.items():
+                if product is None:
+                    catalog.remove(product_uuid)
+                else:
+                    catalog.upsert(product)
+        finally:
+            self._writes_during_refresh = None
+        self._products, self._order = catalog._products, catalog._order
+        self._index, self._prefixes = catalog._index, catalog._prefixes
+        self.loaded = True
+        self.logger.log_info(f'{len(self._products)} products were loaded in the catalog')
+
+    def upsert(self, product: Product) -> None:
+        if not product.active:
+            self.remove(product.uuid)
+            return
+        self.remove(product.uuid)
+        snapshot = self._copy(product)
+        if self._writes_during_refresh is not None:
+            self._writes_during_refresh[snapshot.uuid] = snapshot
+        self._products[product.uuid] = snapshot
+        insort(self._order, (snapshot.created_at, snapshot.uuid))
+        self._index.add(snapshot.uuid, snapshot.search_name)
+        self._prefixes.add(snapshot.uuid, snapshot.search_name)
+
+    def remove(self, product_uuid: UUID | str) -> None:
+        product_uuid = UUID(str(product_uuid))
+        if self._writes_during_refresh is not None:
+            self._writes_during_refresh[product_uuid] = None
+        product = self._products.pop(product_uuid, None)
+        if product is None:
+            return
+        position = bisect_left(self._order, (product.created_at, product.uuid))
+        del self._order[position]
+        self._index.remove(product_uuid)
+        self._prefixes.remove(product_uuid)
+
+    def get(self, product_uuid: UUID | str) -> Product:
+        product = self._products.get(UUID(str(product_uuid)))
+        if product is None:
+            raise NotFoundException(f'Nenhum registro com o id {product_uuid} foi encontrado')
+        return self._copy(product)
+
+    def list(self, page: int = 1, per_page: int = 10, cursor: Optional[str] = None) -> List[Product]:
+        return self._paginate(ProductType.ANY, page, per_page, cursor)
+
+    def list_by_name_and_type(
+        self,
+        name: str = '*',
+        type: ProductType = ProductType.ANY,
+        page: int = 1,
+        per_page: int = 30,
+        cursor: Optional[str] = None
+    ) -> List[Product]:
+        if name == '*':
+            return self._paginate(type, page, per_page, cursor)
+        if cursor:
+            raise ValidationException('A busca por nome é paginada por página, não por cursor')
+        matches = [
+            (similarity, self._products[product_uuid])
+            for product_uuid, similarity in self._index.search(name)
+            if type in (ProductType.ANY, self._products[product_uuid].type)
+        ]
+        matches.sort(key=lambda match: (match[0], match[1].created_at, match[1].uuid), reverse=True)
+        start = (max(page, 1) - 1) * per_page
+        return [self._copy(product) for _, product in matches[start:start + per_page]]
+
+    def autocomplete(self, prefix: str, limit: int = 10) -> List[Product]:
+        '''Return up to `limit` products whose search name, or one of its words, starts with `prefix`.'''
+        return [self._copy(self._products[product_uuid]) for product_uuid in self._prefixes.search(prefix, limit)]
+
+    def __len__(self) -> int:
+        return len(self._products)
+
+    def _paginate(self, type: ProductType, page: int, per_page: int, cursor: Optional[str]) -> List[Product]:
+        '''Walk the products newest first from the cursor position (or skip the previous pages).'''
+        end = len(self._order)
+        skip = 0
+        if cursor:
+            position = KeysetCursor.decode(cursor)
+            end = bisect_left(self._order, (position.created_at, position.uuid))
+        else:
+            skip = (max(page, 1) - 1) * per_page
+        products = (self._products[self._order[i][1]] for i in range(end - 1, -1, -1))
+        if type != ProductType.ANY:
+            products = (product for product in products if product.type == type)
+        return [self._copy(product) for product in islice(products, skip, skip + per_page)]
+
+    async def _refresh_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.refresh_interval_seconds)
+            try:
+                await self.refresh()
+            except Exception as ex:
+                self.logger.log_warning(f'The product catalog could not be refreshed: {ex}')
+
+    @staticmethod
+    def _copy(product: Product) -> Product:
+        clone = copy.copy(product)
+        clone.images = list(product.images)
+        clone.mark_clean()
+        return clone
@@ -4,13 +4,17 @@ from api.clients.google_buckets_client import GoogleBucketsClient
 from api.enums.bucket_name import BucketName
 from api.services.service_exception_catcher import ServiceExceptionCatcher
 from api.services.service_response import ServiceResponse
+from api.controllers.models.product.product_autocomplete_response_model import ProductAutocompleteResponseModel
 from api.controllers.models.product.product_request_model import ProductRequestModel
 from api.controllers.models.product.product_response_model import ProductResponseModel
 from api.infrastructure.repositories.product_repository import ProductRepository
 from api.domain.entities.product import Product
 from api.enums.product_type import ProductType
+from api.exceptions.not_found_exception import NotFoundException
 from api.services.base_service import BaseService
-from typing import List
+from api.services.product_catalog import ProductCatalog
+from api.shared.keyset_cursor import KeysetCursor
+from typing import List, Optional
 
 
 
@@ -18,19 +22,75 @@ class ProductService(BaseService[ProductRequestModel, ProductResponseModel, Prod
 
     catch = ServiceExceptionCatcher('ProductService')
 
-    def __init__(self, product_repository: ProductRepository):
+    def __init__(self, product_repository: ProductRepository, catalog: Optional[ProductCatalog] = None):
         super().__init__(product_repository, Product, ProductResponseModel)
         self.bucket_client = GoogleBucketsClient(BucketName.PRODUCT_IMAGES)
-    
-    async def list_by_name_and_type(self, name: str = '*', type: ProductType = ProductType.ANY, page: int = 1, per_page: int = 30) -> ServiceResponse[List[Product]]:
-        products = await self.repository.list_by_name_and_type(name, type, page, per_page)
+        self.catalog = catalog
+
+    @property
+    def catalog_loaded(self) -> bool:
+        return self.catalog is not None and self.catalog.loaded
+
+    @catch
+    async def create(self, request: ProductRequestModel) -> ServiceResponse[ProductResponseModel]:
+        self.logger.log_info('Creating a new product')
+        product = Product(**request.model_dump())
+        product.validate()
+        await self.repository.create(product)
+        self._write_through(product)
+        response = self.response_model(**product.to_dict())
+        return ServiceResponse(status=HTTPStatus.CREATED, message=f'O registro {product.uuid} foi criado com sucesso', payload=response)
+
+    @catch
+    async def update(self, obj_id: UUID, request: ProductRequestModel) -> ServiceResponse[ProductResponseModel]:
+        self.logger.log_info(f'Updating the product {obj_id}')
+        product: Product = await self.repository.get(obj_id)
+        self._raise_not_found_when_none(product, obj_id)
+        product.update(**request.model_dump())
+        await self.repository.update(product)
+        self._write_through(product)
+        response = self.response_model(**product.to_dict())
+        return ServiceResponse(status=HTTPStatus.OK, message='O registro foi atualizado com sucesso', payload=response)
+
+    @catch
+    async def delete(self, obj_id: UUID) -> ServiceResponse[None]:
+        service_response = await super().delete(obj_id)
+        if self.catalog is not None:
+            self.catalog.remove(obj_id)
+        return service_response
+
+    async def list_by_name_and_type(self, name: str = '*', type: ProductType = ProductType.ANY, page: int = 1, per_page: int = 30,
+                                    cursor: Optional[str] = None) -> ServiceResponse[List[Product]]:
+        if self.catalog_loaded:
+            products = self.catalog.list_by_name_and_type(name, type, page, per_page, cursor)
+        else:
+            products = await self.repository.list_by_name_and_type(name, type, page, per_page, cursor)
+        next_cursor = KeysetCursor.next_after(products, per_page) if name == '*' else None
         await self.sign_products_images(products)
         return ServiceResponse(
             status=HTTPStatus.OK,
             message=f'{len(products)} produtos foram encontrados relacionados relacionados com o nome: {name} e tipo {type.value}',
-            payload=self._convert_many_to_response(products)
+            payload=self._convert_many_to_response(products),
+            next_cursor=next_cursor
         )
     
+    @catch
+    async def autocomplete(self, prefix: str, limit: int = 10) -> ServiceResponse[List[ProductAutocompleteResponseModel]]:
+        '''Complete a product name as it is typed, without images so nothing has to be signed.'''
+        if self.catalog_loaded:
+            products = self.catalog.autocomplete(prefix, limit)
+        else:
+            products = await self.repository.list_by_name_and_type(prefix, per_page=limit) if prefix.strip() else []
+        suggestions = [
+            ProductAutocompleteResponseModel(uuid=product.uuid, name=product.name, search_name=product.search_name)
+            for product in products
+        ]
+        return ServiceResponse(
+            status=HTTPStatus.OK,
+            message=f'{len(suggestions)} produtos começam com "{prefix}"',
+            payload=suggestions
+        )
+
     @catch
     async def upload_picture(self, product_uuid: UUID, image_bytes: bytes, file_name: str) -> ServiceResponse[ProductResponseModel]:
         self.logger.log_info(f'Uploading a new image for the product {product_uuid}')
@@ -41,6 +101,7 @@ class ProductService(BaseService[ProductRequestModel, ProductResponseModel, Prod
         )
         product.add_image(new_blob_name)
         await self.repository.update(product)
+        self._write_through(product)
         response = self.response_model(**product.to_dict())
         return ServiceResponse(
             status=HTTPStatus.OK,
@@ -56,6 +117,7 @@ class ProductService(BaseService[ProductRequestModel, ProductResponseModel, Prod
         await self.bucket_client.delete_image(blob_name=blob_name)
         product.delete_image(blob_name)
         await self.repository.update(product)
+        self._write_through(product)
         response = self.response_model(**product.to_dict())
         return ServiceResponse(
             status=HTTPStatus.OK,
@@ -66,30 +128,56 @@ class ProductService(BaseService[ProductRequestModel, ProductResponseModel, Prod
     @catch
     async def get(self, obj_id: UUID) -> ServiceResponse[ProductResponseModel]:
         self.logger.log_info(f'Reading from id {obj_id}')
-        product: Product = await self.repository.get(obj_id)
+        product: Product = await self._get_from_catalog(obj_id) if self.catalog_loaded else await self.repository.get(obj_id)
         await self.sign_product_images(product)
         self._raise_not_found_when_none(product, obj_id)
         response = self.response_model(**product.to_dict())
         return ServiceResponse(status=HTTPStatus.OK, message=f'O produto {obj_id} foi encontrado com sucesso', payload=response)
 
     @catch
-    async def list(self, page: int = 1, per_page: int = 10) -> ServiceResponse[List[ProductResponseModel]]:
-        self.logger.log_info(f'Reading many products. Page: {page}, per page: {per_page}')
-        products = await self.repository.list(page, per_page)
-        await self.__sign_products_images(products)
+    async def list(self, page: int = 1, per_page: int = 10, cursor: Optional[str] = None) -> ServiceResponse[List[ProductResponseModel]]:
+        self.logger.log_info(f'Reading many products. Page: {page}, per page: {per_page}, cursor: {cursor}')
+        if self.catalog_loaded:
+            products = self.catalog.list(page, per_page, cursor)
+        else:
+            products = await self.repository.list(page, per_page, cursor)
+        next_cursor = KeysetCursor.next_after(products, per_page)
+        await self.sign_products_images(products)
         products_response = self._convert_many_to_response(products)
-        return ServiceResponse(status=HTTPStatus.OK, message=f'Leu {len(products_response)} produtos com sucesso', payload=products_response)
+        return ServiceResponse(
+            status=HTTPStatus.OK,
+            message=f'Leu {len(products_response)} produtos com sucesso',
+            payload=products_response,
+            next_cursor=next_cursor
+        )
 
     async def sign_products_images(self, products: List[Product]) -> None:
+        '''Replace the blob names of every product image by signed URLs, signing the whole page in one batch.'''
+        blob_names = [image for product in products for image in product.images]
+        if not blob_names:
+            return
+        signed_urls = await self.bucket_client.read_images(blob_names)
         for product in products:
-            await self.sign_product_images(product)
+            product.images = [signed_urls[image] for image in product.images]
 
     async def sign_product_images(self, product: Product) -> None:
-        images: List[str] = product.images
-        signed_image_urls: List[str] = []
-        for img in images:
-            signed_image: str = await self.bucket_client.read_image(img)
-            signed_image_urls.append(signed_image)
-        product.images = signed_image_urls
+        await self.sign_products_images([product])
 
     
+
+    async def _apply_patch(self, product: Product, values: dict) -> None:
+        await super()._apply_patch(product, values)
+        self._write_through(product)
+
+    async def _get_from_catalog(self, obj_id: UUID) -> Product:
+        '''Products written by other workers only reach the catalog on its next reload, so a miss is read from the database and kept.'''
+        try:
+            return self.catalog.get(obj_id)
+        except NotFoundException:
+            product = await self.repository.get(obj_id)
+            self.catalog.upsert(product)
+            return product
+
+    def _write_through(self, product: Product) -> None:
+        if self.catalog is not None:
+            self.catalog.upsert(product)
@@ -1,6 +1,6 @@
-from typing import List
+from typing import List, Optional
 from uuid import UUID
-from api.controllers.models.demand.demand_response_model import DemandResponseModel
+from api.controllers.models.demand.demand_summary_response_model import DemandSummaryResponseModel
 from api.controllers.models.post.post_response_model import PostResponseModel
 from api.controllers.models.user.user_response_model import UserResponseModel
 from api.enums.demand_status import DemandStatus
@@ -23,17 +23,19 @@ class ReelService():
                         page: int = 1,
                         per_page: int = 20,
                         radius_meters: int = 10000,
-                        product_type: ProductType = ProductType.ANY) -> ServiceResponse[PostResponseModel]:
-        service_response = await self.demand_service.list_by_store(user, store_uuid, status, page, per_page, radius_meters, product_type)
+                        product_type: ProductType = ProductType.ANY,
+                        cursor: Optional[str] = None) -> ServiceResponse[PostResponseModel]:
+        service_response = await self.demand_service.list_by_store(user, store_uuid, status, page, per_page, radius_meters, product_type, cursor)
         demands = service_response.payload or []
         posts = self.convert_demands_to_post_response(demands)
         return ServiceResponse(
             status=service_response.status,
             message=f'Found {len(demands)} posts for the store {store_uuid}',
-            payload=posts
+            payload=posts,
+            next_cursor=service_response.next_cursor
         )
 
-    def convert_demands_to_post_response(self, demands: List[DemandResponseModel]) -> List[PostResponseModel]:
+    def convert_demands_to_post_response(self, demands: List[DemandSummaryResponseModel]) -> List[PostResponseModel]:
         posts = []
         for demand in demands:
             post = PostResponseModel(**demand.model_dump())
@@ -1,11 +1,12 @@
 from http import HTTPStatus
-from typing import Generic, TypeVar
+from typing import Generic, Optional, TypeVar
 
 T = TypeVar('T')
 
 class ServiceResponse(Generic[T]):
 
-    def __init__(self, status: HTTPStatus, message: str, payload: T = None):
+    def __init__(self, status: HTTPStatus, message: str, payload: T = None, next_cursor: Optional[str] = None):
         self.status: HTTPStatus = status
         self.message: str = message
-        self.payload: T = payload
\ No newline at end of file
+        self.payload: T = payload
+        self.next_cursor: Optional[str] = next_cursor
\ No newline at end of file
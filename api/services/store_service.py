@@ -1,9 +1,10 @@
 from http import HTTPStatus
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 from api.clients.receita_client import ReceitaClient
 from api.controllers.models.store.store_request_model import StoreRequestModel
 from api.controllers.models.store.store_response_model import StoreResponseModel
+from api.controllers.models.store.store_summary_response_model import StoreSummaryResponseModel
 from api.controllers.models.user.user_response_model import UserResponseModel
 from api.domain.entities.address import Address
 from api.domain.entities.store import Store
@@ -12,34 +13,42 @@ from api.exceptions.validation_exception import ValidationException
 from api.infrastructure.repositories.address_repository import AddressRepository
 from api.infrastructure.repositories.store_repository import StoreRepository
 from api.infrastructure.repositories.user_repository import UserRepository
+from api.infrastructure.request_session_scope import RequestSessionScope
 from api.services.base_service import BaseService
 from api.services.service_exception_catcher import ServiceExceptionCatcher
 from api.services.service_response import ServiceResponse
+from api.shared.keyset_cursor import KeysetCursor
 
 
 class StoreService(BaseService[StoreRequestModel, StoreResponseModel, Store]):
 
     catch = ServiceExceptionCatcher('StoreServiceExceptionCatcher')
 
+    UPDATABLE_FIELDS = ('address_uuid', 'preferred_phone_contact', 'preferred_email_contact', 'images')
+
     def __init__(
         self,
         store_repository: StoreRepository,
         user_repository: UserRepository,
-        address_repository: AddressRepository
+        address_repository: AddressRepository,
+        session_scope: RequestSessionScope
     ):
         super().__init__(store_repository, Store, StoreResponseModel)
         self.user_repo = user_repository
         self.address_repo = address_repository
+        self.session_scope = session_scope
     
     @catch
     async def create(self, request: StoreRequestModel) -> ServiceResponse[StoreResponseModel]:
         self.logger.log_info('Creating a Store')
-        store: Store = await self.repository.get_by_cnpj(request.cnpj)
+        store, owner, address = await self.session_scope.gather(
+            self.repository.get_by_cnpj(request.cnpj),
+            self.user_repo.get(request.owner_uuid),
+            self.address_repo.get(request.address_uuid)
+        )
         if store:
             raise ValidationException(message=f'A loja {request.cnpj} já possui um cadastro no sistema, não é possível cadastrá-la novamente.')
-        owner = await self.user_repo.get(request.owner_uuid)
         self._raise_not_found_when_none(owner, request.owner_uuid)
-        address = await self.address_repo.get(request.address_uuid)
         self._raise_not_found_when_none(address, request.address_uuid)
         store = Store(
             cnpj=request.cnpj,
@@ -68,16 +77,29 @@ class StoreService(BaseService[StoreRequestModel, StoreResponseModel, Store]):
         )
     
     @catch
-    async def list_by_user(self, user_uuid: UUID, page: int = 1, per_page: int = 10) -> ServiceResponse[List[StoreResponseModel]]:
+    async def list(self, page: int = 1, per_page: int = 10, cursor: Optional[str] = None) -> ServiceResponse[List[StoreSummaryResponseModel]]:
+        '''List the stores as summaries, without their legal data nor the owners' full records.'''
+        self.logger.log_info(f'Listing store summaries. Page: {page}, per page: {per_page}, cursor: {cursor}')
+        stores = await self.repository.list_summaries(page, per_page, cursor)
+        return ServiceResponse(
+            status=HTTPStatus.OK,
+            message=f'Leu {len(stores)} registros com sucesso',
+            payload=[StoreSummaryResponseModel(**store.to_dict()) for store in stores],
+            next_cursor=KeysetCursor.next_after(stores, per_page)
+        )
+
+    @catch
+    async def list_by_user(self, user_uuid: UUID, page: int = 1, per_page: int = 10, cursor: Optional[str] = None) -> ServiceResponse[List[StoreResponseModel]]:
         user = await self.user_repo.get(user_uuid)
         stores: List[Store] = []
         if user.user_access == UserAccess.ADMIN or user.user_access == UserAccess.STORE_OWNER:
-            stores = await self.repository.list_by_owner(user_uuid, page, per_page)
+            stores = await self.repository.list_by_owner(user_uuid, page, per_page, cursor)
         self.logger.log_debug(f'Found {len(stores)} for the user {user.uuid}')
         return ServiceResponse(
             status=HTTPStatus.OK,
             message=f'{len(stores)} pontos de venda foram encontrados relacionados ao usuário {user_uuid}',
-            payload=self._convert_many_to_response(stores)
+            payload=self._convert_many_to_response(stores),
+            next_cursor=KeysetCursor.next_after(stores, per_page)
         )
     
     @catch
@@ -93,32 +115,34 @@ class StoreService(BaseService[StoreRequestModel, StoreResponseModel, Store]):
     @catch
     async def update(self, obj_id: UUID, request: StoreRequestModel, user: UserResponseModel) -> ServiceResponse[StoreResponseModel]:
         store = await self.repository.get(obj_id)
-        if not (user.user_access == UserAccess.ADMIN or user.uuid == store.owner):
-            raise ValidationException(f'O usuário {user.email} não possui o privilégio necessário para alterar os dados uma empresa')
-        updatable_values = {
-            'address_uuid': request.address_uuid,
-            'preferred_phone_contact': request.preferred_phone_contact,
-            'preferred_email_contact': request.preferred_email_contact,
-            'images': request.images
-        }
-        address_changed: bool = request.address_uuid != store.address.uuid
-        old_address: UUID = store.address
-        store.update(**updatable_values)
-        store.validate()
-        await self.repository.update(store)
-        if address_changed:
-            await self._deactivate_address(old_address)
+        self._raise_unless_owner(store, user, 'alterar os dados de')
+        await self._apply_patch(store, {field: getattr(request, field) for field in self.UPDATABLE_FIELDS})
         return ServiceResponse(
             status=HTTPStatus.OK,
             message=f'A empresa {store.legal_name} foi atualizada com sucesso',
-            payload=StoreResponseModel(store.to_dict())
+            payload=StoreResponseModel(**store.to_dict())
         )
-    
+
+    @catch
+    async def patch(self, obj_id: UUID, request: StoreRequestModel, user: UserResponseModel) -> ServiceResponse[StoreResponseModel]:
+        store = await self.repository.get(obj_id)
+        self._raise_unless_owner(store, user, 'alterar os dados de')
+        values = request.model_dump(exclude_unset=True)
+        self._raise_conflict_when_stale(store, values.pop('version', None))
+        locked_fields = sorted(set(values) - set(self.UPDATABLE_FIELDS))
+        if locked_fields:
+            raise ValidationException(f'Os campos {", ".join(locked_fields)} de uma empresa não podem ser alterados')
+        await self._apply_patch(store, values)
+        return ServiceResponse(
+            status=HTTPStatus.OK,
+            message=f'A empresa {store.legal_name} foi atualizada com sucesso',
+            payload=StoreResponseModel(**store.to_dict())
+        )
+
     @catch
     async def delete(self, obj_id: UUID, user: UserResponseModel) -> ServiceResponse[None]:
         store = await self.repository.get(obj_id)
-        if not (user.user_access == UserAccess.ADMIN or user.uuid == store.owner):
-            raise ValidationException(f'O usuário {user.email} não possui o privilégio necessário para excluir uma empresa')
+        self._raise_unless_owner(store, user, 'excluir')
         store.deactivate()
         await self.repository.update(store)
         await self._deactivate_address(store.address)
@@ -127,6 +151,22 @@ class StoreService(BaseService[StoreRequestModel, StoreResponseModel, Store]):
             message=f'A empresa {store.legal_name} foi excluída com sucesso'
         )
     
+    async def _apply_patch(self, store: Store, values: dict) -> None:
+        old_address: Address = store.address
+        address_uuid = values.pop('address_uuid', None)
+        address_changed = address_uuid is not None and str(address_uuid) != str(old_address.uuid)
+        if address_changed:
+            store.address = await self.address_repo.get(address_uuid)
+        store.update(**values)
+        store.validate()
+        await self.repository.update(store)
+        if address_changed:
+            await self._deactivate_address(old_address)
+
+    def _raise_unless_owner(self, store: Store, user: UserResponseModel, action: str) -> None:
+        if not (user.user_access == UserAccess.ADMIN or str(user.uuid) == str(store.owner.uuid)):
+            raise ValidationException(f'O usuário {user.email} não possui o privilégio necessário para {action} uma empresa')
+
     async def _deactivate_address(self, address: Address) -> None:
         self.logger.log_info(f'Deactivating the address {address.uuid}')
         address.deactivate()
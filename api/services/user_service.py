@@ -11,6 +11,9 @@ from api.services.base_service import BaseService
 from api.services.service_exception_catcher import ServiceExceptionCatcher
 from api.services.service_response import ServiceResponse
 from http import HTTPStatus
+from typing import Optional
+from uuid import UUID
+from api.shared.lru_ttl_cache import LruTtlCache
 from api.shared.password_hasher import PasswordHasher
 
 
@@ -18,16 +21,37 @@ class UserService(BaseService[UserRequestModel, UserResponseModel, User]):
 
     catch = ServiceExceptionCatcher('UserService')
 
-    def __init__(self, user_repository: UserRepository):
+    def __init__(self, user_repository: UserRepository, sessions_cache: Optional[LruTtlCache[str, UserResponseModel]] = None):
         super().__init__(user_repository, User, UserResponseModel)
         self.bucket_client = GoogleBucketsClient(BucketName.USER_PROFILE)
+        self.sessions_cache = sessions_cache
+
+    @catch
+    async def update(self, obj_id: UUID, request: UserRequestModel) -> ServiceResponse[UserResponseModel]:
+        service_response = await super().update(obj_id, request)
+        self._forget_sessions(obj_id)
+        return service_response
+
+    @catch
+    async def patch(self, obj_id: UUID, request: UserRequestModel) -> ServiceResponse[UserResponseModel]:
+        if 'password' in request.model_fields_set:
+            raise ValidationException('A senha deve ser alterada pela atualização do perfil')
+        service_response = await super().patch(obj_id, request)
+        self._forget_sessions(obj_id)
+        return service_response
+
+    @catch
+    async def delete(self, obj_id: UUID) -> ServiceResponse[None]:
+        service_response = await super().delete(obj_id)
+        self._forget_sessions(obj_id)
+        return service_response
 
     @catch
     async def create(self, request: UserRequestModel) -> ServiceResponse[UserResponseModel]:
         self.logger.log_info('Creating a new record')
         user: User = User(**request.model_dump())
         user.validate()
-        user.hash_password()
+        await user.hash_password_async()
         service_response = await self.get_by_email(user.email)
         if service_response.payload:
             raise ValidationException(f'O e-mail {user.email} já está cadastrado no sistema')
@@ -58,6 +82,7 @@ class UserService(BaseService[UserRequestModel, UserResponseModel, User]):
         )
         user.profile_picture = new_blob_name
         await self.repository.update(user)
+        self._forget_sessions(user_uuid)
         response = self.response_model(**user.to_dict())
         return ServiceResponse(
             status=HTTPStatus.OK,
@@ -83,18 +108,25 @@ class UserService(BaseService[UserRequestModel, UserResponseModel, User]):
             self.logger.log_warning(f'The user {requester.uuid} tried to update the profile of the user {request.uuid}')
             raise ValidationException('Não é possível alterar dados de outros usuários')
         user: User = await self.repository.get(request.uuid)
-        password_hasher = PasswordHasher()
-        current_password_matches: bool = password_hasher.verify(request.current_password, user.password)
+        current_password_matches: bool = await PasswordHasher.verify_async(request.current_password, user.password)
         if not current_password_matches:
             raise ValidationException('A senha atual está incorreta')
         user.update(**request.model_dump())
         user.validate()
-        user.hash_password()
+        await user.hash_password_async()
         self.logger.log_debug(f'The properties are valid and ready to be updated for the user {user.email}')
         await self.repository.update(user)
+        self._forget_sessions(user.uuid)
         self.logger.log_debug(f'The user {user.email} was successfully updated')
         return ServiceResponse(
             status=HTTPStatus.OK,
             message=f'O usuário {user.email} foi atualizado com sucesso',
             payload=UserResponseModel(**user.to_dict())
-        )
\ No newline at end of file
+        )
+
+    def _forget_sessions(self, user_uuid: UUID | str) -> None:
+        '''Drop the cached sessions of the user so the next request reads the changed record.'''
+        if self.sessions_cache is None:
+            return
+        removed = self.sessions_cache.remove_where(lambda _, user: str(user.uuid) == str(user_uuid))
+        self.logger.log_debug(f'{removed} cached sessions of the user {user_uuid} were dropped')
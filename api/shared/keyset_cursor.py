@@ -0,0 +1,41 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+from api.exceptions.validation_exception import ValidationException
+
+
+class KeysetCursor:
+    '''Opaque pagination cursor pointing right after a (created_at, uuid) position.
+
+    Listings are ordered by created_at and uuid (newest first), so the next page is
+    everything strictly "older" than the last row returned, which an index can seek
+    to directly instead of skipping OFFSET rows.
+    '''
+
+    def __init__(self, created_at: datetime, uuid: UUID):
+        self.created_at: datetime = created_at
+        self.uuid: UUID = uuid
+
+    def encode(self) -> str:
+        raw = json.dumps({'c': self.created_at.isoformat(), 'u': str(self.uuid)}, separators=(',', ':'))
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+    @classmethod
+    def decode(cls, cursor: str) -> 'KeysetCursor':
+        try:
+            padding = '=' * (-len(cursor) % 4)
+            data = json.loads(base64.urlsafe_b64decode(cursor + padding))
+            return cls(datetime.fromisoformat(data['c']), UUID(data['u']))
+        except (binascii.Error, ValueError, TypeError, KeyError):
+            raise ValidationException(f'O cursor de paginação "{cursor}" é inválido')
+
+    @classmethod
+    def next_after(cls, entities: List, per_page: int) -> Optional[str]:
+        '''Return the cursor for the page following `entities`, or None when it was the last page.'''
+        if not entities or len(entities) < per_page:
+            return None
+        last = entities[-1]
+        return cls(last.created_at, last.uuid).encode()
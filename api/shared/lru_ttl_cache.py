@@ -0,0 +1,97 @@
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+from typing import Callable, Generic, Hashable, Optional, Tuple, TypeVar
+
+K = TypeVar('K', bound=Hashable)
+V = TypeVar('V')
+
+
+class LruTtlCache(Generic[K, V]):
+    '''Size-bounded, thread-safe LRU cache whose entries also expire after a time to live.
+
+    When the cache is full the least recently used entry is evicted. Expired entries are
+    dropped when they are read or when `sweep` runs.
+    '''
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        if max_size < 1:
+            raise ValueError('The cache must hold at least one entry')
+        self.max_size: int = max_size
+        self.ttl_seconds: float = ttl_seconds
+        self._entries: OrderedDict[K, Tuple[V, float]] = OrderedDict()
+        self._lock = Lock()
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self.expirations: int = 0
+
+    def get(self, key: K) -> Optional[V]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            value, expires_at = entry
+            if expires_at <= monotonic():
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: K, value: V, ttl_seconds: Optional[float] = None) -> None:
+        ttl = self.ttl_seconds if ttl_seconds is None else min(ttl_seconds, self.ttl_seconds)
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (value, monotonic() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def remove(self, key: K) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def remove_where(self, predicate: Callable[[K, V], bool]) -> int:
+        '''Remove every entry matching `predicate(key, value)` and return how many were removed.'''
+        with self._lock:
+            keys = [key for key, (value, _) in self._entries.items() if predicate(key, value)]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def sweep(self) -> int:
+        '''Drop the entries that already expired and return how many were dropped.'''
+        now = monotonic()
+        with self._lock:
+            keys = [key for key, (_, expires_at) in self._entries.items() if expires_at <= now]
+            for key in keys:
+                del self._entries[key]
+            self.expirations += len(keys)
+            return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'max_size': self.max_size,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_ratio': round(self.hits / lookups, 4) if lookups else 0.0,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+            }
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
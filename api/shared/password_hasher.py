@@ -1,7 +1,13 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
 from passlib.context import CryptContext
+from api.shared.env_variable_manager import EnvVariableManager
 
 class PasswordHasher:
     _pwd_context = CryptContext(schemes=['bcrypt'], deprecated='auto')
+    _executor: ThreadPoolExecutor | None = None
+    _executor_lock = Lock()
 
     @classmethod
     def hash(cls, password: str) -> str:
@@ -10,3 +16,24 @@ class PasswordHasher:
     @classmethod
     def verify(cls, plain_password: str, hashed_password: str) -> bool:
         return cls._pwd_context.verify(plain_password, hashed_password)
+
+    @classmethod
+    async def hash_async(cls, password: str) -> str:
+        '''Same as `hash`, but bcrypt runs on the hasher thread pool instead of blocking the event loop.'''
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(cls._get_executor(), cls.hash, password)
+
+    @classmethod
+    async def verify_async(cls, plain_password: str, hashed_password: str) -> bool:
+        '''Same as `verify`, but bcrypt runs on the hasher thread pool instead of blocking the event loop.'''
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(cls._get_executor(), cls.verify, plain_password, hashed_password)
+
+    @classmethod
+    def _get_executor(cls) -> ThreadPoolExecutor:
+        if cls._executor is None:
+            with cls._executor_lock:
+                if cls._executor is None:
+                    max_workers = EnvVariableManager().load('PASSWORD_HASHER_MAX_WORKERS', 4).integer()
+                    cls._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='password-hasher')
+        return cls._executor
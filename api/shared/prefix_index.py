@@ -0,0 +1,63 @@
+from bisect import bisect_left, insort
+from typing import Dict, Generic, Hashable, List, Tuple, TypeVar
+from api.shared.trigram_index import TrigramIndex
+
+K = TypeVar('K', bound=Hashable)
+
+
+class PrefixIndex(Generic[K]):
+    '''Sorted arrays of folded texts answering "starts with" lookups with a binary search.
+
+    Every text is indexed whole and from the start of each of its other words, so "fuji"
+    completes "Maçã Fuji". Matches on the start of the text come before matches on a later
+    word, each group in alphabetical order.
+    '''
+
+    def __init__(self):
+        self._texts: List[Tuple[str, K]] = []
+        self._words: List[Tuple[str, K]] = []
+        self._entries: Dict[K, str] = {}
+
+    def add(self, key: K, text: str) -> None:
+        self.remove(key)
+        folded = TrigramIndex.fold(text)
+        self._entries[key] = folded
+        insort(self._texts, (folded, key))
+        for suffix in self._word_suffixes(folded):
+            insort(self._words, (suffix, key))
+
+    def remove(self, key: K) -> None:
+        folded = self._entries.pop(key, None)
+        if folded is None:
+            return
+        self._delete(self._texts, (folded, key))
+        for suffix in self._word_suffixes(folded):
+            self._delete(self._words, (suffix, key))
+
+    def search(self, prefix: str, limit: int) -> List[K]:
+        folded_prefix = TrigramIndex.fold(prefix).strip()
+        if not folded_prefix or limit < 1:
+            return []
+        keys: Dict[K, None] = {}
+        for entries in (self._texts, self._words):
+            position = bisect_left(entries, (folded_prefix,))
+            while position < len(entries) and len(keys) < limit:
+                text, key = entries[position]
+                if not text.startswith(folded_prefix):
+                    break
+                keys.setdefault(key)
+                position += 1
+        return list(keys)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _word_suffixes(folded: str) -> List[str]:
+        return [folded[i:] for i in range(1, len(folded)) if folded[i - 1] == ' ' and folded[i] != ' ']
+
+    @staticmethod
+    def _delete(entries: List[Tuple[str, K]], entry: Tuple[str, K]) -> None:
+        position = bisect_left(entries, entry)
+        if position < len(entries) and entries[position] == entry:
+            del entries[position]
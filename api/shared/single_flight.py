@@ -0,0 +1,39 @@
+import asyncio
+from typing import Awaitable, Callable, Generic, Hashable, TypeVar
+
+V = TypeVar('V')
+
+
+class SingleFlight(Generic[V]):
+    '''Coalesces concurrent calls for the same key so only one of them does the work.
+
+    The first caller for a key runs `fetch`; callers arriving while it is in flight await
+    the same result (or exception) instead of starting their own call.
+    '''
+
+    def __init__(self):
+        self._in_flight: dict[Hashable, asyncio.Future] = {}
+
+    async def do(self, key: Hashable, fetch: Callable[[], Awaitable[V]]) -> V:
+        future = self._in_flight.get(key)
+        if future is not None:
+            return await asyncio.shield(future)
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            result = await fetch()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as ex:
+            future.set_exception(ex)
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._in_flight[key]
+
+    def __len__(self) -> int:
+        return len(self._in_flight)
@@ -0,0 +1,80 @@
+import unicodedata
+from typing import Dict, Generic, Hashable, List, Set, Tuple, TypeVar
+
+K = TypeVar('K', bound=Hashable)
+
+
+class TrigramIndex(Generic[K]):
+    '''In-memory, accent-insensitive substring index over short texts.
+
+    Texts are folded (accents stripped, lower-cased) and split into trigrams. A search
+    intersects the posting sets of the term's trigrams, confirms the substring match on
+    the few candidates left and ranks them by trigram similarity, mirroring what the
+    `pg_trgm` index does for the product search in the database.
+    '''
+
+    def __init__(self):
+        self._texts: Dict[K, str] = {}
+        self._postings: Dict[str, Set[K]] = {}
+
+    @staticmethod
+    def fold(text: str) -> str:
+        decomposed = unicodedata.normalize('NFKD', text)
+        return ''.join(char for char in decomposed if not unicodedata.combining(char)).lower()
+
+    def add(self, key: K, text: str) -> None:
+        self.remove(key)
+        folded = self.fold(text)
+        self._texts[key] = folded
+        for trigram in self._trigrams(folded):
+            self._postings.setdefault(trigram, set()).add(key)
+
+    def remove(self, key: K) -> None:
+        folded = self._texts.pop(key, None)
+        if folded is None:
+            return
+        for trigram in self._trigrams(folded):
+            keys = self._postings.get(trigram)
+            if keys is None:
+                continue
+            keys.discard(key)
+            if not keys:
+                del self._postings[trigram]
+
+    def search(self, term: str) -> List[Tuple[K, float]]:
+        '''Return the keys whose text contains `term` with their similarity to it, best first.'''
+        folded_term = self.fold(term)
+        trigrams = self._trigrams(folded_term)
+        if trigrams:
+            posting_sets = sorted((self._postings.get(trigram, set()) for trigram in trigrams), key=len)
+            candidates = set(posting_sets[0]).intersection(*posting_sets[1:])
+        else:
+            candidates = self._texts.keys()
+        term_words = self._word_trigrams(folded_term)
+        matches = [
+            (key, self._similarity(term_words, self._word_trigrams(self._texts[key])))
+            for key in candidates if folded_term in self._texts[key]
+        ]
+        matches.sort(key=lambda match: match[1], reverse=True)
+        return matches
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    @staticmethod
+    def _trigrams(folded: str) -> Set[str]:
+        return {folded[i:i + 3] for i in range(len(folded) - 2)}
+
+    @staticmethod
+    def _word_trigrams(folded: str) -> Set[str]:
+        '''Trigrams of each word padded like pg_trgm does, used only for ranking.'''
+        trigrams: Set[str] = set()
+        for word in folded.split():
+            padded = f'  {word} '
+            trigrams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+        return trigrams
+
+    @staticmethod
+    def _similarity(first: Set[str], second: Set[str]) -> float:
+        union = len(first | second)
+        return len(first & second) / union if union else 0.0
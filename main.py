@@ -1,6 +1,9 @@
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.responses import JSONResponse
 from api.api_router_builder import ApiRouterBuilder
+from api.clients.google_buckets_client import GoogleStorageClientCacheManager
+from api.clients.http_transport import HttpTransport
+from api.infrastructure.request_session_scope import RequestSessionMiddleware
 from api.shared.env_variable_manager import EnvVariableManager
 from api.shared.logger import Logger
 from fastapi.middleware.cors import CORSMiddleware
@@ -32,9 +35,17 @@ def create_app() -> FastAPI:
     )
     router_builder = ApiRouterBuilder()
     routers = router_builder.build()
+    app.add_middleware(RequestSessionMiddleware, session_scope=router_builder.session_scope)
     for router in routers:
         logger.log_debug(f'Including router: {router.prefix}')
         app.include_router(router)
+    app.add_event_handler('startup', router_builder.geocoding_queue.start)
+    app.add_event_handler('startup', GoogleStorageClientCacheManager.shared().start_sweeper)
+    app.add_event_handler('startup', router_builder.product_catalog.start)
+    app.add_event_handler('shutdown', router_builder.geocoding_queue.stop)
+    app.add_event_handler('shutdown', GoogleStorageClientCacheManager.shared().stop_sweeper)
+    app.add_event_handler('shutdown', router_builder.product_catalog.stop)
+    app.add_event_handler('shutdown', HttpTransport.close_shared)
     logger.log_info('All routers included. App is ready.')
     @app.exception_handler(HTTPException)
     async def custom_http_exception_handler(request: Request, exc: HTTPException):
@@ -0,0 +1,57 @@
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+from api.clients.cep_cache import CepCache
+
+
+class TestCepCache(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self) -> None:
+        self.repository = MagicMock()
+        self.repository.get = AsyncMock(return_value=None)
+        self.repository.save = AsyncMock()
+        repository_patcher = patch('api.clients.cep_cache.CepCacheRepository', return_value=self.repository)
+        self.repository_cls = repository_patcher.start()
+        self.addCleanup(repository_patcher.stop)
+        self.session_scope = MagicMock()
+        self.cache = CepCache(self.session_scope, max_size=10, ttl_seconds=3600, negative_ttl_seconds=60)
+        self.data = {'cep': '01001-000', 'logradouro': 'Praça da Sé'}
+
+    async def test_set_stores_in_memory_and_database(self) -> None:
+        await self.cache.set('01001000', self.data)
+        self.assertEqual(await self.cache.get('01001000'), self.data)
+        self.repository.save.assert_awaited_once()
+        self.repository.get.assert_not_awaited()
+        self.assertEqual(self.cache.stats()['memory_hits'], 1)
+
+    async def test_the_table_is_written_in_a_session_scope_of_its_own(self) -> None:
+        await self.cache.set('01001000', self.data)
+        self.session_scope.begin.assert_called_once_with()
+        self.repository_cls.assert_called_once_with(self.session_scope.begin.return_value.__aenter__.return_value)
+
+    async def test_get_falls_back_to_the_database_and_warms_memory(self) -> None:
+        self.repository.get.return_value = self.data
+        self.assertEqual(await self.cache.get('01001000'), self.data)
+        self.assertEqual(await self.cache.get('01001000'), self.data)
+        self.repository.get.assert_awaited_once_with('01001000')
+        stats = self.cache.stats()
+        self.assertEqual(stats['database_hits'], 1)
+        self.assertEqual(stats['memory_hits'], 1)
+
+    async def test_get_counts_a_miss_when_no_tier_has_the_cep(self) -> None:
+        self.assertIsNone(await self.cache.get('99999999'))
+        self.assertEqual(self.cache.stats()['misses'], 1)
+
+    async def test_negative_entries_use_the_negative_ttl(self) -> None:
+        await self.cache.set('99999999', {'erro': True})
+        expires_at = self.repository.save.await_args.args[2]
+        await self.cache.set('01001000', self.data)
+        self.assertLess(expires_at, self.repository.save.await_args.args[2])
+        await self.cache.get('99999999')
+        self.assertEqual(self.cache.stats()['negative_hits'], 1)
+
+    async def test_database_failures_do_not_break_lookups(self) -> None:
+        self.repository.get.side_effect = Exception('database down')
+        self.repository.save.side_effect = Exception('database down')
+        await self.cache.set('01001000', self.data)
+        self.assertEqual(await self.cache.get('01001000'), self.data)
+        self.assertIsNone(await self.cache.get('02002000'))
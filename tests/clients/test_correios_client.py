@@ -1,17 +1,26 @@
 import unittest
 from unittest.mock import AsyncMock, patch, MagicMock
+from api.clients.cep_cache import CepCache
 from api.clients.correios_client import CorreiosClient
+from api.clients.http_transport import HttpTransport
 from api.controllers.models.address.address_response_model import AddressResponseModel
 from api.exceptions.external_service_exception import ExternalServiceException
+from api.exceptions.not_found_exception import NotFoundException
 from api.shared.logger import Logger
 from api.shared.validator import Validator
-import json
+from tests.helper.stub_http_server import StubHttpServer
 
 
 class TestCorreiosClient(unittest.IsolatedAsyncioTestCase):
 
     def setUp(self):
-        self.client = CorreiosClient()
+        self.server = StubHttpServer().start()
+        self.transport = HttpTransport()
+        self.client = CorreiosClient(self.transport, self.server.base_url)
+
+    async def asyncTearDown(self) -> None:
+        await self.transport.close()
+        self.server.stop()
 
     @patch.object(Validator, 'on')
     @patch.object(CorreiosClient, '_fetch_data_from_correios', new_callable=AsyncMock)
@@ -40,13 +49,10 @@ class TestCorreiosClient(unittest.IsolatedAsyncioTestCase):
         self.assertIsNone(result.latitude)
         self.assertIsNone(result.longitude)
 
-    @patch('http.client.HTTPSConnection')
     @patch.object(Logger, 'log_info')
     @patch.object(Logger, 'log_error')
-    async def test_fetch_data_from_correios_successful_response(self, mock_log_error: MagicMock, mock_log_info: MagicMock, mock_https_conn_cls: MagicMock) -> None:
+    async def test_fetch_data_from_correios_successful_response(self, mock_log_error: MagicMock, mock_log_info: MagicMock) -> None:
         cep = '01001000'
-        mock_conn = MagicMock()
-        mock_https_conn_cls.return_value = mock_conn
         response_data = {
             'cep': '01001-000',
             'logradouro': 'Praça da Sé',
@@ -55,69 +61,56 @@ class TestCorreiosClient(unittest.IsolatedAsyncioTestCase):
             'uf': 'SP',
             'complemento': ''
         }
-        response_mock = MagicMock()
-        response_mock.status = 200
-        response_mock.read.side_effect = [
-            json.dumps(response_data).encode('utf-8'),
-            json.dumps(response_data).encode('utf-8')
-        ]
-        mock_conn.getresponse.return_value = response_mock
+        self.server.respond(f'/ws/{cep}/json/', body=response_data)
         result = await self.client._fetch_data_from_correios(cep)
-        mock_https_conn_cls.assert_called_once_with('viacep.com.br')
-        mock_conn.request.assert_called_once_with('GET', f'/ws/{cep}/json/')
-        mock_conn.getresponse.assert_called_once()
+        self.assertEqual(self.server.requests[0]['path'], f'/ws/{cep}/json/')
         mock_log_info.assert_any_call(f'Requesting ZIP code {cep} from Correios API...')
         mock_log_info.assert_any_call(f'ZIP code {cep} successfully retrieved.')
-        mock_conn.close.assert_called_once()
         self.assertEqual(result, response_data)
         mock_log_error.assert_not_called()
 
-    @patch('http.client.HTTPSConnection')
     @patch.object(Logger, 'log_error')
-    async def test_fetch_data_from_correios_http_error(self, mock_log_error: MagicMock, mock_https_conn_cls: MagicMock) -> None:
+    async def test_fetch_data_from_correios_http_error(self, mock_log_error: MagicMock) -> None:
         cep = '01001000'
-        mock_conn = MagicMock()
-        mock_https_conn_cls.return_value = mock_conn
-        response_mock = MagicMock()
-        response_mock.status = 500
-        response_mock.read.return_value = b'Server error'
-        mock_conn.getresponse.return_value = response_mock
+        self.server.respond(f'/ws/{cep}/json/', status=500, body=b'Server error')
         with self.assertRaises(ExternalServiceException) as cm:
             await self.client._fetch_data_from_correios(cep)
         mock_log_error.assert_any_call(f'HTTP error when fetching ZIP code {cep}: 500 - Server error')
         self.assertEqual(mock_log_error.call_count, 2)
-        mock_conn.close.assert_called_once()
         self.assertIn('Erro ao consultar o CEP', str(cm.exception))
 
-    @patch('http.client.HTTPSConnection')
     @patch.object(Logger, 'log_info')
-    async def test_fetch_data_from_correios_not_found(self, mock_log_info: MagicMock, mock_https_conn_cls: MagicMock) -> None:
+    async def test_fetch_data_from_correios_not_found(self, mock_log_info: MagicMock) -> None:
         cep = '01001000'
-        mock_conn = MagicMock()
-        mock_https_conn_cls.return_value = mock_conn
-        response_data = {'erro': True}
-        response_mock = MagicMock()
-        response_mock.status = 200
-        response_mock.read.side_effect = [
-            json.dumps(response_data).encode('utf-8'),
-            json.dumps(response_data).encode('utf-8')
-        ]
-        mock_conn.getresponse.return_value = response_mock
-        with self.assertRaises(ExternalServiceException) as cm:
+        self.server.respond(f'/ws/{cep}/json/', body={'erro': True})
+        with self.assertRaises(NotFoundException) as cm:
             await self.client._fetch_data_from_correios(cep)
         mock_log_info.assert_any_call(f'ZIP code {cep} not found.')
-        mock_conn.close.assert_called_once()
         self.assertIn('não foi encontrado', str(cm.exception))
 
-    @patch('http.client.HTTPSConnection')
     @patch.object(Logger, 'log_error')
-    async def test_fetch_data_from_correios_raises_external_service_exception_on_unexpected_error(self, mock_log_error: MagicMock, mock_https_conn_cls: MagicMock) -> None:
+    async def test_fetch_data_from_correios_raises_external_service_exception_on_unexpected_error(self, mock_log_error: MagicMock) -> None:
         cep = '01001000'
-        mock_conn = MagicMock()
-        mock_https_conn_cls.return_value = mock_conn
-        mock_conn.request.side_effect = Exception('Connection failure')
+        self.server.respond(f'/ws/{cep}/json/', body=b'not json')
         with self.assertRaises(ExternalServiceException) as cm:
             await self.client._fetch_data_from_correios(cep)
         mock_log_error.assert_called_once()
-        mock_conn.close.assert_called_once()
-        self.assertIn('Erro inesperado ao consultar o CEP', str(cm.exception))
\ No newline at end of file
+        self.assertIn('Erro inesperado ao consultar o CEP', str(cm.exception))
+
+    async def test_get_by_cep_is_served_from_the_cache_after_the_first_lookup(self) -> None:
+        self.client.cache = CepCache()
+        self.server.respond('/ws/01001000/json/', body={'cep': '01001-000', 'logradouro': 'Praça da Sé', 'uf': 'SP'})
+        first = await self.client.get_by_cep('01001-000')
+        second = await self.client.get_by_cep('01001000')
+        self.assertEqual(first, second)
+        self.assertEqual(len(self.server.requests), 1)
+        self.assertEqual(self.client.cache.stats()['memory_hits'], 1)
+
+    async def test_get_by_cep_caches_unknown_ceps(self) -> None:
+        self.client.cache = CepCache()
+        self.server.respond('/ws/99999999/json/', body={'erro': True})
+        for _ in range(2):
+            with self.assertRaises(NotFoundException):
+                await self.client.get_by_cep('99999-999')
+        self.assertEqual(len(self.server.requests), 1)
+        self.assertEqual(self.client.cache.stats()['negative_hits'], 1)
@@ -0,0 +1,60 @@
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+from api.clients.geocode_cache import GeocodeCache
+
+
+class TestGeocodeCache(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self) -> None:
+        self.repository = MagicMock()
+        self.repository.get = AsyncMock(return_value=None)
+        self.repository.save = AsyncMock()
+        repository_patcher = patch('api.clients.geocode_cache.GeocodeCacheRepository', return_value=self.repository)
+        self.repository_cls = repository_patcher.start()
+        self.addCleanup(repository_patcher.stop)
+        self.session_scope = MagicMock()
+        self.cache = GeocodeCache(self.session_scope, max_size=10, ttl_seconds=3600)
+        self.coordinates = (-23.55052, -46.633308)
+
+    async def test_get_or_fetch_fetches_once_and_then_serves_from_memory(self) -> None:
+        fetch = AsyncMock(return_value=self.coordinates)
+        self.assertEqual(await self.cache.get_or_fetch('rua a, sp', fetch), self.coordinates)
+        self.assertEqual(await self.cache.get_or_fetch('rua a, sp', fetch), self.coordinates)
+        fetch.assert_awaited_once()
+        self.repository.save.assert_awaited_once()
+        stats = self.cache.stats()
+        self.assertEqual(stats['misses'], 1)
+        self.assertEqual(stats['memory_hits'], 1)
+
+    async def test_the_table_is_read_and_written_in_session_scopes_of_their_own(self) -> None:
+        await self.cache.get_or_fetch('rua a, sp', AsyncMock(return_value=self.coordinates))
+        session = self.session_scope.begin.return_value.__aenter__.return_value
+        self.assertEqual(self.session_scope.begin.call_count, 2)
+        self.assertEqual(self.repository_cls.call_args_list, [((session,),), ((session,),)])
+
+    async def test_get_or_fetch_uses_the_database_before_the_upstream(self) -> None:
+        self.repository.get.return_value = self.coordinates
+        fetch = AsyncMock()
+        self.assertEqual(await self.cache.get_or_fetch('rua a, sp', fetch), self.coordinates)
+        fetch.assert_not_awaited()
+        self.assertEqual(self.cache.stats()['database_hits'], 1)
+
+    async def test_concurrent_misses_are_coalesced_into_one_upstream_call(self) -> None:
+        calls = 0
+
+        async def fetch() -> tuple[float, float]:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return self.coordinates
+
+        results = await asyncio.gather(*(self.cache.get_or_fetch('rua a, sp', fetch) for _ in range(20)))
+        self.assertEqual(set(results), {self.coordinates})
+        self.assertEqual(calls, 1)
+
+    async def test_database_failures_do_not_break_lookups(self) -> None:
+        self.repository.get.side_effect = Exception('database down')
+        self.repository.save.side_effect = Exception('database down')
+        fetch = AsyncMock(return_value=self.coordinates)
+        self.assertEqual(await self.cache.get_or_fetch('rua a, sp', fetch), self.coordinates)
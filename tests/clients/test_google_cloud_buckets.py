@@ -1,29 +1,36 @@
+import asyncio
 import unittest
+from datetime import datetime, timedelta, timezone
 from unittest.mock import patch, AsyncMock, MagicMock
-from api.clients.google_buckets_client import GoogleBucketsClient
+from api.clients.google_buckets_client import GoogleBucketsClient, GoogleStorageClientCacheManager
 from api.enums.bucket_name import BucketName
 from api.shared.logger import Logger
 from api.shared.env_variable_manager import EnvVariableManager
 
+BUCKET = BucketName.PRODUCT_IMAGES.value
+
 
 class TestGoogleBucketsClient(unittest.IsolatedAsyncioTestCase):
 
     def setUp(self) -> None:
         self.bucket_name = BucketName.PRODUCT_IMAGES
 
+    @patch.object(GoogleStorageClientCacheManager, 'shared')
     @patch.object(Logger, 'log_info')
     @patch.object(EnvVariableManager, 'load')
     @patch('google.oauth2.service_account.Credentials.from_service_account_file')
     @patch('google.cloud.storage.Client')
-    def test_init_sets_up_correctly(self, mock_storage_client_cls, mock_credentials: MagicMock, mock_env_load: MagicMock, mock_log_info: MagicMock) -> None:
+    def test_init_sets_up_correctly(self, mock_storage_client_cls, mock_credentials: MagicMock, mock_env_load: MagicMock, mock_log_info: MagicMock, mock_shared: MagicMock) -> None:
         mock_env_load.side_effect = [MagicMock(string=lambda: 'fake/path.json'), MagicMock(integer=lambda: 10800)]
         mock_client = MagicMock()
+        mock_client.api_endpoint = 'https://storage.googleapis.com'
         mock_bucket = MagicMock()
         mock_client.bucket.return_value = mock_bucket
         mock_storage_client_cls.return_value = mock_client
         client = GoogleBucketsClient(self.bucket_name)
         mock_log_info.assert_called_with(f'Using the bucket {self.bucket_name.value}')
         self.assertEqual(client.bucket, mock_bucket)
+        self.assertIs(client.manager, mock_shared.return_value)
 
     @patch('api.clients.google_buckets_client.time', return_value=1234567890)
     @patch('api.clients.google_buckets_client.uuid.uuid4', return_value='uuid')
@@ -49,10 +56,10 @@ class TestGoogleBucketsClient(unittest.IsolatedAsyncioTestCase):
     async def test_delete_image_blob_not_found(self, mock_bucket: MagicMock) -> None:
         client = GoogleBucketsClient(self.bucket_name)
         client.bucket = mock_bucket.return_value
-        client.manager = MagicMock()
+        client.manager = AsyncMock()
         mock_bucket.return_value.get_blob.return_value = None
         await client.delete_image('nonexistent.png')
-        client.manager.remove_cache.assert_not_called()
+        client.manager.remove_cache.assert_not_awaited()
 
     @patch('google.cloud.storage.Client.bucket')
     async def test_delete_image_success(self, mock_bucket: MagicMock) -> None:
@@ -61,38 +68,35 @@ class TestGoogleBucketsClient(unittest.IsolatedAsyncioTestCase):
         mock_bucket.return_value.get_blob.return_value = mock_blob
         client = GoogleBucketsClient(BucketName.PRODUCT_IMAGES)
         client.bucket = mock_bucket.return_value
-        client.manager = MagicMock()
+        client.manager = AsyncMock()
         await client.delete_image('exists.png')
-        client.manager.remove_cache.assert_called_once_with('exists.png')
+        client.manager.remove_cache.assert_awaited_once_with(BUCKET, 'exists.png')
         mock_blob.delete.assert_called_once()
 
     @patch.object(GoogleBucketsClient, 'save_image', new_callable=AsyncMock, return_value='new_blob.png')
     @patch.object(GoogleBucketsClient, 'delete_image', new_callable=AsyncMock)
     async def test_update_image_with_old_blob(self, mock_delete_image: MagicMock, mock_save_image: MagicMock) -> None:
         client = GoogleBucketsClient(self.bucket_name)
-        client.manager = MagicMock()
+        client.manager = AsyncMock()
         result = await client.update_image(b'data', 'img.png', 'old_blob.png')
         mock_delete_image.assert_awaited_once_with('old_blob.png')
-        client.manager.remove_cache.assert_called_once_with('old_blob.png')
+        client.manager.remove_cache.assert_awaited_once_with(BUCKET, 'old_blob.png')
         self.assertEqual(result, 'new_blob.png')
 
-    @patch('google.cloud.storage.Blob.generate_signed_url')
-    @patch('google.cloud.storage.Client.bucket')
-    async def test_read_image_cache_miss(self, mock_bucket: MagicMock, mock_signed_url: MagicMock) -> None:
+    async def test_read_image_cache_miss(self) -> None:
         client = GoogleBucketsClient(self.bucket_name)
-        client.manager = MagicMock(get_image_signed_url=lambda _: None)
-        mock_blob = MagicMock()
-        mock_signed_url.return_value = 'http://signed-url'
-        mock_blob.generate_signed_url.return_value = 'http://signed-url'
-        mock_bucket.return_value.blob.return_value = mock_blob
-        client.bucket = mock_bucket.return_value
+        client.manager = AsyncMock()
+        client.manager.get_many.return_value = {}
+        client.signer = MagicMock()
+        client.signer.sign.return_value = 'http://signed-url'
         result = await client.read_image('img.png')
         self.assertEqual(result, 'http://signed-url')
-        client.manager.cache_image.assert_called_once()
+        client.manager.cache_images.assert_awaited_once()
 
     async def test_read_image_cache_hit(self) -> None:
         client = GoogleBucketsClient(self.bucket_name)
-        client.manager = MagicMock(get_image_signed_url=lambda _: 'cached-url')
+        client.manager = AsyncMock()
+        client.manager.get_many.return_value = {'img.png': 'cached-url'}
         result = await client.read_image('img.png')
         self.assertEqual(result, 'cached-url')
 
@@ -101,3 +105,117 @@ class TestGoogleBucketsClient(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(client._get_content_type('photo.JPG'), 'image/jpeg')
         self.assertEqual(client._get_content_type('file.webp'), 'image/webp')
         self.assertEqual(client._get_content_type('unknown.txt'), 'application/octet-stream')
+
+
+class TestGoogleBucketsClientBatchSigning(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self) -> None:
+        with patch.object(GoogleBucketsClient, '__init__', return_value=None):
+            self.client = GoogleBucketsClient(BucketName.PRODUCT_IMAGES)
+        self.client.logger = MagicMock()
+        self.client.signed_url_expiration_seconds = 10800
+        self.client.bucket_name = BUCKET
+        self.client.manager = GoogleStorageClientCacheManager()
+        self.client.signer = MagicMock()
+        self.client.signer.sign.side_effect = lambda name: f'https://signed/{name}'
+
+    async def test_read_images_signs_each_distinct_blob_once(self) -> None:
+        result = await self.client.read_images(['a.png', 'b.png', 'a.png', ''])
+        self.assertEqual(result, {'a.png': 'https://signed/a.png', 'b.png': 'https://signed/b.png', '': ''})
+        self.assertEqual(self.client.signer.sign.call_count, 2)
+
+    async def test_read_images_only_signs_cache_misses(self) -> None:
+        await self.client.manager.cache_images(BUCKET, {'a.png': 'https://cached/a.png'}, timedelta(minutes=5))
+        result = await self.client.read_images(['a.png', 'b.png'])
+        self.assertEqual(result['a.png'], 'https://cached/a.png')
+        self.assertEqual(result['b.png'], 'https://signed/b.png')
+        self.client.signer.sign.assert_called_once_with('b.png')
+        self.assertEqual(await self.client.manager.get_many(BUCKET, ['b.png']), {'b.png': 'https://signed/b.png'})
+
+    async def test_read_image_delegates_to_the_batch(self) -> None:
+        self.assertEqual(await self.client.read_image('a.png'), 'https://signed/a.png')
+        self.assertEqual(await self.client.read_image(''), '')
+
+
+class TestGoogleStorageClientCacheManager(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self) -> None:
+        self.manager = GoogleStorageClientCacheManager(max_size=2, ttl_seconds=60, sweep_interval_seconds=0.01)
+
+    async def test_cache_is_bounded_and_evicts_the_least_recently_used(self) -> None:
+        await self.manager.cache_images(BUCKET, {'a.png': 'url-a', 'b.png': 'url-b'}, timedelta(hours=3))
+        await self.manager.get_many(BUCKET, ['a.png'])
+        await self.manager.cache_images(BUCKET, {'c.png': 'url-c'}, timedelta(hours=3))
+        self.assertEqual(await self.manager.get_many(BUCKET, ['a.png', 'b.png']), {'a.png': 'url-a'})
+        self.assertEqual(self.manager.stats()['evictions'], 1)
+
+    async def test_entries_never_outlive_the_configured_ttl(self) -> None:
+        await self.manager.cache_images(BUCKET, {'a.png': 'url-a'}, timedelta(hours=3))
+        with patch('api.shared.lru_ttl_cache.monotonic', return_value=10 ** 9):
+            self.assertEqual(await self.manager.get_many(BUCKET, ['a.png']), {})
+
+    async def test_the_same_blob_name_in_two_buckets_keeps_two_urls(self) -> None:
+        await self.manager.cache_images('bucket-a', {'a.png': 'url-a'}, timedelta(hours=3))
+        await self.manager.cache_images('bucket-b', {'a.png': 'url-b'}, timedelta(hours=3))
+        self.assertEqual(await self.manager.get_many('bucket-a', ['a.png']), {'a.png': 'url-a'})
+        self.assertEqual(await self.manager.get_many('bucket-b', ['a.png']), {'a.png': 'url-b'})
+        await self.manager.remove_cache('bucket-a', 'a.png')
+        self.assertEqual(await self.manager.get_many('bucket-b', ['a.png']), {'a.png': 'url-b'})
+
+    async def test_remove_cache_forgets_the_blob(self) -> None:
+        await self.manager.cache_images(BUCKET, {'a.png': 'url-a'}, timedelta(hours=3))
+        await self.manager.remove_cache(BUCKET, 'a.png')
+        await self.manager.remove_cache(BUCKET, 'missing.png')
+        self.assertEqual(await self.manager.get_many(BUCKET, ['a.png']), {})
+
+    async def test_sweeper_drops_expired_entries_without_a_read(self) -> None:
+        await self.manager.cache_images(BUCKET, {'a.png': 'url-a'}, timedelta(milliseconds=10))
+        self.manager.start_sweeper()
+        await asyncio.sleep(0.05)
+        await self.manager.stop_sweeper()
+        self.assertEqual(self.manager.stats()['size'], 0)
+        self.assertEqual(self.manager.stats()['expirations'], 1)
+
+    def test_shared_returns_the_same_instance_with_ttl_under_the_url_expiration(self) -> None:
+        with patch.object(GoogleStorageClientCacheManager, '_shared', None):
+            manager = GoogleStorageClientCacheManager.shared()
+            self.assertIs(GoogleStorageClientCacheManager.shared(), manager)
+            self.assertLess(manager.cached.ttl_seconds, 10800)
+
+
+class TestGoogleStorageClientCacheManagerWithBackend(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self) -> None:
+        self.backend = AsyncMock()
+        self.backend.get_many.return_value = {}
+        self.manager = GoogleStorageClientCacheManager(max_size=10, ttl_seconds=60, backend=self.backend)
+
+    async def test_local_misses_are_served_from_the_backend_and_kept_locally(self) -> None:
+        expires_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+        self.backend.get_many.return_value = {'a.png': ('url-a', expires_at)}
+        self.assertEqual(await self.manager.get_many(BUCKET, ['a.png', 'b.png']), {'a.png': 'url-a'})
+        self.backend.get_many.assert_awaited_once_with(BUCKET, ['a.png', 'b.png'])
+        self.assertEqual(await self.manager.get_many(BUCKET, ['a.png']), {'a.png': 'url-a'})
+        self.backend.get_many.assert_awaited_once()
+        self.assertEqual(self.manager.stats()['shared_hits'], 1)
+
+    async def test_new_urls_are_shared_with_the_local_ttl(self) -> None:
+        before = datetime.now(timezone.utc)
+        await self.manager.cache_images(BUCKET, {'a.png': 'url-a'}, timedelta(hours=3))
+        bucket_name, signed_urls, expires_at = self.backend.save_many.await_args.args
+        self.assertEqual(bucket_name, BUCKET)
+        self.assertEqual(signed_urls, {'a.png': 'url-a'})
+        self.assertLessEqual(expires_at, before + timedelta(seconds=61))
+
+    async def test_backend_failures_fall_back_to_the_local_cache(self) -> None:
+        self.backend.get_many.side_effect = Exception('database down')
+        self.backend.save_many.side_effect = Exception('database down')
+        self.backend.remove.side_effect = Exception('database down')
+        await self.manager.cache_images(BUCKET, {'a.png': 'url-a'}, timedelta(hours=3))
+        self.assertEqual(await self.manager.get_many(BUCKET, ['a.png', 'b.png']), {'a.png': 'url-a'})
+        await self.manager.remove_cache(BUCKET, 'a.png')
+        self.assertEqual(await self.manager.get_many(BUCKET, ['a.png']), {})
+
+    async def test_remove_cache_removes_the_shared_entry(self) -> None:
+        await self.manager.remove_cache(BUCKET, 'a.png')
+        self.backend.remove.assert_awaited_once_with(BUCKET, 'a.png')
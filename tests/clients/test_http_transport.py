@@ -0,0 +1,39 @@
+import asyncio
+import unittest
+import httpx
+from api.clients.http_transport import HttpTransport
+from tests.helper.stub_http_server import StubHttpServer
+
+
+class TestHttpTransport(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self) -> None:
+        self.server = StubHttpServer().start()
+        self.server.respond('/ping', body={'ok': True})
+
+    async def asyncTearDown(self) -> None:
+        self.server.stop()
+
+    async def test_get_reuses_the_same_connection_between_calls(self) -> None:
+        transport = HttpTransport()
+        for _ in range(5):
+            response = await transport.get(f'{self.server.base_url}/ping')
+            self.assertEqual(response.json(), {'ok': True})
+        await transport.close()
+        self.assertEqual(len(self.server.requests), 5)
+        self.assertEqual(len(self.server.connections), 1)
+
+    async def test_get_limits_concurrent_requests_per_host(self) -> None:
+        self.server.delay_seconds = 0.05
+        transport = HttpTransport(per_host_limit=2)
+        await asyncio.gather(*(transport.get(f'{self.server.base_url}/ping') for _ in range(6)))
+        await transport.close()
+        self.assertEqual(len(self.server.requests), 6)
+        self.assertLessEqual(self.server.max_in_flight, 2)
+
+    async def test_get_raises_timeout_when_the_server_is_too_slow(self) -> None:
+        self.server.delay_seconds = 0.5
+        transport = HttpTransport(timeout_seconds=0.1)
+        with self.assertRaises(httpx.TimeoutException):
+            await transport.get(f'{self.server.base_url}/ping')
+        await transport.close()
@@ -1,14 +1,20 @@
 import unittest
 from unittest.mock import patch, MagicMock
+from urllib.parse import parse_qs, urlsplit
+from api.clients.geocode_cache import GeocodeCache
+from api.clients.http_transport import HttpTransport
 from api.clients.open_street_map_client import OpenStreetMapsClient
 from api.domain.entities.address import Address
 from api.exceptions.external_service_exception import ExternalServiceException
+from tests.helper.stub_http_server import StubHttpServer
 
 
 class TestOpenStreetMapsClient(unittest.IsolatedAsyncioTestCase):
 
     def setUp(self) -> None:
-        self.client = OpenStreetMapsClient()
+        self.server = StubHttpServer().start()
+        self.transport = HttpTransport()
+        self.client = OpenStreetMapsClient(self.transport, self.server.base_url)
         self.address = Address(
             street_address="Rua das Flores",
             number="123",
@@ -21,58 +27,44 @@ class TestOpenStreetMapsClient(unittest.IsolatedAsyncioTestCase):
             longitude=0
         )
 
-    @patch('http.client.HTTPSConnection')
+    async def asyncTearDown(self) -> None:
+        await self.transport.close()
+        self.server.stop()
+
     @patch.object(OpenStreetMapsClient, '_validate_address')
-    async def test_get_coordinates_success(self, mock_validate: MagicMock, mock_https: MagicMock) -> None:
-        mock_conn = MagicMock()
-        mock_response = MagicMock()
-        mock_response.status = 200
-        mock_response.read.return_value = b'[{"lat": "-23.55052", "lon": "-46.633308"}]'
-        mock_conn.getresponse.return_value = mock_response
-        mock_https.return_value = mock_conn
+    async def test_get_coordinates_success(self, mock_validate: MagicMock) -> None:
+        self.server.respond('/search', body=[{"lat": "-23.55052", "lon": "-46.633308"}])
         lat, lon = await self.client.get_coordinates(self.address)
         self.assertEqual(lat, -23.55052)
         self.assertEqual(lon, -46.633308)
         mock_validate.assert_called_once()
-        mock_conn.request.assert_called_once()
-        mock_conn.close.assert_called_once()
+        request = self.server.requests[0]
+        query = parse_qs(urlsplit(request['path']).query)
+        self.assertEqual(query['q'], ['Rua das Flores 123, São Paulo, SP, Brasil'])
+        self.assertEqual(query['format'], ['json'])
+        self.assertEqual(query['limit'], ['1'])
+        self.assertIn('TudoFresco', request['headers']['User-Agent'])
 
-    @patch('http.client.HTTPSConnection')
     @patch.object(OpenStreetMapsClient, '_validate_address')
-    async def test_get_coordinates_not_found(self, mock_validate: MagicMock, mock_https: MagicMock) -> None:
-        mock_conn = MagicMock()
-        mock_response = MagicMock()
-        mock_response.status = 200
-        mock_response.read.return_value = b'[]'
-        mock_conn.getresponse.return_value = mock_response
-        mock_https.return_value = mock_conn
+    async def test_get_coordinates_not_found(self, mock_validate: MagicMock) -> None:
+        self.server.respond('/search', body=[])
         with self.assertRaises(ExternalServiceException) as context:
             await self.client.get_coordinates(self.address)
         self.assertIn('Endereço não encontrado no Nominatim', str(context.exception))
-        mock_conn.close.assert_called_once()
 
-    @patch('http.client.HTTPSConnection')
     @patch.object(OpenStreetMapsClient, '_validate_address')
-    async def test_get_coordinates_http_error(self, mock_validate: MagicMock, mock_https: MagicMock) -> None:
-        mock_conn = MagicMock()
-        mock_response = MagicMock()
-        mock_response.status = 500
-        mock_response.read.return_value = b'Internal Server Error'
-        mock_conn.getresponse.return_value = mock_response
-        mock_https.return_value = mock_conn
-        with self.assertRaises(ExternalServiceException):
+    async def test_get_coordinates_http_error(self, mock_validate: MagicMock) -> None:
+        self.server.respond('/search', status=500, body=b'Internal Server Error')
+        with self.assertRaises(ExternalServiceException) as context:
             await self.client.get_coordinates(self.address)
-        mock_conn.close.assert_called_once()
+        self.assertIn('500', str(context.exception))
 
-    @patch('http.client.HTTPSConnection')
     @patch.object(OpenStreetMapsClient, '_validate_address')
-    async def test_get_coordinates_unexpected_exception(self, mock_validate: MagicMock, mock_https: MagicMock) -> None:
-        mock_conn = MagicMock()
-        mock_https.return_value = mock_conn
-        mock_conn.request.side_effect = Exception('Connection failed')
+    async def test_get_coordinates_unexpected_exception(self, mock_validate: MagicMock) -> None:
+        self.server.stop()
         with self.assertRaises(ExternalServiceException):
             await self.client.get_coordinates(self.address)
-        mock_conn.close.assert_called_once()
+        self.server = StubHttpServer().start()
 
     def test_build_query_with_number(self) -> None:
         query = self.client._build_query(self.address)
@@ -84,3 +76,27 @@ class TestOpenStreetMapsClient(unittest.IsolatedAsyncioTestCase):
         query = self.client._build_query(self.address)
         expected = 'Rua das Flores, São Paulo, SP, Brasil'
         self.assertEqual(query, expected)
+
+    async def test_get_coordinates_with_cache_calls_nominatim_once_per_location(self) -> None:
+        self.client.cache = GeocodeCache()
+        self.server.respond('/search', body=[{"lat": "-23.55052", "lon": "-46.633308"}])
+        same_location = Address(
+            street_address="  RUA DAS FLORES ",
+            number="123",
+            neighbourhood="Outro bairro",
+            city="são paulo",
+            province="sp",
+            zip_code="01000-000",
+            additional_info="Fundos",
+            latitude=0,
+            longitude=0
+        )
+        first = await self.client.get_coordinates(self.address)
+        second = await self.client.get_coordinates(same_location)
+        self.assertEqual(first, second)
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_cache_key_ignores_case_and_extra_spaces(self) -> None:
+        key = self.client.cache_key(self.address)
+        self.address.street_address = "rua  das FLORES"
+        self.assertEqual(self.client.cache_key(self.address), key)
@@ -1,25 +1,29 @@
 import unittest
 from unittest.mock import patch, MagicMock
 from datetime import date
+from api.clients.http_transport import HttpTransport
 from api.clients.receita_client import ReceitaClient
 from api.controllers.models.store.store_response_model import StoreResponseModel
 from api.exceptions.not_found_exception import NotFoundException
+from tests.helper.stub_http_server import StubHttpServer
 
 class TestReceitaClient(unittest.IsolatedAsyncioTestCase):
 
     def setUp(self):
         self.valid_cnpj = "12.345.678/0001-90"
+        self.path = "/v1/cnpj/12345678000190"
+        self.server = StubHttpServer().start()
+        self.transport = HttpTransport()
+        self.client = ReceitaClient(self.transport, self.server.base_url)
+        self.client.validator = MagicMock()
+        self.client.logger = MagicMock()
 
-    @patch("http.client.HTTPSConnection")
-    @patch.object(ReceitaClient, '__init__', return_value=None)
-    async def test_get_by_cnpj_success(self, mock_init: MagicMock, mock_https: MagicMock) -> None:
-        client = ReceitaClient()
-        client.validator = MagicMock()
-        client.logger = MagicMock()
-        mock_conn = MagicMock()
-        mock_response = MagicMock()
-        mock_response.status = 200
-        mock_response.read.return_value = '''{
+    async def asyncTearDown(self) -> None:
+        await self.transport.close()
+        self.server.stop()
+
+    async def test_get_by_cnpj_success(self) -> None:
+        self.server.respond(self.path, body={
             "cnpj": "12345678000190",
             "logradouro": "Rua Exemplo",
             "numero": "100",
@@ -36,59 +40,27 @@ class TestReceitaClient(unittest.IsolatedAsyncioTestCase):
             "natureza_juridica": "206-2",
             "atividade_principal": [{"code": "47.89-0-02"}],
             "tipo": "MATRIZ"
-        }'''.encode('utf-8')
-        mock_conn.getresponse.return_value = mock_response
-        mock_https.return_value = mock_conn
-        result = await client.get_by_cnpj(self.valid_cnpj)
+        })
+        result = await self.client.get_by_cnpj(self.valid_cnpj)
         self.assertIsInstance(result, StoreResponseModel)
         self.assertEqual(result.cnpj, "12345678000190")
         self.assertEqual(result.address.city, "São Paulo")
         self.assertEqual(result.trade_name, "Loja Exemplo")
         self.assertEqual(result.opening_date, date(2020, 1, 1))
-        mock_conn.close.assert_called_once()
-
-    @patch("http.client.HTTPSConnection")
-    @patch.object(ReceitaClient, '__init__', return_value=None)
-    async def test_get_by_cnpj_not_found(self, mock_init: MagicMock, mock_https: MagicMock) -> None:
-        client = ReceitaClient()
-        client.validator = MagicMock()
-        client.logger = MagicMock()
+        self.assertEqual(self.server.requests[0]['path'], self.path)
 
-        mock_conn = MagicMock()
-        mock_response = MagicMock()
-        mock_response.status = 200
-        mock_response.read.return_value = b'{"status": "ERROR", "message": "CNPJ n\u00e3o encontrado"}'
-        mock_conn.getresponse.return_value = mock_response
-        mock_https.return_value = mock_conn
+    async def test_get_by_cnpj_not_found(self) -> None:
+        self.server.respond(self.path, body={"status": "ERROR", "message": "CNPJ não encontrado"})
         with self.assertRaises(NotFoundException):
-            await client.get_by_cnpj(self.valid_cnpj)
-        mock_conn.close.assert_called_once()
+            await self.client.get_by_cnpj(self.valid_cnpj)
 
-    @patch("http.client.HTTPSConnection")
-    @patch.object(ReceitaClient, '__init__', return_value=None)
-    async def test_get_by_cnpj_http_error(self, mock_init: MagicMock, mock_https: MagicMock) -> None:
-        client = ReceitaClient()
-        client.validator = MagicMock()
-        client.logger = MagicMock()
-        mock_conn = MagicMock()
-        mock_response = MagicMock()
-        mock_response.status = 500
-        mock_response.read.return_value = b"Erro interno"
-        mock_conn.getresponse.return_value = mock_response
-        mock_https.return_value = mock_conn
+    async def test_get_by_cnpj_http_error(self) -> None:
+        self.server.respond(self.path, status=500, body=b"Erro interno")
         with self.assertRaises(NotFoundException):
-            await client.get_by_cnpj(self.valid_cnpj)
-        mock_conn.close.assert_called_once()
+            await self.client.get_by_cnpj(self.valid_cnpj)
 
-    @patch("http.client.HTTPSConnection")
-    @patch.object(ReceitaClient, '__init__', return_value=None)
-    async def test_get_by_cnpj_unexpected_exception(self, mock_init: MagicMock, mock_https: MagicMock) -> None:
-        client = ReceitaClient()
-        client.validator = MagicMock()
-        client.logger = MagicMock()
-        mock_conn = MagicMock()
-        mock_conn.request.side_effect = Exception("Falha de conex\u00e3o")
-        mock_https.return_value = mock_conn
+    @patch.object(HttpTransport, 'get', side_effect=Exception("Falha de conexão"))
+    async def test_get_by_cnpj_unexpected_exception(self, mock_get: MagicMock) -> None:
         with self.assertRaises(NotFoundException):
-            await client.get_by_cnpj(self.valid_cnpj)
-        mock_conn.close.assert_called_once()
\ No newline at end of file
+            await self.client.get_by_cnpj(self.valid_cnpj)
+        mock_get.assert_called_once()
@@ -0,0 +1,71 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from unittest.mock import patch
+from google.cloud import storage
+from google.oauth2 import service_account
+from api.clients.v4_url_signer import V4UrlSigner
+
+
+def make_fake_credentials() -> service_account.Credentials:
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    private_key = key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption()
+    ).decode()
+    return service_account.Credentials.from_service_account_info({
+        'type': 'service_account',
+        'project_id': 'tudo-fresco-test',
+        'private_key_id': 'fake-key-id',
+        'private_key': private_key,
+        'client_email': 'signer@tudo-fresco-test.iam.gserviceaccount.com',
+        'client_id': '1234567890',
+        'token_uri': 'https://oauth2.googleapis.com/token',
+    })
+
+
+class TestV4UrlSigner(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.credentials = make_fake_credentials()
+        cls.client = storage.Client(credentials=cls.credentials, project='tudo-fresco-test')
+        cls.bucket = cls.client.bucket('tudo-fresco-product-images')
+        cls.signer = V4UrlSigner(cls.credentials, cls.bucket.name, 10800, cls.client.api_endpoint)
+
+    def library_url(self, blob_name: str, now: datetime) -> str:
+        with patch('google.cloud.storage._signing._NOW', return_value=now):
+            return self.bucket.blob(blob_name).generate_signed_url(
+                version='v4',
+                expiration=timedelta(seconds=10800),
+                method='GET'
+            )
+
+    def test_sign_matches_the_library_byte_for_byte(self) -> None:
+        now = datetime(2026, 10, 18, 13, 45, 7, tzinfo=timezone.utc)
+        for blob_name in ['images/1700000000_3f1c.png', 'images/foto de maçã~1.jpeg', 'a+b/c?d=e&f.webp']:
+            self.assertEqual(self.signer.sign(blob_name, now), self.library_url(blob_name, now))
+
+    def test_sign_refreshes_the_credential_scope_when_the_day_changes(self) -> None:
+        before_midnight = datetime(2026, 10, 18, 23, 59, 59, tzinfo=timezone.utc)
+        after_midnight = datetime(2026, 10, 19, 0, 0, 1, tzinfo=timezone.utc)
+        self.assertEqual(self.signer.sign('images/a.png', before_midnight), self.library_url('images/a.png', before_midnight))
+        url = self.signer.sign('images/a.png', after_midnight)
+        self.assertEqual(url, self.library_url('images/a.png', after_midnight))
+        self.assertIn('20261019%2Fauto%2Fstorage%2Fgoog4_request', url)
+
+    def test_threads_signing_across_midnight_never_mix_two_days(self) -> None:
+        days = [datetime(2026, 10, 18, 23, 59, 59, tzinfo=timezone.utc), datetime(2026, 10, 19, 0, 0, 1, tzinfo=timezone.utc)]
+        expected = {day: self.library_url('images/a.png', day) for day in days}
+        moments = days * 200
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            urls = list(executor.map(lambda now: self.signer.sign('images/a.png', now), moments))
+        self.assertEqual(urls, [expected[now] for now in moments])
+
+    def test_sign_uses_the_given_time(self) -> None:
+        url = self.signer.sign('images/a.png', now=datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc))
+        self.assertIn('X-Goog-Date=20260102T030405Z', url)
+        self.assertIn('X-Goog-Expires=10800', url)
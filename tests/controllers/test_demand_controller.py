@@ -5,6 +5,8 @@ from datetime import datetime, date
 from http import HTTPStatus
 from fastapi.responses import JSONResponse
 from api.controllers.demand_controller import DemandController
+from api.controllers.models.demand.demand_bulk_request_model import DemandBulkRequestModel
+from api.controllers.models.demand.demand_bulk_status_request_model import DemandBulkStatusRequestModel
 from api.controllers.models.demand.demand_request_model import DemandRequestModel
 from api.controllers.models.user.user_response_model import UserResponseModel
 from api.enums.demand_status import DemandStatus
@@ -105,4 +107,25 @@ class TestDemandController(unittest.IsolatedAsyncioTestCase):
         list_route = routes['/demand/list-by-store']
         assert list_route.methods == {'GET'}
         get_route = routes['/demand/by-uuid/{uuid}']
-        assert get_route.methods == {'GET'}
\ No newline at end of file
+        assert get_route.methods == {'GET'}
+        assert routes['/demand/bulk'].methods == {'POST'}
+        assert routes['/demand/bulk-status'].methods == {'PATCH'}
+
+    async def test_bulk_handlers_pass_the_user_and_the_batch(self) -> None:
+        self.mock_service.create_many = AsyncMock(return_value=ServiceResponse(status=HTTPStatus.CREATED, message='ok', payload=[]))
+        self.mock_service.update_status_many = AsyncMock(return_value=ServiceResponse(status=HTTPStatus.OK, message='ok', payload=None))
+        bulk = DemandBulkRequestModel(demands=[{
+            'store_uuid': UUID('1f4e1f4b-ea47-4d3c-8901-cdcd7bb8e10a'),
+            'product_uuid': UUID('2d7f5e9f-fb71-4fd2-b929-2d6d7a99fa7a'),
+            'needed_count': 5,
+            'description': 'Arroz',
+            'deadline': datetime(2025, 10, 1),
+            'status': DemandStatus.OPENED,
+        }])
+        response = await self.controller._create_many_handler()(model=bulk, user=self.user)
+        self.assertEqual(response.status_code, HTTPStatus.CREATED)
+        self.mock_service.create_many.assert_awaited_once_with(user=self.user, request=bulk)
+        status_change = DemandBulkStatusRequestModel(demand_uuids=[UUID('2d7f5e9f-fb71-4fd2-b929-2d6d7a99fa7a')], status=DemandStatus.CLOSED)
+        response = await self.controller._update_status_many_handler()(model=status_change, user=self.user)
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.mock_service.update_status_many.assert_awaited_once_with(user=self.user, request=status_change)
\ No newline at end of file
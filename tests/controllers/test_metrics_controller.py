@@ -0,0 +1,106 @@
+import unittest
+from unittest.mock import AsyncMock, MagicMock
+from datetime import timedelta
+from http import HTTPStatus
+from fastapi.responses import JSONResponse
+from api.clients.google_buckets_client import GoogleStorageClientCacheManager
+from api.controllers.metrics_controller import MetricsController
+from api.controllers.models.metrics.cep_cache_metrics_response_model import CepCacheMetricsResponseModel
+from api.controllers.models.metrics.db_pool_metrics_response_model import DbPoolMetricsResponseModel
+from api.controllers.models.metrics.geocoding_queue_metrics_response_model import GeocodingQueueMetricsResponseModel
+from api.controllers.models.metrics.signed_url_cache_metrics_response_model import SignedUrlCacheMetricsResponseModel
+from api.enums.user_access import UserAccess
+from api.services.metrics_service import MetricsService
+from api.services.service_response import ServiceResponse
+
+
+class TestMetricsController(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self) -> None:
+        self.mock_service = MagicMock()
+        self.mock_auth_wrapper = MagicMock()
+        self.controller = MetricsController(service=self.mock_service, auth_wrapper=self.mock_auth_wrapper)
+        self.metrics = {
+            'pool_size': 5, 'max_overflow': 10, 'checked_out': 2, 'idle': 3, 'overflow': 0,
+            'checkouts': 40, 'timeouts': 0, 'total_wait_ms': 12.5, 'average_wait_ms': 0.312, 'max_wait_ms': 4.1
+        }
+
+    def test_db_pool_route_requires_admin(self) -> None:
+        routes = {route.path: route for route in self.controller.router.routes}
+        self.assertIn('/metrics/db-pool', routes)
+        self.assertEqual(routes['/metrics/db-pool'].methods, {'GET'})
+        self.mock_auth_wrapper.with_access.assert_called_with([UserAccess.ADMIN])
+
+    async def test_db_pool_handler_returns_metrics(self) -> None:
+        self.mock_service.get_db_pool = AsyncMock(return_value=ServiceResponse(
+            status=HTTPStatus.OK,
+            message='Pool metrics',
+            payload=DbPoolMetricsResponseModel(**self.metrics)
+        ))
+        response = await self.controller._db_pool_handler()()
+        self.assertIsInstance(response, JSONResponse)
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertIn('"checked_out":2', response.body.decode())
+
+    async def test_cep_cache_handler_returns_metrics(self) -> None:
+        self.mock_service.get_cep_cache = AsyncMock(return_value=ServiceResponse(
+            status=HTTPStatus.OK,
+            message='CEP cache metrics',
+            payload=CepCacheMetricsResponseModel(
+                memory_hits=9, database_hits=1, misses=2, negative_hits=1,
+                hit_ratio=0.8333, memory_size=3, memory_max_size=5000
+            )
+        ))
+        routes = {route.path: route for route in self.controller.router.routes}
+        self.assertIn('/metrics/cep-cache', routes)
+        response = await self.controller._cep_cache_handler()()
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertIn('"memory_hits":9', response.body.decode())
+
+    async def test_geocoding_queue_handler_returns_metrics(self) -> None:
+        self.mock_service.get_geocoding_queue = AsyncMock(return_value=ServiceResponse(
+            status=HTTPStatus.OK,
+            message='Geocoding queue metrics',
+            payload=GeocodingQueueMetricsResponseModel(
+                running=True, depth=3, lag_seconds=2.5, last_lag_seconds=1.0, processed=10, failed=0, retried=1
+            )
+        ))
+        routes = {route.path: route for route in self.controller.router.routes}
+        self.assertIn('/metrics/geocoding-queue', routes)
+        response = await self.controller._geocoding_queue_handler()()
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertIn('"depth":3', response.body.decode())
+
+    async def test_signed_url_cache_handler_returns_metrics(self) -> None:
+        self.mock_service.get_signed_url_cache = AsyncMock(return_value=ServiceResponse(
+            status=HTTPStatus.OK,
+            message='Signed URL cache metrics',
+            payload=SignedUrlCacheMetricsResponseModel(
+                size=2, max_size=20000, hits=8, misses=2, hit_ratio=0.8, evictions=0, expirations=1, shared_hits=1
+            )
+        ))
+        routes = {route.path: route for route in self.controller.router.routes}
+        self.assertIn('/metrics/signed-url-cache', routes)
+        response = await self.controller._signed_url_cache_handler()()
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertIn('"hit_ratio":0.8', response.body.decode())
+
+    async def test_service_reads_signed_url_cache_stats(self) -> None:
+        cache = GoogleStorageClientCacheManager(max_size=10, ttl_seconds=60)
+        await cache.cache_images('bucket', {'a.png': 'url-a'}, timedelta(hours=3))
+        await cache.get_many('bucket', ['a.png'])
+        service_response = await MetricsService(MagicMock(), signed_url_cache=cache).get_signed_url_cache()
+        self.assertEqual(service_response.status, HTTPStatus.OK)
+        self.assertEqual(service_response.payload.hits, 1)
+        self.assertEqual(service_response.payload.size, 1)
+
+    async def test_service_reports_not_found_when_geocoding_queue_is_disabled(self) -> None:
+        service_response = await MetricsService(MagicMock()).get_geocoding_queue()
+        self.assertEqual(service_response.status, HTTPStatus.NOT_FOUND)
+
+    async def test_service_reads_metrics_from_engine_pool(self) -> None:
+        engine = MagicMock()
+        engine.pool.metrics.return_value = self.metrics
+        service_response = await MetricsService(engine).get_db_pool()
+        self.assertEqual(service_response.status, HTTPStatus.OK)
+        self.assertEqual(service_response.payload.idle, 3)
@@ -2,6 +2,7 @@ import unittest
 from unittest.mock import MagicMock, AsyncMock
 from uuid import UUID
 from fastapi.responses import JSONResponse
+from api.controllers.models.product.product_autocomplete_response_model import ProductAutocompleteResponseModel
 from api.controllers.models.user.user_response_model import UserResponseModel
 from api.controllers.product_controller import ProductController
 from api.enums.user_access import UserAccess
@@ -61,12 +62,41 @@ class TestProductController(unittest.IsolatedAsyncioTestCase):
             name="Arroz",
             type=ProductType.GRAIN,
             page=1,
-            per_page=10
+            per_page=10,
+            cursor=None
         )
         self.assertIsInstance(response, JSONResponse)
         self.assertEqual(response.status_code, 200)
         self.assertIn("Found", response.body.decode())
 
+    async def test_autocomplete_handler_returns_the_suggestions(self) -> None:
+        self.mock_service.autocomplete = AsyncMock(return_value=ServiceResponse(
+            status=200,
+            message="Completed",
+            payload=[ProductAutocompleteResponseModel(
+                uuid=UUID("11111111-2222-3333-4444-555566667777"), name="Arroz", search_name="Arroz (kg)"
+            )]
+        ))
+        routes = {route.path: route for route in self.controller.router.routes}
+        self.assertEqual(routes["/product/autocomplete"].methods, {"GET"})
+        response = await self.controller._autocomplete_handler()(prefix="arr", limit=5, user=self.user)
+        self.mock_service.autocomplete.assert_awaited_once_with(prefix="arr", limit=5)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('"search_name":"Arroz (kg)"', response.body.decode())
+        self.assertNotIn("images", response.body.decode())
+
+    async def test_patch_handler_sends_only_the_fields_in_the_body(self) -> None:
+        self.mock_service.patch = AsyncMock(return_value=ServiceResponse(status=200, message="Updated", payload=None))
+        routes = [route for route in self.controller.router.routes if route.path == "/product/by-uuid/{uuid}"]
+        self.assertIn({"PATCH"}, [route.methods for route in routes])
+        handler = self.controller._patch_handler()
+        model = handler.__annotations__["model"].model_validate({"name": "Arroz", "version": 2})
+        uuid = UUID("11111111-2222-3333-4444-555566667777")
+        response = await handler(uuid=uuid, model=model)
+        self.mock_service.patch.assert_awaited_once_with(obj_id=uuid, request=model)
+        self.assertEqual(model.model_dump(exclude_unset=True), {"name": "Arroz", "version": 2})
+        self.assertEqual(response.status_code, 200)
+
     async def test_upload_picture_handler_success(self) -> None:
         mock_file = MagicMock()
         mock_file.filename = "image.png"
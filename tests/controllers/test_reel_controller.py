@@ -66,8 +66,30 @@ class TestReelController(unittest.IsolatedAsyncioTestCase):
             page=1,
             per_page=10,
             radius_meters=10000,
-            product_type=ProductType.ANY
+            product_type=ProductType.ANY,
+            cursor=None
         )
         self.assertIsInstance(response, JSONResponse)
         self.assertEqual(response.status_code, 200)
         self.assertIn("Posts found", response.body.decode())
+
+    async def test_get_posts_handler_returns_next_cursor(self) -> None:
+        self.mock_service.get_posts = AsyncMock(return_value=ServiceResponse(
+            status=200,
+            message="Posts found",
+            payload=[{"id": "post1"}],
+            next_cursor="eyJjIjoiMjAyNSJ9"
+        ))
+        handler = self.controller._posts_handler()
+        response = await handler(
+            store_uuid=UUID("11111111-2222-3333-4444-555566667777"),
+            page=1,
+            per_page=1,
+            radius_meters=10000,
+            product_type=ProductType.ANY,
+            status=DemandStatus.ANY,
+            cursor="eyJjIjoiMjAyNCJ9",
+            user=self.user
+        )
+        self.assertEqual(self.mock_service.get_posts.await_args.kwargs['cursor'], "eyJjIjoiMjAyNCJ9")
+        self.assertIn('"next_cursor":"eyJjIjoiMjAyNSJ9"', response.body.decode())
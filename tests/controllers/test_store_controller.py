@@ -49,7 +49,7 @@ class TestStoreController(unittest.IsolatedAsyncioTestCase):
         endpoint = self.controller._list_by_user_handler()
         response = await endpoint(page=1, per_page=10, user=self.user)
         self.mock_service.list_by_user.assert_awaited_once_with(
-            user_uuid=self.user.uuid, page=1, per_page=10
+            user_uuid=self.user.uuid, page=1, per_page=10, cursor=None
         )
         self.assertIsInstance(response, JSONResponse)
         self.assertEqual(response.status_code, 200)
@@ -95,6 +95,13 @@ class TestAddress(unittest.TestCase):
         self.assertEqual(self.address.created_at, new_created)
         self.assertEqual(self.address.updated_at, new_updated)
 
+    def test_version_starts_at_one_and_is_not_changed_by_update(self) -> None:
+        self.assertEqual(self.address.version, 1)
+        self.address.update(version=7, city='OtherCity')
+        self.assertEqual(self.address.version, 1)
+        self.assertEqual(self.address.city, 'OtherCity')
+        self.assertEqual(self.address.to_dict()['version'], 1)
+
     def test_enforce_uuid_accepts_string_and_uuid(self) -> None:
         string_uuid = str(uuid4())
         enforced_uuid1 = self.address._enforce_uuid(string_uuid)
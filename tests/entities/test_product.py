@@ -57,6 +57,21 @@ class TestProduct(unittest.TestCase):
         self.product.delete_image("not_in_list.jpg")
         self.assertListEqual(before, self.product.images)
 
+    def test_image_changes_are_tracked_element_by_element(self) -> None:
+        self.product.mark_clean()
+        self.product.add_image("image3.jpg")
+        self.product.delete_image("image1.jpg")
+        self.product.delete_image("not_in_list.jpg")
+        self.assertEqual(self.product.dirty_fields, set())
+        self.assertEqual(self.product.array_changes, {'images': [('append', 'image3.jpg'), ('remove', 'image1.jpg')]})
+
+    def test_assignments_mark_only_changed_fields_dirty(self) -> None:
+        self.product.mark_clean()
+        self.product.add_image("image3.jpg")
+        self.product.update(name="Test Product", images=["other.jpg"])
+        self.assertEqual(self.product.dirty_fields, {'images', 'updated_at'})
+        self.assertEqual(self.product.array_changes, {})
+
     def test_get_image_returns_correct_image(self) -> None:
         self.assertEqual(self.product.get_image(1), "image2.jpg")
 
@@ -1,6 +1,7 @@
+import asyncio
 import unittest
 from datetime import date
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, AsyncMock
 from api.domain.entities.user import User
 from api.enums.gender_type import GenderType
 from api.enums.user_access import UserAccess
@@ -42,6 +43,14 @@ class TestUser(unittest.TestCase):
         mock_hash.assert_called_once_with(self.user_kwargs['password'])
         self.assertEqual(user.password, 'hashed_password')
 
+    @patch('api.shared.password_hasher.PasswordHasher.hash_async', new_callable=AsyncMock)
+    def test_hash_password_async_awaits_password_hasher(self, mock_hash_async) -> None:
+        mock_hash_async.return_value = 'hashed_password'
+        user = User(**self.user_kwargs)
+        asyncio.run(user.hash_password_async())
+        mock_hash_async.assert_awaited_once_with(self.user_kwargs['password'])
+        self.assertEqual(user.password, 'hashed_password')
+
     @patch('api.domain.entities.user.Validator')
     def test_validate_calls_validator_methods(self, mock_validator_cls) -> None:
         mock_validator = MagicMock()
@@ -0,0 +1,67 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+
+class StubHttpServer:
+    '''Local HTTP/1.1 server answering canned responses by path, used to exercise the real clients.'''
+
+    def __init__(self):
+        self.routes: dict[str, tuple[int, bytes]] = {}
+        self.requests: list[dict] = []
+        self.connections: set[int] = set()
+        self.delay_seconds: float = 0
+        self.in_flight: int = 0
+        self.max_in_flight: int = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), self._build_handler())
+        self._server.daemon_threads = True
+        self._server.handle_error = lambda request, client_address: None
+        self._thread = threading.Thread(target=self._server.serve_forever, kwargs={'poll_interval': 0.01}, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address
+        return f'http://{host}:{port}'
+
+    def respond(self, path: str, status: int = 200, body=None) -> None:
+        raw = body if isinstance(body, bytes) else json.dumps(body).encode()
+        self.routes[path] = (status, raw)
+
+    def start(self) -> 'StubHttpServer':
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _build_handler(self) -> type[BaseHTTPRequestHandler]:
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self) -> None:
+                with stub._lock:
+                    stub.in_flight += 1
+                    stub.max_in_flight = max(stub.max_in_flight, stub.in_flight)
+                    stub.connections.add(self.client_address[1])
+                    stub.requests.append({'path': self.path, 'headers': dict(self.headers)})
+                if stub.delay_seconds:
+                    time.sleep(stub.delay_seconds)
+                status, body = stub.routes.get(urlsplit(self.path).path, (404, b'{}'))
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+                with stub._lock:
+                    stub.in_flight -= 1
+
+            def log_message(self, format: str, *args) -> None:
+                pass
+
+        return Handler
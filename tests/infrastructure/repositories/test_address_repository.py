@@ -1,9 +1,12 @@
 import unittest
 from unittest.mock import AsyncMock, MagicMock, patch
+from datetime import datetime, timezone
 from uuid import uuid4
 
 import pytest
 from api.domain.entities.address import Address
+from api.exceptions.conflict_exception import ConflictException
+from api.exceptions.not_found_exception import NotFoundException
 from api.infrastructure.models.address_model import AddressModel
 from api.infrastructure.repositories.address_repository import AddressRepository
 
@@ -82,9 +85,12 @@ class TestAddressRepository(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(entities, ['entity1', 'entity2'])
         self.mock_session.execute.assert_awaited_once()
 
-    async def test_update_calls_merge_and_commit(self) -> None:
+    async def test_update_issues_one_versioned_update_and_commits(self) -> None:
         address = MagicMock(spec=Address)
         address.uuid = uuid4()
+        address.version = 3
+        address.dirty_fields = {'city', 'updated_at'}
+        address.array_changes = {}
         address.zip_code = '12345-678'
         address.street_address = 'Some street'
         address.latitude = 10.0
@@ -94,9 +100,53 @@ class TestAddressRepository(unittest.IsolatedAsyncioTestCase):
         address.neighbourhood = 'Some neighbourhood'
         address.number = '123'
         address.additional_info = 'info'
-        self.repo.get = AsyncMock(return_value=address)
+        updated_at = datetime.now(timezone.utc)
+        result = MagicMock()
+        result.one_or_none.return_value = MagicMock(updated_at=updated_at, version=4)
+        self.mock_session.execute.return_value = result
         with patch('api.infrastructure.models.address_model.AddressModel.from_entity', autospec=True) as mock_from_entity:
             await self.repo.update(address)
             mock_from_entity.assert_called_once()
             args, _ = mock_from_entity.call_args
-            assert args[1] == address
\ No newline at end of file
+            assert args[1] == address
+        self.mock_session.execute.assert_awaited_once()
+        statement = str(self.mock_session.execute.await_args.args[0])
+        self.assertIn('UPDATE address', statement)
+        self.assertIn('RETURNING', statement)
+        self.mock_session.merge.assert_not_called()
+        self.mock_session.commit.assert_awaited_once()
+        address.set_base_properties.assert_called_once_with(address.uuid, address.active, address.created_at, updated_at, 4)
+        address.mark_clean.assert_called_once()
+
+    async def test_update_skips_the_round_trip_when_nothing_changed(self) -> None:
+        address = Address('12345-678', 'Some street', 10.0, 20.0, 'SP', 'Some city', 'Centro', '1')
+        address.mark_clean()
+        await self.repo.update(address)
+        self.mock_session.execute.assert_not_awaited()
+        self.mock_session.commit.assert_not_awaited()
+
+    async def test_update_raises_conflict_on_a_stale_version(self) -> None:
+        address = Address('12345-678', 'Some street', 10.0, 20.0, 'SP', 'Some city', 'Centro', '1', version=2)
+        address.mark_clean()
+        address.update(city='Other city')
+        update_result = MagicMock()
+        update_result.one_or_none.return_value = None
+        version_result = MagicMock()
+        version_result.scalars.return_value.one_or_none.return_value = 3
+        self.mock_session.execute.side_effect = [update_result, version_result]
+        with self.assertRaises(ConflictException):
+            await self.repo.update(address)
+        self.mock_session.commit.assert_not_awaited()
+        self.mock_session.rollback.assert_awaited_once()
+        self.assertEqual(address.version, 2)
+
+    async def test_update_raises_not_found_when_the_record_is_gone(self) -> None:
+        address = Address('12345-678', 'Some street', 10.0, 20.0, 'SP', 'Some city', 'Centro', '1')
+        address.deactivate()
+        update_result = MagicMock()
+        update_result.one_or_none.return_value = None
+        version_result = MagicMock()
+        version_result.scalars.return_value.one_or_none.return_value = None
+        self.mock_session.execute.side_effect = [update_result, version_result]
+        with self.assertRaises(NotFoundException):
+            await self.repo.update(address)
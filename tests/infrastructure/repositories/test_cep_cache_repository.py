@@ -0,0 +1,33 @@
+import unittest
+from unittest.mock import AsyncMock, MagicMock
+from datetime import datetime, timezone
+from sqlalchemy.dialects import postgresql
+from api.infrastructure.repositories.cep_cache_repository import CepCacheRepository
+
+
+class TestCepCacheRepository(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self) -> None:
+        self.session = AsyncMock()
+        self.repo = CepCacheRepository(self.session)
+
+    async def test_get_returns_the_unexpired_data(self) -> None:
+        result_mock = MagicMock()
+        result_mock.scalar_one_or_none.return_value = {'cep': '01001-000'}
+        self.session.execute.return_value = result_mock
+        data = await self.repo.get('01001000')
+        self.assertEqual(data, {'cep': '01001-000'})
+        query = str(self.session.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+        self.assertIn('cep_cache.expires_at >', query)
+
+    async def test_save_upserts_and_commits(self) -> None:
+        await self.repo.save('01001000', {'erro': True}, datetime.now(timezone.utc))
+        statement = str(self.session.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+        self.assertIn('ON CONFLICT (cep) DO UPDATE', statement)
+        self.session.commit.assert_awaited_once()
+
+    async def test_save_rolls_back_on_failure(self) -> None:
+        self.session.execute.side_effect = Exception('boom')
+        with self.assertRaises(Exception):
+            await self.repo.save('01001000', {}, datetime.now(timezone.utc))
+        self.session.rollback.assert_awaited_once()
@@ -3,6 +3,8 @@ from uuid import uuid4
 from unittest.mock import AsyncMock, MagicMock
 from sqlalchemy.ext.asyncio import AsyncSession
 from api.domain.entities.demand import Demand
+from api.domain.entities.product import Product
+from api.domain.read_models.demand_summary import DemandSummary
 from api.enums.demand_status import DemandStatus
 from api.enums.product_type import ProductType
 from api.enums.store_type import StoreType
@@ -30,6 +32,11 @@ class TestDemandRepository(unittest.IsolatedAsyncioTestCase):
         model.to_entity.return_value = MagicMock(spec=Demand)
         return model
 
+    def make_summary_row(self) -> MagicMock:
+        row = MagicMock()
+        row.ProductModel.to_entity.return_value = MagicMock(spec=Product)
+        return row
+
     async def test_list_by_store_raises_if_store_not_found(self) -> None:
         mock_result = MagicMock()
         mock_result.scalar_one_or_none.return_value = None
@@ -50,11 +57,11 @@ class TestDemandRepository(unittest.IsolatedAsyncioTestCase):
         store = MagicMock(spec=StoreModel)
         store.store_type = StoreType.SUPPLIER
         store.address = self.make_valid_address()
-        demand_model = self.make_demand_model()
+        row = self.make_summary_row()
         store_result = MagicMock()
         store_result.scalar_one_or_none.return_value = store
         demands_result = MagicMock()
-        demands_result.scalars.return_value.all.return_value = [demand_model]
+        demands_result.all.return_value = [row]
         self.session.execute.side_effect = [store_result, demands_result]
         result = await self.repo.list_by_store(
             store_uuid=uuid4(),
@@ -62,17 +69,64 @@ class TestDemandRepository(unittest.IsolatedAsyncioTestCase):
             product_type=ProductType.ANY
         )
         self.assertEqual(len(result), 1)
-        self.assertIsInstance(result[0], Demand)
+        self.assertIsInstance(result[0], DemandSummary)
+        self.assertIs(result[0].uuid, row.uuid)
+        self.assertIs(result[0].store.trade_name, row.store_trade_name)
+        self.assertIs(result[0].responsible.name, row.responsible_name)
+
+    async def test_list_by_store_for_supplier_prefilters_by_bounding_box(self) -> None:
+        store = MagicMock(spec=StoreModel)
+        store.store_type = StoreType.SUPPLIER
+        store.address = self.make_valid_address()
+        store_result = MagicMock()
+        store_result.scalar_one_or_none.return_value = store
+        demands_result = MagicMock()
+        demands_result.all.return_value = []
+        self.session.execute.side_effect = [store_result, demands_result]
+        await self.repo.list_by_store(store_uuid=uuid4(), radius_meters=5000)
+        demands_query = self.session.execute.await_args_list[1].args[0]
+        compiled = str(demands_query)
+        self.assertIn('address.latitude BETWEEN', compiled)
+        self.assertIn('address.longitude BETWEEN', compiled)
+
+    async def test_list_by_store_selects_only_the_summary_columns(self) -> None:
+        store = MagicMock(spec=StoreModel)
+        store.store_type = StoreType.RETAILER
+        store.address = self.make_valid_address()
+        store_result = MagicMock()
+        store_result.scalar_one_or_none.return_value = store
+        demands_result = MagicMock()
+        demands_result.all.return_value = []
+        self.session.execute.side_effect = [store_result, demands_result]
+        await self.repo.list_by_store(store_uuid=uuid4())
+        compiled = str(self.session.execute.await_args_list[1].args[0])
+        self.assertIn('"user".name AS responsible_name', compiled)
+        self.assertIn('address.city AS store_city', compiled)
+        self.assertNotIn('password', compiled)
+        self.assertNotIn('store.cnpj', compiled)
+        self.assertNotIn('address.street_address', compiled)
+
+    def test_bounding_box_encloses_the_radius(self) -> None:
+        min_lat, max_lat, min_lon, max_lon = self.repo._bounding_box(-26.9, -49.07, 10000)
+        self.assertAlmostEqual(max_lat - min_lat, 2 * 0.0899, places=3)
+        self.assertGreater(max_lon - min_lon, max_lat - min_lat)
+        self.assertLess(min_lat, -26.9)
+        self.assertGreater(max_lon, -49.07)
+
+    def test_bounding_box_falls_back_to_all_longitudes_near_the_poles(self) -> None:
+        _, max_lat, min_lon, max_lon = self.repo._bounding_box(89.99, 10.0, 10000)
+        self.assertEqual(max_lat, 90.0)
+        self.assertEqual((min_lon, max_lon), (-180.0, 180.0))
 
     async def test_list_by_store_for_retailer_filters_by_store_uuid(self) -> None:
         store = MagicMock(spec=StoreModel)
         store.store_type = StoreType.RETAILER
         store.address = self.make_valid_address()
-        demand_model = self.make_demand_model()
+        row = self.make_summary_row()
         store_result = MagicMock()
         store_result.scalar_one_or_none.return_value = store
         demands_result = MagicMock()
-        demands_result.scalars.return_value.all.return_value = [demand_model]
+        demands_result.all.return_value = [row]
         self.session.execute.side_effect = [store_result, demands_result]
         result = await self.repo.list_by_store(
             store_uuid=uuid4(),
@@ -80,17 +134,20 @@ class TestDemandRepository(unittest.IsolatedAsyncioTestCase):
             product_type=ProductType.ANY
         )
         self.assertEqual(len(result), 1)
-        self.assertIsInstance(result[0], Demand)
+        self.assertIsInstance(result[0], DemandSummary)
+        self.assertIs(result[0].uuid, row.uuid)
+        self.assertIs(result[0].store.trade_name, row.store_trade_name)
+        self.assertIs(result[0].responsible.name, row.responsible_name)
 
     async def test_list_by_store_applies_product_type_filter(self) -> None:
         store = MagicMock(spec=StoreModel)
         store.store_type = StoreType.RETAILER
         store.address = self.make_valid_address()
-        demand_model = self.make_demand_model()
+        row = self.make_summary_row()
         store_result = MagicMock()
         store_result.scalar_one_or_none.return_value = store
         demands_result = MagicMock()
-        demands_result.scalars.return_value.all.return_value = [demand_model]
+        demands_result.all.return_value = [row]
         self.session.execute.side_effect = [store_result, demands_result]
         result = await self.repo.list_by_store(
             store_uuid=uuid4(),
@@ -98,7 +155,10 @@ class TestDemandRepository(unittest.IsolatedAsyncioTestCase):
             product_type=ProductType.DAIRY
         )
         self.assertEqual(len(result), 1)
-        self.assertIsInstance(result[0], Demand)
+        self.assertIsInstance(result[0], DemandSummary)
+        self.assertIs(result[0].uuid, row.uuid)
+        self.assertIs(result[0].store.trade_name, row.store_trade_name)
+        self.assertIs(result[0].responsible.name, row.responsible_name)
 
     async def test_get_returns_demand_if_exists(self) -> None:
         demand_model = self.make_demand_model()
@@ -114,3 +174,47 @@ class TestDemandRepository(unittest.IsolatedAsyncioTestCase):
         self.session.execute.return_value = result_mock
         with self.assertRaises(NotFoundException):
             await self.repo.get(uuid4())
+
+    def test_changed_values_refuses_a_dirty_field_without_a_column_of_its_own(self) -> None:
+        demand = Demand(store=MagicMock(uuid=uuid4()), product=MagicMock(uuid=uuid4()), responsible=MagicMock(uuid=uuid4()),
+                        needed_count=10, description='', deadline=None, status=DemandStatus.OPENED, minimum_count=1)
+        demand.mark_clean()
+        demand.update(store_uuid=uuid4())
+        model = DemandModel()
+        model.from_entity(demand)
+        with self.assertRaises(ValueError):
+            self.repo._changed_values(model, demand)
+
+    async def test_create_many_inserts_every_demand_with_one_statement(self) -> None:
+        demands = [
+            Demand(
+                store=MagicMock(uuid=uuid4()), product=MagicMock(uuid=uuid4()), responsible=MagicMock(uuid=uuid4()),
+                needed_count=i, description='', deadline=None, status=DemandStatus.OPENED, minimum_count=1
+            )
+            for i in range(3)
+        ]
+        await self.repo.create_many(demands)
+        self.session.execute.assert_awaited_once()
+        statement = self.session.execute.await_args.args[0]
+        self.assertEqual(len(statement._multi_values[0]), 3)
+        self.session.commit.assert_awaited_once()
+        self.assertTrue(all(not demand.dirty_fields for demand in demands))
+
+    async def test_update_status_many_rolls_back_when_a_demand_is_not_the_owners(self) -> None:
+        owned, foreign = uuid4(), uuid4()
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = [owned]
+        self.session.execute.return_value = mock_result
+        with self.assertRaises(NotFoundException) as context:
+            await self.repo.update_status_many([owned, foreign], DemandStatus.CLOSED, uuid4())
+        self.assertIn(str(foreign), context.exception.message)
+        self.session.rollback.assert_awaited()
+        self.session.commit.assert_not_awaited()
+
+    async def test_update_status_many_commits_when_every_demand_changed(self) -> None:
+        demand_uuids = [uuid4(), uuid4()]
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = demand_uuids
+        self.session.execute.return_value = mock_result
+        self.assertEqual(await self.repo.update_status_many(demand_uuids, DemandStatus.CLOSED, uuid4()), demand_uuids)
+        self.session.commit.assert_awaited_once()
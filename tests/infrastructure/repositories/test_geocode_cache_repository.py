@@ -0,0 +1,32 @@
+import unittest
+from unittest.mock import AsyncMock, MagicMock
+from datetime import datetime, timezone
+from sqlalchemy.dialects import postgresql
+from api.infrastructure.repositories.geocode_cache_repository import GeocodeCacheRepository
+
+
+class TestGeocodeCacheRepository(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self) -> None:
+        self.session = AsyncMock()
+        self.repo = GeocodeCacheRepository(self.session)
+
+    async def test_get_returns_the_unexpired_coordinates(self) -> None:
+        result_mock = MagicMock()
+        result_mock.one_or_none.return_value = MagicMock(latitude=-23.5, longitude=-46.6)
+        self.session.execute.return_value = result_mock
+        self.assertEqual(await self.repo.get('rua a, sp'), (-23.5, -46.6))
+        query = str(self.session.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+        self.assertIn('geocode_cache.expires_at >', query)
+
+    async def test_get_returns_none_when_missing(self) -> None:
+        result_mock = MagicMock()
+        result_mock.one_or_none.return_value = None
+        self.session.execute.return_value = result_mock
+        self.assertIsNone(await self.repo.get('rua a, sp'))
+
+    async def test_save_upserts_and_commits(self) -> None:
+        await self.repo.save('rua a, sp', (-23.5, -46.6), datetime.now(timezone.utc))
+        statement = str(self.session.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+        self.assertIn('ON CONFLICT (query) DO UPDATE', statement)
+        self.session.commit.assert_awaited_once()
@@ -1,7 +1,11 @@
 import unittest
+from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy.dialects import postgresql
 from api.enums.product_type import ProductType
+from api.enums.unit_type import UnitType
 from api.domain.entities.product import Product
+from api.exceptions.validation_exception import ValidationException
 from api.infrastructure.models.product_model import ProductModel
 from api.infrastructure.repositories.product_repository import ProductRepository
 
@@ -98,4 +102,60 @@ class TestProductRepository(unittest.IsolatedAsyncioTestCase):
         mock_result = MagicMock()
         mock_result.scalars.return_value.all.return_value = [model_instance]
         self.session.execute.return_value = mock_result
-        await self.repo.list_by_name_and_type(name='%_test_')
\ No newline at end of file
+        await self.repo.list_by_name_and_type(name='%_test_')
+
+    def compiled_query(self) -> str:
+        return str(self.session.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+
+    async def test_name_search_uses_the_indexed_search_key_and_ranks_by_similarity(self) -> None:
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = []
+        self.session.execute.return_value = mock_result
+        await self.repo.list_by_name_and_type(name='Maçã', page=2, per_page=10)
+        query = self.compiled_query()
+        self.assertIn('product.search_key LIKE', query)
+        self.assertIn('lower(immutable_unaccent(', query)
+        self.assertIn('ORDER BY similarity(product.search_key, lower(immutable_unaccent(', query)
+        self.assertNotIn('unaccent(product.search_name)', query)
+        self.assertIn('OFFSET', query)
+
+    async def test_name_search_escapes_like_wildcards(self) -> None:
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = []
+        self.session.execute.return_value = mock_result
+        await self.repo.list_by_name_and_type(name='50%_off')
+        params = self.session.execute.await_args.args[0].compile(dialect=postgresql.dialect()).params
+        self.assertIn('50\\%\\_off', params.values())
+
+    async def test_name_search_rejects_cursor_pagination(self) -> None:
+        with self.assertRaises(ValidationException):
+            await self.repo.list_by_name_and_type(name='maçã', cursor='eyJjIjoiMjAyNCJ9')
+        self.session.execute.assert_not_awaited()
+
+    async def test_list_active_reads_every_active_product_without_pagination(self) -> None:
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = [self.make_product_model()]
+        self.session.execute.return_value = mock_result
+        results = await self.repo.list_active()
+        self.assertEqual(len(results), 1)
+        query = self.compiled_query()
+        self.assertIn('product.active IS true', query)
+        self.assertNotIn('LIMIT', query)
+
+    async def test_update_writes_only_the_changed_columns_and_appends_images(self) -> None:
+        product = Product(name='Maçã', unit_type=UnitType.KILOGRAM, type=ProductType.FRUIT, images=['a.png'])
+        product.mark_clean()
+        product.add_image('b.png')
+        product.delete_image('a.png')
+        result = MagicMock()
+        result.one_or_none.return_value = MagicMock(updated_at=datetime.now(timezone.utc), version=2)
+        self.session.execute.return_value = result
+        await self.repo.update(product)
+        statement = self.session.execute.await_args.args[0]
+        sql = str(statement.compile(dialect=postgresql.dialect()))
+        set_clause = sql.split(' SET ')[1].split(' WHERE ')[0]
+        self.assertIn('images=array_remove(array_append(product.images,', set_clause)
+        self.assertNotIn('name=', set_clause)
+        self.assertNotIn('search_key', set_clause)
+        self.assertEqual(product.version, 2)
+        self.assertEqual(product.array_changes, {})
@@ -0,0 +1,37 @@
+import unittest
+from unittest.mock import AsyncMock, MagicMock
+from datetime import datetime, timezone
+from sqlalchemy.dialects import postgresql
+from api.infrastructure.repositories.signed_url_cache_repository import SignedUrlCacheRepository
+
+
+class TestSignedUrlCacheRepository(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self) -> None:
+        self.session = AsyncMock()
+        self.repo = SignedUrlCacheRepository(self.session)
+
+    async def test_get_many_returns_the_unexpired_urls_in_one_query(self) -> None:
+        expires_at = datetime.now(timezone.utc)
+        result_mock = MagicMock()
+        result_mock.all.return_value = [MagicMock(blob_name='a.png', signed_url='url-a', expires_at=expires_at)]
+        self.session.execute.return_value = result_mock
+        self.assertEqual(await self.repo.get_many('product-images', ['a.png', 'b.png']), {'a.png': ('url-a', expires_at)})
+        self.session.execute.assert_awaited_once()
+        query = str(self.session.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+        self.assertIn('signed_url_cache.bucket_name =', query)
+        self.assertIn('signed_url_cache.blob_name IN', query)
+        self.assertIn('signed_url_cache.expires_at >', query)
+
+    async def test_save_many_upserts_every_url_in_one_statement_and_commits(self) -> None:
+        await self.repo.save_many('product-images', {'a.png': 'url-a', 'b.png': 'url-b'}, datetime.now(timezone.utc))
+        self.session.execute.assert_awaited_once()
+        statement = str(self.session.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+        self.assertIn('ON CONFLICT (bucket_name, blob_name) DO UPDATE', statement)
+        self.session.commit.assert_awaited_once()
+
+    async def test_delete_expired_returns_the_deleted_count(self) -> None:
+        self.session.execute.return_value = MagicMock(rowcount=3)
+        self.assertEqual(await self.repo.delete_expired(), 3)
+        statement = str(self.session.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+        self.assertIn('DELETE FROM signed_url_cache WHERE signed_url_cache.expires_at <=', statement)
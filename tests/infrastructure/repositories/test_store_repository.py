@@ -1,10 +1,13 @@
 import unittest
 from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
+from datetime import datetime, timezone
 from api.infrastructure.models.store_model import StoreModel
 from api.domain.entities.store import Store
+from api.domain.read_models.store_summary import StoreSummary
 from api.infrastructure.repositories.store_repository import StoreRepository
 from api.exceptions.not_found_exception import NotFoundException
+from api.shared.keyset_cursor import KeysetCursor
 
 class TestStoreRepository(unittest.IsolatedAsyncioTestCase):
 
@@ -54,6 +57,33 @@ class TestStoreRepository(unittest.IsolatedAsyncioTestCase):
         await self.repo.list(page=0, per_page=3)
         self.session.execute.assert_awaited_once()
 
+    async def test_list_with_cursor_seeks_past_the_cursor_instead_of_offsetting(self) -> None:
+        result_mock = MagicMock()
+        result_mock.scalars().all.return_value = []
+        self.session.execute.return_value = result_mock
+        cursor = KeysetCursor(datetime(2025, 1, 1, tzinfo=timezone.utc), uuid4()).encode()
+        await self.repo.list(page=50, per_page=5, cursor=cursor)
+        compiled = str(self.session.execute.await_args.args[0])
+        self.assertIn('(store.created_at, store.uuid) <', compiled)
+        self.assertIn('ORDER BY store.created_at DESC, store.uuid DESC', compiled)
+        self.assertNotIn('OFFSET', compiled)
+
+    async def test_list_summaries_selects_only_the_summary_columns(self) -> None:
+        row = MagicMock()
+        result_mock = MagicMock()
+        result_mock.all.return_value = [row]
+        self.session.execute.return_value = result_mock
+        stores = await self.repo.list_summaries(page=1, per_page=5)
+        self.assertIsInstance(stores[0], StoreSummary)
+        self.assertIs(stores[0].trade_name, row.trade_name)
+        self.assertIs(stores[0].city, row.city)
+        self.assertIs(stores[0].owner.name, row.owner_name)
+        compiled = str(self.session.execute.await_args.args[0])
+        self.assertIn('"user".name AS owner_name', compiled)
+        self.assertIn('ORDER BY store.created_at DESC, store.uuid DESC', compiled)
+        self.assertNotIn('password', compiled)
+        self.assertNotIn('store.legal_name', compiled)
+
     async def test_list_by_owner_returns_stores_filtered(self) -> None:
         model = self.make_store_model()
         result_mock = MagicMock()
@@ -90,3 +120,20 @@ class TestStoreRepository(unittest.IsolatedAsyncioTestCase):
         self.session.execute.return_value = result_mock
         store = await self.repo.get_by_cnpj('00000000000000')
         self.assertIsNone(store)
+
+    async def test_is_owned_by_runs_a_single_exists_query(self) -> None:
+        result_mock = MagicMock()
+        result_mock.scalar.return_value = True
+        self.session.execute.return_value = result_mock
+        is_owner = await self.repo.is_owned_by(uuid4(), uuid4())
+        self.assertTrue(is_owner)
+        self.session.execute.assert_awaited_once()
+        compiled = str(self.session.execute.await_args.args[0])
+        self.assertIn('EXISTS', compiled)
+        self.assertIn('store.owner_uuid =', compiled)
+
+    async def test_is_owned_by_returns_false_when_not_found(self) -> None:
+        result_mock = MagicMock()
+        result_mock.scalar.return_value = False
+        self.session.execute.return_value = result_mock
+        self.assertFalse(await self.repo.is_owned_by(uuid4(), uuid4()))
@@ -0,0 +1,59 @@
+import unittest
+from unittest.mock import MagicMock
+from sqlalchemy import exc
+from sqlalchemy.util import greenlet_spawn
+from api.infrastructure.instrumented_pool import InstrumentedAsyncQueuePool, PoolWaitStats
+
+
+class TestInstrumentedAsyncQueuePool(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self) -> None:
+        self.pool = InstrumentedAsyncQueuePool(lambda: MagicMock(), pool_size=2, max_overflow=1, timeout=0.01)
+
+    async def asyncTearDown(self) -> None:
+        await greenlet_spawn(self.pool.dispose)
+
+    async def test_metrics_report_checked_out_idle_and_overflow(self) -> None:
+        connections = [await greenlet_spawn(self.pool.connect) for _ in range(3)]
+        metrics = self.pool.metrics()
+        self.assertEqual(metrics['pool_size'], 2)
+        self.assertEqual(metrics['max_overflow'], 1)
+        self.assertEqual(metrics['checked_out'], 3)
+        self.assertEqual(metrics['idle'], 0)
+        self.assertEqual(metrics['overflow'], 1)
+        self.assertEqual(metrics['checkouts'], 3)
+        for connection in connections:
+            await greenlet_spawn(connection.close)
+        self.assertEqual(self.pool.metrics()['checked_out'], 0)
+
+    async def test_timeouts_are_counted(self) -> None:
+        connections = [await greenlet_spawn(self.pool.connect) for _ in range(3)]
+        with self.assertRaises(exc.TimeoutError):
+            await greenlet_spawn(self.pool.connect)
+        metrics = self.pool.metrics()
+        self.assertEqual(metrics['timeouts'], 1)
+        self.assertGreaterEqual(metrics['max_wait_ms'], 10)
+        for connection in connections:
+            await greenlet_spawn(connection.close)
+
+    def test_recreate_keeps_instrumentation(self) -> None:
+        recreated = self.pool.recreate()
+        self.assertIsInstance(recreated, InstrumentedAsyncQueuePool)
+        self.assertEqual(recreated.metrics()['checkouts'], 0)
+
+
+class TestPoolWaitStats(unittest.TestCase):
+
+    def test_average_uses_checkouts_and_timeouts(self) -> None:
+        stats = PoolWaitStats()
+        stats.record(0.002)
+        stats.record(0.004, timed_out=True)
+        result = stats.to_dict()
+        self.assertEqual(result['checkouts'], 1)
+        self.assertEqual(result['timeouts'], 1)
+        self.assertEqual(result['total_wait_ms'], 6.0)
+        self.assertEqual(result['average_wait_ms'], 3.0)
+        self.assertEqual(result['max_wait_ms'], 4.0)
+
+    def test_empty_stats(self) -> None:
+        self.assertEqual(PoolWaitStats().to_dict()['average_wait_ms'], 0.0)
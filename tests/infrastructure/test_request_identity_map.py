@@ -0,0 +1,153 @@
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+from api.domain.entities.product import Product
+from api.enums.product_type import ProductType
+from api.enums.unit_type import UnitType
+from api.exceptions.not_found_exception import NotFoundException
+from api.infrastructure.models.product_model import ProductModel
+from api.infrastructure.repositories.product_repository import ProductRepository
+from api.infrastructure.request_identity_map import EntityLoader, RequestIdentityMap
+
+
+def make_product(**kwargs) -> Product:
+    return Product(name='Banana', unit_type=UnitType.KILOGRAM, type=ProductType.FRUIT, images=[], **kwargs)
+
+
+class TestEntityLoader(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self) -> None:
+        self.stored = {}
+        self.fetched_batches = []
+
+        async def fetch_many(keys):
+            self.fetched_batches.append(list(keys))
+            await asyncio.sleep(0)
+            return [self.stored[key] for key in keys if key in self.stored]
+
+        self.loader = EntityLoader(fetch_many)
+
+    def store(self) -> Product:
+        product = make_product()
+        self.stored[product.uuid] = product
+        return product
+
+    async def fetch_started(self) -> None:
+        while not self.fetched_batches:
+            await asyncio.sleep(0)
+
+    async def test_concurrent_loads_are_fetched_in_one_batch(self) -> None:
+        first, second = self.store(), self.store()
+        missing = uuid4()
+        loaded = await asyncio.gather(
+            self.loader.load(first.uuid),
+            self.loader.load(str(second.uuid)),
+            self.loader.load(first.uuid),
+            self.loader.load(missing)
+        )
+        self.assertEqual(len(self.fetched_batches), 1)
+        self.assertCountEqual(self.fetched_batches[0], [first.uuid, second.uuid, missing])
+        self.assertEqual([entity.uuid if entity else None for entity in loaded], [first.uuid, second.uuid, first.uuid, None])
+
+    async def test_loaded_and_missing_keys_are_memoized(self) -> None:
+        product = self.store()
+        missing = uuid4()
+        await self.loader.load_many([product.uuid, missing])
+        self.assertEqual((await self.loader.load(product.uuid)).uuid, product.uuid)
+        self.assertIsNone(await self.loader.load(missing))
+        self.assertEqual(len(self.fetched_batches), 1)
+
+    async def test_returns_copies_that_do_not_change_the_memo(self) -> None:
+        product = self.store()
+        first = await self.loader.load(product.uuid)
+        first.update(name='Maçã')
+        second = await self.loader.load(product.uuid)
+        self.assertIsNot(first, second)
+        self.assertEqual(second.name, 'Banana')
+
+    async def test_loads_after_a_running_batch_go_to_the_next_one(self) -> None:
+        first, second = self.store(), self.store()
+        pending = asyncio.ensure_future(self.loader.load(first.uuid))
+        await self.fetch_started()
+        loaded = await self.loader.load(second.uuid)
+        self.assertEqual((await pending).uuid, first.uuid)
+        self.assertEqual(loaded.uuid, second.uuid)
+        self.assertEqual(self.fetched_batches, [[first.uuid], [second.uuid]])
+
+    async def test_clear_forgets_the_memo_and_results_read_before_it(self) -> None:
+        product = self.store()
+        pending = asyncio.ensure_future(self.loader.load(product.uuid))
+        await self.fetch_started()
+        self.loader.clear()
+        await pending
+        await self.loader.load(product.uuid)
+        self.assertEqual(len(self.fetched_batches), 2)
+
+    async def test_fetch_errors_reach_every_waiter(self) -> None:
+        loader = EntityLoader(AsyncMock(side_effect=RuntimeError('connection lost')))
+        results = await asyncio.gather(loader.load(uuid4()), loader.load(uuid4()), return_exceptions=True)
+        self.assertTrue(all(isinstance(result, RuntimeError) for result in results))
+
+
+class TestRequestIdentityMap(unittest.IsolatedAsyncioTestCase):
+
+    def test_open_sets_the_current_map_until_it_is_closed(self) -> None:
+        self.assertIsNone(RequestIdentityMap.current())
+        with RequestIdentityMap.open() as outer:
+            self.assertIs(RequestIdentityMap.current(), outer)
+            with RequestIdentityMap.open() as inner:
+                self.assertIsNot(inner, outer)
+                self.assertIs(RequestIdentityMap.current(), inner)
+            self.assertIs(RequestIdentityMap.current(), outer)
+        self.assertIsNone(RequestIdentityMap.current())
+
+    def test_loader_is_kept_per_owner(self) -> None:
+        identity_map = RequestIdentityMap()
+        fetch_many = AsyncMock()
+        owner = object()
+        self.assertIs(identity_map.loader(owner, fetch_many), identity_map.loader(owner, fetch_many))
+        self.assertIsNot(identity_map.loader(owner, fetch_many), identity_map.loader(object(), fetch_many))
+
+
+class TestRepositoryReadsThroughIdentityMap(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self) -> None:
+        self.session = AsyncMock()
+        self.repository = ProductRepository(self.session)
+        self.products = [make_product(), make_product()]
+
+    def result_with(self, products) -> MagicMock:
+        models = []
+        for product in products:
+            model = MagicMock(spec=ProductModel)
+            model.to_entity.return_value = product
+            models.append(model)
+        result = MagicMock()
+        result.scalars.return_value.unique.return_value.all.return_value = models
+        return result
+
+    async def test_gets_in_one_request_run_one_query(self) -> None:
+        self.session.execute.return_value = self.result_with(self.products)
+        with RequestIdentityMap.open():
+            first, second = await asyncio.gather(*[self.repository.get(product.uuid) for product in self.products])
+            again = await self.repository.get(self.products[0].uuid)
+            many = await self.repository.get_many([product.uuid for product in self.products])
+        self.session.execute.assert_awaited_once()
+        self.assertEqual([first.uuid, second.uuid, again.uuid], [self.products[0].uuid, self.products[1].uuid, self.products[0].uuid])
+        self.assertCountEqual([product.uuid for product in many], [product.uuid for product in self.products])
+
+    async def test_get_raises_not_found_for_missing_records(self) -> None:
+        self.session.execute.return_value = self.result_with([])
+        with RequestIdentityMap.open():
+            with self.assertRaises(NotFoundException):
+                await self.repository.get(uuid4())
+
+    async def test_writes_forget_the_loaded_records(self) -> None:
+        product = self.products[0]
+        self.session.execute.return_value = self.result_with([product])
+        with RequestIdentityMap.open():
+            loaded = await self.repository.get(product.uuid)
+            await self.repository.create(make_product())
+            await self.repository.get(loaded.uuid)
+        self.assertEqual(self.session.execute.await_count, 2)
@@ -0,0 +1,152 @@
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+from api.enums.store_type import StoreType
+from api.infrastructure.models.address_model import AddressModel
+from api.infrastructure.models.store_model import StoreModel
+from api.infrastructure.repositories.demand_repository import DemandRepository
+from api.infrastructure.request_identity_map import RequestIdentityMap
+from api.infrastructure.request_session_scope import RequestSessionMiddleware, RequestSessionScope
+
+
+class TestRequestSessionScope(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self) -> None:
+        self.created_sessions = []
+        self.session_scope = RequestSessionScope(self.make_session)
+
+    def make_session(self) -> AsyncMock:
+        session = AsyncMock()
+        store = MagicMock(spec=StoreModel)
+        store.store_type = StoreType.RETAILER
+        store.address = MagicMock(spec=AddressModel)
+        store.address.latitude = 10.0
+        store.address.longitude = 20.0
+        store_result = MagicMock()
+        store_result.scalar_one_or_none.return_value = store
+        demands_result = MagicMock()
+        demands_result.all.return_value = [MagicMock()]
+        results = iter([store_result, demands_result])
+        in_flight = {'count': 0}
+
+        async def execute(*args, **kwargs):
+            in_flight['count'] += 1
+            if in_flight['count'] > 1:
+                raise AssertionError('The session is being used by two requests at the same time')
+            await asyncio.sleep(0)
+            in_flight['count'] -= 1
+            return next(results)
+
+        session.execute.side_effect = execute
+        self.created_sessions.append(session)
+        return session
+
+    async def test_begin_yields_the_same_session_within_a_scope(self) -> None:
+        async with self.session_scope.begin() as session:
+            self.assertIs(self.session_scope.session(), session)
+        self.assertEqual(len(self.created_sessions), 1)
+        self.created_sessions[0].close.assert_awaited_once()
+
+    async def test_nested_scopes_do_not_share_sessions(self) -> None:
+        async with self.session_scope.begin() as outer_session:
+            async with self.session_scope.begin() as inner_session:
+                self.assertIsNot(outer_session, inner_session)
+            self.assertIs(self.session_scope.session(), outer_session)
+
+    async def test_each_scope_has_its_own_identity_map(self) -> None:
+        async with self.session_scope.begin():
+            outer_map = RequestIdentityMap.current()
+            async with self.session_scope.begin():
+                self.assertIsNotNone(RequestIdentityMap.current())
+                self.assertIsNot(RequestIdentityMap.current(), outer_map)
+            self.assertIs(RequestIdentityMap.current(), outer_map)
+        self.assertIsNone(RequestIdentityMap.current())
+
+    async def test_gather_runs_each_lookup_on_its_own_session(self) -> None:
+        seen_sessions = []
+
+        async def lookup(value):
+            seen_sessions.append(self.session_scope.session())
+            await asyncio.sleep(0)
+            return value
+
+        async with self.session_scope.begin() as session:
+            identity_map = RequestIdentityMap.current()
+
+            async def shared_map():
+                return RequestIdentityMap.current()
+
+            results = await self.session_scope.gather(lookup(1), lookup(2), shared_map())
+            self.assertIs(self.session_scope.session(), session)
+        self.assertEqual(results[:2], [1, 2])
+        self.assertIs(results[2], identity_map)
+        self.assertEqual(len({id(seen) for seen in seen_sessions} | {id(session)}), 3)
+        for created in self.created_sessions:
+            created.close.assert_awaited_once()
+
+    async def test_gather_releases_the_connection_of_the_current_session_first(self) -> None:
+        async def lookup():
+            parent_session.commit.assert_awaited_once()
+
+        async with self.session_scope.begin() as parent_session:
+            parent_session.new, parent_session.dirty, parent_session.deleted = (), (), ()
+            parent_session.in_transaction = MagicMock(return_value=True)
+            await self.session_scope.gather(lookup())
+        parent_session.commit.assert_awaited_once()
+
+    async def test_gather_keeps_the_transaction_of_a_session_with_pending_changes(self) -> None:
+        async with self.session_scope.begin() as parent_session:
+            parent_session.new, parent_session.dirty, parent_session.deleted = (MagicMock(),), (), ()
+            await self.session_scope.gather(asyncio.sleep(0))
+        parent_session.commit.assert_not_awaited()
+
+    async def test_gather_raises_the_first_error_after_every_lookup_ends(self) -> None:
+        finished = []
+
+        async def failing():
+            raise ValueError('boom')
+
+        async def slow():
+            await asyncio.sleep(0)
+            finished.append(True)
+
+        with self.assertRaises(ValueError):
+            await self.session_scope.gather(failing(), slow())
+        self.assertEqual(finished, [True])
+
+    async def test_parallel_list_by_store_requests_use_one_session_each(self) -> None:
+        repository = DemandRepository(self.session_scope.session)
+        seen_sessions = []
+
+        async def app(scope, receive, send) -> None:
+            seen_sessions.append(self.session_scope.session())
+            demands = await repository.list_by_store(uuid4())
+            await send({'type': 'http.response.start', 'status': 200, 'headers': []})
+            await send({'type': 'http.response.body', 'body': str(len(demands)).encode()})
+
+        middleware = RequestSessionMiddleware(app, self.session_scope)
+        sent = []
+
+        async def send(message: dict) -> None:
+            sent.append(message)
+
+        request_count = 200
+        await asyncio.gather(*[
+            middleware({'type': 'http', 'path': '/demand/list-by-store'}, AsyncMock(), send)
+            for _ in range(request_count)
+        ])
+        self.assertEqual(len(self.created_sessions), request_count)
+        self.assertEqual(len({id(session) for session in seen_sessions}), request_count)
+        for session in self.created_sessions:
+            self.assertEqual(session.execute.await_count, 2)
+            session.close.assert_awaited_once()
+        bodies = [message['body'] for message in sent if message['type'] == 'http.response.body']
+        self.assertEqual(bodies, [b'1'] * request_count)
+
+    async def test_middleware_ignores_non_http_scopes(self) -> None:
+        app = AsyncMock()
+        middleware = RequestSessionMiddleware(app, self.session_scope)
+        await middleware({'type': 'lifespan'}, AsyncMock(), AsyncMock())
+        app.assert_awaited_once()
+        self.assertEqual(self.created_sessions, [])
@@ -48,6 +48,10 @@ class TestAddressService(unittest.IsolatedAsyncioTestCase):
     def make_address_entity(self) -> MagicMock:
         address = MagicMock(spec=Address)
         address.uuid = self.fake_uuid
+        address.street_address = 'Av. Paulista'
+        address.number = '1000'
+        address.city = 'São Paulo'
+        address.province = 'São Paulo'
         address.to_dict.return_value = {
             'uuid': self.fake_uuid,
             'zip_code': '12345-678',
@@ -102,16 +106,12 @@ class TestAddressService(unittest.IsolatedAsyncioTestCase):
         self.address_service.repository.get = AsyncMock(return_value=address)
         with patch.object(Address, "validate"), \
              patch.object(Address, "update"), \
-             patch.object(self.address_service, "get_approximate_coordinates", return_value=ServiceResponse(
-                 status=HTTPStatus.OK,
-                 message="Coordinates found",
-                 payload=CoordinatesResponseModel(latitude=1.1, longitude=2.2)
-             )), \
+             patch.object(self.address_service, "_geocode", return_value=CoordinatesResponseModel(latitude=1.1, longitude=2.2)), \
              patch.object(Address, "to_dict", return_value=address.to_dict()):
             response = await self.address_service.create(request)
         self.assertEqual(response.status, HTTPStatus.CREATED)
         self.repository.create.assert_awaited_once()
-        self.repository.update.assert_awaited()
+        self.repository.update.assert_not_awaited()
 
     async def test_update_success(self) -> None:
         request = self.make_address_request()
@@ -126,6 +126,63 @@ class TestAddressService(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(response.status, HTTPStatus.OK)
         self.repository.update.assert_awaited_once()
 
+    async def test_update_skips_geocoding_when_the_location_did_not_change(self) -> None:
+        address = Address(**self.make_address_request().model_dump())
+        self.repository.get.return_value = address
+        request = self.make_address_request()
+        request.additional_info = 'Apt 202'
+        with patch.object(self.address_service, "_geocode", new_callable=AsyncMock) as mock_geocode:
+            response = await self.address_service.update(address.uuid, request)
+        self.assertEqual(response.status, HTTPStatus.OK)
+        mock_geocode.assert_not_awaited()
+        self.assertEqual(address.additional_info, 'Apt 202')
+        self.repository.update.assert_awaited_once_with(address)
+
+    async def test_update_geocodes_when_the_location_changed(self) -> None:
+        address = Address(**self.make_address_request().model_dump())
+        self.repository.get.return_value = address
+        request = self.make_address_request()
+        request.number = '2000'
+        coordinates = CoordinatesResponseModel(latitude=-23.56, longitude=-46.65)
+        with patch.object(self.address_service, "_geocode", new_callable=AsyncMock, return_value=coordinates) as mock_geocode:
+            response = await self.address_service.update(address.uuid, request)
+        self.assertEqual(response.status, HTTPStatus.OK)
+        mock_geocode.assert_awaited_once_with(address)
+        self.assertEqual(address.latitude, -23.56)
+        self.assertEqual(address.longitude, -46.65)
+        self.repository.update.assert_awaited_once_with(address)
+
+    async def test_create_keeps_the_address_when_geocoding_fails(self) -> None:
+        request = self.make_address_request()
+        with patch.object(self.address_service, "_geocode", new_callable=AsyncMock, side_effect=Exception("timeout")):
+            response = await self.address_service.create(request)
+        self.assertEqual(response.status, HTTPStatus.CREATED)
+        self.repository.create.assert_awaited_once()
+        self.repository.update.assert_not_awaited()
+
+    async def test_create_commits_once_and_schedules_geocoding_when_queue_is_enabled(self) -> None:
+        queue = MagicMock()
+        service = AddressService(self.repository, geocoding_queue=queue)
+        with patch.object(service, "_geocode", new_callable=AsyncMock) as mock_geocode:
+            response = await service.create(self.make_address_request())
+        self.assertEqual(response.status, HTTPStatus.CREATED)
+        mock_geocode.assert_not_awaited()
+        self.repository.create.assert_awaited_once()
+        self.repository.update.assert_not_awaited()
+        queue.enqueue.assert_called_once_with(self.repository.create.await_args.args[0].uuid)
+
+    async def test_update_schedules_geocoding_only_when_the_location_changed(self) -> None:
+        queue = MagicMock()
+        service = AddressService(self.repository, geocoding_queue=queue)
+        address = Address(**self.make_address_request().model_dump())
+        self.repository.get.return_value = address
+        request = self.make_address_request()
+        await service.update(address.uuid, request)
+        queue.enqueue.assert_not_called()
+        request.street_address = 'Rua Augusta'
+        await service.update(address.uuid, request)
+        queue.enqueue.assert_called_once_with(address.uuid)
+
     async def test_get_success(self) -> None:
         address = self.make_address_entity()
         self.repository.get.return_value = address
@@ -1,6 +1,7 @@
 import unittest
 from unittest.mock import AsyncMock, patch, MagicMock
 from datetime import date
+from time import time
 from fastapi import HTTPException, status
 from jose import jwt
 
@@ -10,6 +11,7 @@ from api.enums.gender_type import GenderType
 from api.enums.user_verification_status import UserVerificationStatus
 from api.controllers.models.user.user_response_model import UserResponseModel
 from api.services.service_response import ServiceResponse
+from api.services.user_service import UserService
 
 
 class TestAuthService(unittest.IsolatedAsyncioTestCase):
@@ -132,3 +134,44 @@ class TestAuthService(unittest.IsolatedAsyncioTestCase):
         data = {'sub': str(self.user.uuid), 'role': self.user.user_access.value}
         token = self.auth_service._create_access_token(data)
         self.assertIsInstance(token, str)
+
+    @patch('api.services.auth_service.jwt.decode')
+    async def test_verify_access_reuses_the_cached_user_for_the_same_token(self, mock_decode: MagicMock) -> None:
+        mock_decode.return_value = {"sub": str(self.user.uuid), "exp": time() + 600}
+        self.mock_user_service.get.return_value = ServiceResponse(
+            status=status.HTTP_200_OK,
+            message="Found",
+            payload=self.user
+        )
+        for _ in range(3):
+            response = await self.auth_service.verify_access("token", [UserAccess.ADMIN])
+            self.assertEqual(response.status, status.HTTP_200_OK)
+        mock_decode.assert_called_once()
+        self.mock_user_service.get.assert_awaited_once()
+
+    @patch('api.services.auth_service.jwt.decode')
+    async def test_get_user_from_token_does_not_cache_beyond_token_expiration(self, mock_decode: MagicMock) -> None:
+        mock_decode.return_value = {"sub": str(self.user.uuid), "exp": time() - 1}
+        self.mock_user_service.get.return_value = ServiceResponse(
+            status=status.HTTP_200_OK,
+            message="Found",
+            payload=self.user
+        )
+        await self.auth_service._get_user_from_token("token")
+        await self.auth_service._get_user_from_token("token")
+        self.assertEqual(self.mock_user_service.get.await_count, 2)
+
+    @patch('api.services.auth_service.jwt.decode')
+    async def test_forgetting_user_sessions_forces_a_new_lookup(self, mock_decode: MagicMock) -> None:
+        mock_decode.return_value = {"sub": str(self.user.uuid), "exp": time() + 600}
+        self.mock_user_service.get.return_value = ServiceResponse(
+            status=status.HTTP_200_OK,
+            message="Found",
+            payload=self.user
+        )
+        await self.auth_service._get_user_from_token("token")
+        with patch('api.services.user_service.GoogleBucketsClient'):
+            user_service = UserService(AsyncMock(), self.auth_service.sessions_cache)
+        user_service._forget_sessions(self.user.uuid)
+        await self.auth_service._get_user_from_token("token")
+        self.assertEqual(self.mock_user_service.get.await_count, 2)
@@ -1,11 +1,21 @@
+import asyncio
 import unittest
-from unittest.mock import AsyncMock, MagicMock
-from uuid import uuid4
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import UUID, uuid4
 from datetime import datetime
 
 from api.enums.demand_status import DemandStatus
 from api.enums.product_type import ProductType
+from api.controllers.models.demand.demand_bulk_request_model import DemandBulkRequestModel
+from api.controllers.models.demand.demand_bulk_status_request_model import DemandBulkStatusRequestModel
+from api.controllers.models.demand.demand_request_model import DemandRequestModel
+from api.domain.entities.demand import Demand
+from api.exceptions.not_found_exception import NotFoundException
 from api.exceptions.unauthorized_exception import UnauthorizedException
+from api.exceptions.validation_exception import ValidationException
+from api.infrastructure.models.demand_model import DemandModel
+from api.infrastructure.repositories.demand_repository import DemandRepository
+from api.infrastructure.request_session_scope import RequestSessionScope
 from api.services.demand_service import DemandService
 
 
@@ -23,12 +33,13 @@ class TestDemandService(unittest.IsolatedAsyncioTestCase):
             store_repository=self.mock_store_repo,
             product_repository=self.mock_product_repo,
             user_repository=self.mock_user_repo,
-            product_service=self.mock_product_service
+            product_service=self.mock_product_service,
+            session_scope=RequestSessionScope(AsyncMock)
         )
 
         # Mocks for input user and request (no real model instances)
         self.mock_user = MagicMock()
-        self.mock_user.uuid = uuid4()
+        self.mock_user.uuid = str(uuid4())
         self.mock_user.email = 'mockuser@example.com'
 
         self.mock_request = MagicMock()
@@ -52,9 +63,12 @@ class TestDemandService(unittest.IsolatedAsyncioTestCase):
         self.mock_responsible = MagicMock()
         self.mock_responsible.uuid = uuid4()
 
+        self.mock_user_entity = MagicMock()
+        self.mock_user_entity.uuid = UUID(self.mock_user.uuid)
+
     async def test_create_calls_expected_methods_and_sets_responsible_uuid(self):
         # Arrange mocks behavior
-        self.mock_store_repo.list_by_owner.return_value = [self.mock_store]
+        self.mock_store_repo.is_owned_by.return_value = True
         self.mock_store_repo.get.return_value = self.mock_store
         self.mock_product_repo.get.return_value = self.mock_product
         self.mock_user_repo.get.return_value = self.mock_user
@@ -63,8 +77,8 @@ class TestDemandService(unittest.IsolatedAsyncioTestCase):
         # Act
         response = await self.service.create(self.mock_user, self.mock_request)
 
-        # Assert authorization check called
-        self.mock_store_repo.list_by_owner.assert_awaited_once_with(self.mock_user.uuid, 1, 1_000_000)
+        # Assert authorization checked on the loaded store
+        self.mock_store_repo.is_owned_by.assert_not_awaited()
 
         # Assert fetch store, product, responsible
         self.mock_store_repo.get.assert_awaited_once_with(self.mock_request.store_uuid)
@@ -80,14 +94,41 @@ class TestDemandService(unittest.IsolatedAsyncioTestCase):
         self.assertTrue(hasattr(response, 'status'))
 
     async def test_create_raises_unauthorized_if_user_no_store_access(self):
-        self.mock_store_repo.list_by_owner.return_value = []
+        self.mock_store.owner.uuid = uuid4()
+        self.mock_store_repo.get.return_value = self.mock_store
 
         with self.assertRaises(UnauthorizedException):
             await self.service.create(self.mock_user, self.mock_request)
+        self.mock_product_repo.get.assert_not_awaited()
+        self.mock_user_repo.get.assert_not_awaited()
+
+    async def test_create_looks_up_product_and_responsible_concurrently_after_the_store(self):
+        in_flight = {'count': 0, 'max': 0}
+
+        def lookup(result):
+            async def get(uuid):
+                in_flight['count'] += 1
+                in_flight['max'] = max(in_flight['max'], in_flight['count'])
+                await asyncio.sleep(0)
+                in_flight['count'] -= 1
+                return result
+            return get
+
+        self.mock_store_repo.get.side_effect = lookup(self.mock_store)
+        self.mock_product_repo.get.side_effect = lookup(self.mock_product)
+        self.mock_user_repo.get.side_effect = lookup(self.mock_user)
+        self.mock_demand_repo.create.side_effect = ValidationException('Pare aqui')
+        with self.assertRaises(ValidationException):
+            await self.service.create(self.mock_user, self.mock_request)
+        self.assertEqual(in_flight['max'], 2)
+        demand = self.mock_demand_repo.create.await_args.args[0]
+        self.assertIs(demand.store, self.mock_store)
+        self.assertIs(demand.product, self.mock_product)
+        self.assertIs(demand.responsible, self.mock_user)
 
     async def test_get_calls_authorization_and_repo_methods(self):
         demand_id = uuid4()
-        self.mock_store_repo.list_by_owner.return_value = [self.mock_store]
+        self.mock_store_repo.is_owned_by.return_value = True
 
         mock_demand = MagicMock()
         self.mock_demand_repo.get.return_value = mock_demand
@@ -95,24 +136,24 @@ class TestDemandService(unittest.IsolatedAsyncioTestCase):
 
         response = await self.service.get(demand_id, self.mock_user, self.mock_store.uuid)
 
-        self.mock_store_repo.list_by_owner.assert_awaited_once_with(self.mock_user.uuid, 1, 1_000_000)
+        self.mock_store_repo.is_owned_by.assert_awaited_once_with(self.mock_store.uuid, self.mock_user.uuid)
         self.mock_demand_repo.get.assert_awaited_once_with(demand_id)
         self.mock_product_service.sign_product_images.assert_awaited_once_with(mock_demand.product)
         self.assertTrue(hasattr(response, 'status'))
 
     async def test_get_raises_unauthorized_if_user_no_store_access(self):
         demand_id = uuid4()
-        self.mock_store_repo.list_by_owner.return_value = []
+        self.mock_store_repo.is_owned_by.return_value = False
 
         with self.assertRaises(UnauthorizedException):
             await self.service.get(demand_id, self.mock_user, self.mock_store.uuid)
 
     async def test_list_by_store_calls_expected_methods(self):
-        self.mock_store_repo.list_by_owner.return_value = [self.mock_store]
+        self.mock_store_repo.is_owned_by.return_value = True
 
         mock_demands = [MagicMock(), MagicMock()]
         self.mock_demand_repo.list_by_store.return_value = mock_demands
-        self.mock_product_service.sign_product_images.return_value = None
+        self.mock_product_service.sign_products_images.return_value = None
 
         response = await self.service.list_by_store(
             self.mock_user,
@@ -124,17 +165,129 @@ class TestDemandService(unittest.IsolatedAsyncioTestCase):
             product_type=ProductType.ANY
         )
 
-        self.mock_store_repo.list_by_owner.assert_awaited_once_with(self.mock_user.uuid, 1, 1_000_000)
+        self.mock_store_repo.is_owned_by.assert_awaited_once_with(self.mock_store.uuid, self.mock_user.uuid)
         self.mock_demand_repo.list_by_store.assert_awaited_once_with(
-            self.mock_store.uuid, DemandStatus.OPENED, 1, 10, 5000, ProductType.ANY
+            self.mock_store.uuid, DemandStatus.OPENED, 1, 10, 5000, ProductType.ANY, None
+        )
+        self.mock_product_service.sign_products_images.assert_awaited_once_with(
+            [demand.product for demand in mock_demands]
         )
-        for demand in mock_demands:
-            self.mock_product_service.sign_product_images.assert_any_await(demand.product)
 
         self.assertTrue(hasattr(response, 'status'))
 
     async def test_list_by_store_raises_unauthorized_if_no_store_access(self):
-        self.mock_store_repo.list_by_owner.return_value = []
+        self.mock_store_repo.is_owned_by.return_value = False
 
         with self.assertRaises(UnauthorizedException):
             await self.service.list_by_store(self.mock_user, self.mock_store.uuid)
+
+    def make_bulk_request(self, count: int) -> DemandBulkRequestModel:
+        return DemandBulkRequestModel(demands=[
+            {
+                'store_uuid': self.mock_store.uuid,
+                'product_uuid': self.mock_product.uuid,
+                'needed_count': 10 + i,
+                'description': f'Demanda {i}',
+                'deadline': datetime(2025, 12, 31),
+                'status': DemandStatus.OPENED,
+            }
+            for i in range(count)
+        ])
+
+    async def test_create_many_looks_up_each_table_once_and_inserts_in_one_call(self):
+        self.mock_store_repo.get_many.return_value = [self.mock_store]
+        self.mock_product_repo.get_many.return_value = [self.mock_product]
+        self.mock_user_repo.get_many.return_value = [self.mock_user_entity]
+        self.service._convert_many_to_response = MagicMock(return_value=[])
+        response = await self.service.create_many(self.mock_user, self.make_bulk_request(3))
+        self.assertEqual(response.status, 201)
+        self.mock_store_repo.get_many.assert_awaited_once_with([self.mock_store.uuid] * 3)
+        self.mock_product_repo.get_many.assert_awaited_once()
+        self.mock_user_repo.get_many.assert_awaited_once_with([UUID(self.mock_user.uuid)] * 3)
+        self.mock_store_repo.is_owned_by.assert_not_awaited()
+        demands = self.mock_demand_repo.create_many.await_args.args[0]
+        self.assertEqual([demand.needed_count for demand in demands], [10, 11, 12])
+        self.assertTrue(all(demand.status == DemandStatus.OPENED and demand.responsible is self.mock_user_entity for demand in demands))
+
+    async def test_create_many_refuses_stores_of_other_owners(self):
+        self.mock_store.owner.uuid = uuid4()
+        self.mock_store_repo.get_many.return_value = [self.mock_store]
+        self.mock_product_repo.get_many.return_value = [self.mock_product]
+        self.mock_user_repo.get_many.return_value = [self.mock_user_entity]
+        response = await self.service.create_many(self.mock_user, self.make_bulk_request(2))
+        self.assertEqual(response.status, 401)
+        self.mock_product_repo.get_many.assert_not_awaited()
+        self.mock_user_repo.get_many.assert_not_awaited()
+        self.mock_demand_repo.create_many.assert_not_awaited()
+
+    async def test_create_many_reports_missing_products(self):
+        self.mock_store_repo.get_many.return_value = [self.mock_store]
+        self.mock_product_repo.get_many.return_value = []
+        response = await self.service.create_many(self.mock_user, self.make_bulk_request(2))
+        self.assertEqual(response.status, 404)
+        self.assertIn(str(self.mock_product.uuid), response.message)
+        self.mock_demand_repo.create_many.assert_not_awaited()
+
+    async def test_update_status_many_changes_only_the_owners_demands(self):
+        demand_uuids = [uuid4(), uuid4()]
+        self.mock_demand_repo.update_status_many.return_value = demand_uuids
+        request = DemandBulkStatusRequestModel(demand_uuids=demand_uuids, status=DemandStatus.CLOSED)
+        response = await self.service.update_status_many(self.mock_user, request)
+        self.assertEqual(response.status, 200)
+        self.assertEqual(response.payload.demand_uuids, demand_uuids)
+        self.mock_demand_repo.update_status_many.assert_awaited_once_with(demand_uuids, DemandStatus.CLOSED, self.mock_user.uuid)
+
+    async def test_update_status_many_rejects_the_any_filter(self):
+        request = DemandBulkStatusRequestModel(demand_uuids=[uuid4()], status=DemandStatus.ANY)
+        response = await self.service.update_status_many(self.mock_user, request)
+        self.assertEqual(response.status, 400)
+        self.mock_demand_repo.update_status_many.assert_not_awaited()
+
+    def make_demand(self) -> Demand:
+        demand = Demand(
+            store=self.mock_store,
+            product=self.mock_product,
+            responsible=self.mock_responsible,
+            needed_count=10,
+            description='Mock description',
+            deadline=datetime(2025, 12, 31, 23, 59, 59),
+            status=DemandStatus.OPENED,
+            minimum_count=5
+        )
+        demand.mark_clean()
+        self.mock_demand_repo.get.return_value = demand
+        return demand
+
+    async def test_patch_writes_the_store_it_moves_the_demand_to(self):
+        demand = self.make_demand()
+        new_store = MagicMock(uuid=uuid4())
+        new_store.owner.uuid = self.mock_user.uuid
+        self.mock_store_repo.get.return_value = new_store
+        request = DemandRequestModel.partial()(store_uuid=new_store.uuid, needed_count=20)
+        with patch('api.services.demand_service.DemandResponseModel'):
+            response = await self.service.patch(demand.uuid, request, self.mock_user)
+        self.assertEqual(response.status, 200)
+        self.mock_store_repo.get.assert_awaited_once_with(new_store.uuid)
+        self.assertIs(demand.store, new_store)
+        model = DemandModel()
+        model.from_entity(demand)
+        written = DemandRepository(AsyncMock())._changed_values(model, demand)
+        self.assertEqual(written['store_uuid'], new_store.uuid)
+        self.assertEqual(written['needed_count'], 20)
+        self.mock_demand_repo.update.assert_awaited_once_with(demand)
+
+    async def test_patch_refuses_demands_of_other_owners(self):
+        demand = self.make_demand()
+        self.mock_store.owner.uuid = str(uuid4())
+        response = await self.service.patch(demand.uuid, DemandRequestModel.partial()(needed_count=20), self.mock_user)
+        self.assertEqual(response.status, 401)
+        self.mock_demand_repo.update.assert_not_awaited()
+
+    async def test_patch_refuses_moving_the_demand_to_a_store_of_another_owner(self):
+        demand = self.make_demand()
+        foreign_store = MagicMock(uuid=uuid4())
+        foreign_store.owner.uuid = str(uuid4())
+        self.mock_store_repo.get.return_value = foreign_store
+        response = await self.service.patch(demand.uuid, DemandRequestModel.partial()(store_uuid=foreign_store.uuid), self.mock_user)
+        self.assertEqual(response.status, 401)
+        self.mock_demand_repo.update.assert_not_awaited()
@@ -0,0 +1,109 @@
+import asyncio
+import unittest
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+from api.exceptions.external_service_exception import ExternalServiceException
+from api.exceptions.not_found_exception import NotFoundException
+from api.services.geocoding_queue import GeocodingQueue
+
+
+class FakeSessionScope:
+
+    def __init__(self):
+        self.scopes = 0
+
+    @asynccontextmanager
+    async def begin(self):
+        self.scopes += 1
+        yield AsyncMock()
+
+
+class TestGeocodingQueue(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self) -> None:
+        self.session_scope = FakeSessionScope()
+        self.queue = GeocodingQueue(self.session_scope, requests_per_second=1000, max_attempts=3, backoff_seconds=0.01)
+        self.address = MagicMock()
+        self.repository = MagicMock()
+        self.repository.get = AsyncMock(return_value=self.address)
+        self.repository.update = AsyncMock()
+        self.geocoder = MagicMock()
+        self.geocoder.get_coordinates = AsyncMock(return_value=(-23.5, -46.6))
+        self.patches = [
+            patch('api.services.geocoding_queue.AddressRepository', return_value=self.repository),
+            patch('api.services.geocoding_queue.OpenStreetMapsClient', return_value=self.geocoder),
+        ]
+        for patcher in self.patches:
+            patcher.start()
+
+    async def asyncTearDown(self) -> None:
+        await self.queue.stop()
+        for patcher in self.patches:
+            patcher.stop()
+
+    async def test_worker_geocodes_and_saves_each_address_in_its_own_scope(self) -> None:
+        self.queue.start()
+        for _ in range(3):
+            self.queue.enqueue(uuid4())
+        await asyncio.wait_for(self.queue.join(), 2)
+        self.assertEqual(self.session_scope.scopes, 3)
+        self.address.update.assert_called_with(latitude=-23.5, longitude=-46.6)
+        self.assertEqual(self.repository.update.await_count, 3)
+        metrics = self.queue.metrics()
+        self.assertEqual(metrics['processed'], 3)
+        self.assertEqual(metrics['depth'], 0)
+
+    async def test_enqueue_ignores_addresses_already_pending(self) -> None:
+        address_uuid = uuid4()
+        self.assertTrue(self.queue.enqueue(address_uuid))
+        self.assertTrue(self.queue.enqueue(address_uuid))
+        self.assertEqual(self.queue.metrics()['depth'], 1)
+
+    async def test_enqueue_rejects_jobs_when_full(self) -> None:
+        self.queue.max_size = 1
+        self.assertTrue(self.queue.enqueue(uuid4()))
+        self.assertFalse(self.queue.enqueue(uuid4()))
+
+    async def test_jobs_scheduled_before_start_run_once_started(self) -> None:
+        self.queue.enqueue(uuid4())
+        self.assertGreaterEqual(self.queue.metrics()['lag_seconds'], 0)
+        self.queue.start()
+        await asyncio.wait_for(self.queue.join(), 2)
+        self.assertEqual(self.queue.metrics()['processed'], 1)
+
+    async def test_failures_are_retried_with_backoff_then_given_up(self) -> None:
+        self.geocoder.get_coordinates.side_effect = ExternalServiceException('Nominatim down')
+        self.queue.start()
+        self.queue.enqueue(uuid4())
+        await asyncio.wait_for(self.queue.join(), 2)
+        metrics = self.queue.metrics()
+        self.assertEqual(self.geocoder.get_coordinates.await_count, 3)
+        self.assertEqual(metrics['retried'], 2)
+        self.assertEqual(metrics['failed'], 1)
+        self.assertEqual(metrics['depth'], 0)
+
+    async def test_a_retry_that_succeeds_counts_as_processed(self) -> None:
+        self.geocoder.get_coordinates.side_effect = [ExternalServiceException('timeout'), (-23.5, -46.6)]
+        self.queue.start()
+        self.queue.enqueue(uuid4())
+        await asyncio.wait_for(self.queue.join(), 2)
+        self.assertEqual(self.queue.metrics()['processed'], 1)
+        self.assertEqual(self.queue.metrics()['retried'], 1)
+
+    async def test_deleted_addresses_are_dropped_without_retry(self) -> None:
+        self.repository.get.side_effect = NotFoundException('gone')
+        self.queue.start()
+        self.queue.enqueue(uuid4())
+        await asyncio.wait_for(self.queue.join(), 2)
+        self.geocoder.get_coordinates.assert_not_awaited()
+        self.assertEqual(self.queue.metrics()['retried'], 0)
+
+    async def test_upstream_calls_are_spaced_by_the_rate_limit(self) -> None:
+        self.queue.min_interval_seconds = 0.05
+        self.queue.start()
+        started = asyncio.get_running_loop().time()
+        for _ in range(3):
+            self.queue.enqueue(uuid4())
+        await asyncio.wait_for(self.queue.join(), 2)
+        self.assertGreaterEqual(asyncio.get_running_loop().time() - started, 0.1)
@@ -0,0 +1,111 @@
+import unittest
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+from api.domain.entities.product import Product
+from api.enums.product_type import ProductType
+from api.enums.unit_type import UnitType
+from api.exceptions.not_found_exception import NotFoundException
+from api.exceptions.validation_exception import ValidationException
+from api.services.product_catalog import ProductCatalog
+from api.shared.keyset_cursor import KeysetCursor
+
+
+class FakeSessionScope:
+
+    @asynccontextmanager
+    async def begin(self):
+        yield AsyncMock()
+
+
+def make_product(name: str, type: ProductType = ProductType.FRUIT, minutes_ago: int = 0) -> Product:
+    return Product(
+        name=name,
+        unit_type=UnitType.KILOGRAM,
+        type=type,
+        images=['images/a.png'],
+        created_at=datetime(2026, 1, 1, tzinfo=timezone.utc) - timedelta(minutes=minutes_ago)
+    )
+
+
+class TestProductCatalog(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self) -> None:
+        self.fuji = make_product('Maçã Fuji', minutes_ago=3)
+        self.gala = make_product('Maçã Gala', minutes_ago=2)
+        self.steak = make_product('Picanha', ProductType.BEEF, minutes_ago=1)
+        self.repository = MagicMock()
+        self.repository.list_active = AsyncMock(return_value=[self.fuji, self.gala, self.steak])
+        self.patcher = patch('api.services.product_catalog.ProductRepository', return_value=self.repository)
+        self.patcher.start()
+        self.catalog = ProductCatalog(FakeSessionScope(), refresh_interval_seconds=3600)
+
+    def tearDown(self) -> None:
+        self.patcher.stop()
+
+    async def test_refresh_loads_every_active_product(self) -> None:
+        self.assertFalse(self.catalog.loaded)
+        await self.catalog.refresh()
+        self.assertTrue(self.catalog.loaded)
+        self.assertEqual(len(self.catalog), 3)
+
+    async def test_list_is_newest_first_with_page_and_cursor(self) -> None:
+        await self.catalog.refresh()
+        self.assertEqual([p.name for p in self.catalog.list(page=1, per_page=2)], ['Picanha', 'Maçã Gala'])
+        self.assertEqual([p.name for p in self.catalog.list(page=2, per_page=2)], ['Maçã Fuji'])
+        cursor = KeysetCursor(self.gala.created_at, self.gala.uuid).encode()
+        self.assertEqual([p.name for p in self.catalog.list(per_page=2, cursor=cursor)], ['Maçã Fuji'])
+
+    async def test_list_by_name_and_type_searches_the_index(self) -> None:
+        await self.catalog.refresh()
+        self.assertEqual({p.name for p in self.catalog.list_by_name_and_type(name='MACA')}, {'Maçã Fuji', 'Maçã Gala'})
+        self.assertEqual(self.catalog.list_by_name_and_type(name='maca', type=ProductType.BEEF), [])
+        self.assertEqual([p.name for p in self.catalog.list_by_name_and_type(type=ProductType.BEEF)], ['Picanha'])
+        with self.assertRaises(ValidationException):
+            self.catalog.list_by_name_and_type(name='maca', cursor='eyJjIjoiMjAyNCJ9')
+
+    async def test_autocomplete_completes_names_and_words(self) -> None:
+        await self.catalog.refresh()
+        self.assertEqual([p.name for p in self.catalog.autocomplete('mac', 10)], ['Maçã Fuji', 'Maçã Gala'])
+        self.assertEqual([p.name for p in self.catalog.autocomplete('gal', 10)], ['Maçã Gala'])
+        self.catalog.remove(self.gala.uuid)
+        self.assertEqual([p.name for p in self.catalog.autocomplete('mac', 10)], ['Maçã Fuji'])
+
+    async def test_reads_return_copies(self) -> None:
+        await self.catalog.refresh()
+        product = self.catalog.get(self.fuji.uuid)
+        product.images[0] = 'https://signed/a.png'
+        self.assertEqual(self.catalog.get(str(self.fuji.uuid)).images, ['images/a.png'])
+        with self.assertRaises(NotFoundException):
+            self.catalog.get(uuid4())
+
+    async def test_upsert_and_remove_refresh_incrementally(self) -> None:
+        await self.catalog.refresh()
+        self.gala.update(name='Pera Williams', search_name='Pera Williams (kg)')
+        self.catalog.upsert(self.gala)
+        self.assertEqual({p.name for p in self.catalog.list_by_name_and_type(name='maca')}, {'Maçã Fuji'})
+        self.assertEqual(self.catalog.get(self.gala.uuid).name, 'Pera Williams')
+        self.steak.deactivate()
+        self.catalog.upsert(self.steak)
+        self.catalog.remove(self.fuji.uuid)
+        self.assertEqual([p.name for p in self.catalog.list()], ['Pera Williams'])
+        self.repository.list_active.assert_awaited_once()
+
+    async def test_writes_during_a_refresh_are_not_lost(self) -> None:
+        new_product = make_product('Uva Niágara')
+
+        async def list_active():
+            self.catalog.upsert(new_product)
+            self.catalog.remove(self.fuji.uuid)
+            return [self.fuji, self.gala]
+
+        self.repository.list_active = AsyncMock(side_effect=list_active)
+        await self.catalog.refresh()
+        self.assertEqual({p.name for p in self.catalog.list()}, {'Uva Niágara', 'Maçã Gala'})
+
+    async def test_start_keeps_the_catalog_unloaded_when_the_database_fails(self) -> None:
+        self.repository.list_active.side_effect = Exception('database down')
+        await self.catalog.start()
+        self.assertFalse(self.catalog.loaded)
+        await self.catalog.stop()
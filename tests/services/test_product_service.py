@@ -0,0 +1,116 @@
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+from api.controllers.models.product.product_request_model import ProductRequestModel
+from api.domain.entities.product import Product
+from api.enums.product_type import ProductType
+from api.enums.unit_type import UnitType
+from api.exceptions.not_found_exception import NotFoundException
+from api.services.product_service import ProductService
+
+
+class TestProductService(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self) -> None:
+        with patch('api.services.product_service.GoogleBucketsClient') as mock_bucket_client_cls:
+            self.bucket_client = mock_bucket_client_cls.return_value
+            self.service = ProductService(AsyncMock())
+        self.bucket_client.read_images = AsyncMock(
+            side_effect=lambda blob_names: {name: f'https://signed/{name}' for name in blob_names}
+        )
+
+    async def test_sign_products_images_signs_the_whole_page_in_one_batch(self) -> None:
+        products = [MagicMock(images=['a.png', 'b.png']), MagicMock(images=['a.png']), MagicMock(images=[])]
+        await self.service.sign_products_images(products)
+        self.bucket_client.read_images.assert_awaited_once_with(['a.png', 'b.png', 'a.png'])
+        self.assertEqual(products[0].images, ['https://signed/a.png', 'https://signed/b.png'])
+        self.assertEqual(products[1].images, ['https://signed/a.png'])
+        self.assertEqual(products[2].images, [])
+
+    async def test_sign_products_images_skips_the_client_without_images(self) -> None:
+        await self.service.sign_products_images([MagicMock(images=[])])
+        self.bucket_client.read_images.assert_not_awaited()
+
+    async def test_sign_product_images_keeps_the_image_order(self) -> None:
+        product = MagicMock(images=['c.png', 'a.png'])
+        await self.service.sign_product_images(product)
+        self.assertEqual(product.images, ['https://signed/c.png', 'https://signed/a.png'])
+
+    async def test_name_search_does_not_return_a_cursor(self) -> None:
+        products = [Product(name=f'Maçã {i}', unit_type=UnitType.KILOGRAM, type=ProductType.FRUIT, images=[]) for i in range(2)]
+        self.service.repository.list_by_name_and_type = AsyncMock(return_value=products)
+        response = await self.service.list_by_name_and_type(name='maca', per_page=2)
+        self.assertIsNone(response.next_cursor)
+        response = await self.service.list_by_name_and_type(per_page=2)
+        self.assertIsNotNone(response.next_cursor)
+
+    async def test_list_returns_the_next_cursor(self) -> None:
+        products = [Product(name=f'Maçã {i}', unit_type=UnitType.KILOGRAM, type=ProductType.FRUIT, images=[]) for i in range(2)]
+        self.service.repository.list = AsyncMock(return_value=products)
+        response = await self.service.list(per_page=2)
+        self.assertEqual(response.status, 200)
+        self.assertIsNotNone(response.next_cursor)
+
+    async def test_reads_come_from_the_loaded_catalog(self) -> None:
+        product = Product(name='Maçã', unit_type=UnitType.KILOGRAM, type=ProductType.FRUIT, images=['a.png'])
+        self.service.catalog = MagicMock(loaded=True)
+        self.service.catalog.get.return_value = product
+        self.service.catalog.list_by_name_and_type.return_value = [product]
+        response = await self.service.get(product.uuid)
+        self.assertEqual(response.payload.images, ['https://signed/a.png'])
+        await self.service.list_by_name_and_type(name='maca')
+        self.service.repository.get.assert_not_awaited()
+        self.service.repository.list_by_name_and_type.assert_not_awaited()
+
+    async def test_catalog_misses_are_read_from_the_database_and_kept(self) -> None:
+        product = Product(name='Maçã', unit_type=UnitType.KILOGRAM, type=ProductType.FRUIT, images=['a.png'])
+        self.service.catalog = MagicMock(loaded=True)
+        self.service.catalog.get.side_effect = NotFoundException('not found')
+        self.service.repository.get.return_value = product
+        response = await self.service.get(product.uuid)
+        self.assertEqual(response.status, 200)
+        self.service.repository.get.assert_awaited_once_with(product.uuid)
+        self.service.catalog.upsert.assert_called_once_with(product)
+
+    async def test_writes_are_applied_to_the_catalog(self) -> None:
+        product = Product(name='Maçã', unit_type=UnitType.KILOGRAM, type=ProductType.FRUIT, images=[])
+        self.service.catalog = MagicMock(loaded=True)
+        self.service.repository.get.return_value = product
+        self.bucket_client.save_image = AsyncMock(return_value='b.png')
+        await self.service.upload_picture(product.uuid, b'data', 'b.png')
+        self.service.catalog.upsert.assert_called_once_with(product)
+        await self.service.delete(product.uuid)
+        self.service.catalog.remove.assert_called_once_with(product.uuid)
+
+    async def test_patch_changes_only_the_sent_fields(self) -> None:
+        product = Product(name='Maçã', unit_type=UnitType.KILOGRAM, type=ProductType.FRUIT, images=['a.png'])
+        product.mark_clean()
+        self.service.catalog = MagicMock(loaded=True)
+        self.service.repository.get.return_value = product
+        request = ProductRequestModel.partial()(name='Maçã Fuji')
+        response = await self.service.patch(product.uuid, request)
+        self.assertEqual(response.status, 200)
+        self.assertEqual(response.payload.name, 'Maçã Fuji')
+        self.assertEqual(product.dirty_fields, {'name', 'updated_at'})
+        self.service.repository.update.assert_awaited_once_with(product)
+        self.service.catalog.upsert.assert_called_once_with(product)
+
+    async def test_patch_refuses_a_stale_version(self) -> None:
+        product = Product(name='Maçã', unit_type=UnitType.KILOGRAM, type=ProductType.FRUIT, images=[], version=3)
+        self.service.repository.get.return_value = product
+        response = await self.service.patch(product.uuid, ProductRequestModel.partial()(name='Pera', version=2))
+        self.assertEqual(response.status, 409)
+        self.service.repository.update.assert_not_awaited()
+
+    async def test_autocomplete_returns_names_without_images(self) -> None:
+        product = Product(name='Maçã', unit_type=UnitType.KILOGRAM, type=ProductType.FRUIT, images=['a.png'])
+        self.service.catalog = MagicMock(loaded=True)
+        self.service.catalog.autocomplete.return_value = [product]
+        response = await self.service.autocomplete('mac', 5)
+        self.service.catalog.autocomplete.assert_called_once_with('mac', 5)
+        self.assertEqual(response.payload[0].search_name, 'Maçã (kg)')
+        self.bucket_client.read_images.assert_not_awaited()
+
+    async def test_autocomplete_falls_back_to_the_database_until_the_catalog_loads(self) -> None:
+        self.service.repository.list_by_name_and_type = AsyncMock(return_value=[])
+        await self.service.autocomplete('mac', 5)
+        self.service.repository.list_by_name_and_type.assert_awaited_once_with('mac', per_page=5)
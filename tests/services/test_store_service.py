@@ -0,0 +1,94 @@
+import unittest
+from datetime import date
+from http import HTTPStatus
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+from api.controllers.models.store.store_request_model import StoreRequestModel
+from api.domain.entities.address import Address
+from api.domain.entities.store import Store
+from api.domain.entities.user import User
+from api.enums.gender_type import GenderType
+from api.enums.store_type import StoreType
+from api.enums.user_access import UserAccess
+from api.infrastructure.models.store_model import StoreModel
+from api.infrastructure.repositories.store_repository import StoreRepository
+from api.infrastructure.request_session_scope import RequestSessionScope
+from api.services.store_service import StoreService
+
+
+class TestStoreService(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self) -> None:
+        self.store_repo = AsyncMock()
+        self.user_repo = AsyncMock()
+        self.address_repo = AsyncMock()
+        self.service = StoreService(self.store_repo, self.user_repo, self.address_repo, RequestSessionScope(AsyncMock))
+        self.owner = User(
+            name='Dona da Loja',
+            email='dona@loja.com.br',
+            date_of_birth=date(1990, 1, 1),
+            gender=GenderType.FEMALE,
+            phone_number='+55 47 99999-9999',
+            password='hash',
+            user_access=UserAccess.STORE_OWNER
+        )
+        self.old_address = self.make_address('1')
+        self.new_address = self.make_address('2')
+        self.store = Store(
+            cnpj='12345678000199',
+            address=self.old_address,
+            reputation=4.5,
+            trade_name='Loja Orgânica',
+            legal_name='Loja Orgânica Ltda',
+            owner=self.owner,
+            legal_phone_contact='1234567890',
+            preferred_phone_contact='0987654321',
+            legal_email_contact='legal@loja.com.br',
+            preferred_email_contact='contato@loja.com.br',
+            store_type=StoreType.RETAILER,
+            opening_date=date(2020, 1, 1),
+            size='ME',
+            legal_nature='Sociedade Empresária Limitada',
+            cnae_code='1234',
+            branch_classification='MATRIZ'
+        )
+        self.store.mark_clean()
+        self.store_repo.get.return_value = self.store
+        self.address_repo.get.return_value = self.new_address
+        self.user = MagicMock()
+        self.user.uuid = str(self.owner.uuid)
+        self.user.user_access = UserAccess.STORE_OWNER
+
+    def make_address(self, number: str) -> Address:
+        return Address(
+            zip_code='89010000',
+            street_address='Rua XV de Novembro',
+            latitude=-26.9,
+            longitude=-49.07,
+            province='SC',
+            city='Blumenau',
+            neighbourhood='Centro',
+            number=number
+        )
+
+    async def test_patch_moves_the_store_to_the_new_address_and_deactivates_the_old_one(self) -> None:
+        request = StoreRequestModel.partial()(address_uuid=self.new_address.uuid)
+        response = await self.service.patch(self.store.uuid, request, self.user)
+        self.assertEqual(response.status, HTTPStatus.OK)
+        self.address_repo.get.assert_awaited_once_with(self.new_address.uuid)
+        self.assertIs(self.store.address, self.new_address)
+        model = StoreModel()
+        model.from_entity(self.store)
+        written = StoreRepository(AsyncMock())._changed_values(model, self.store)
+        self.assertEqual(written['address_uuid'], self.new_address.uuid)
+        self.address_repo.update.assert_awaited_once_with(self.old_address)
+        self.assertFalse(self.old_address.active)
+        self.assertTrue(self.new_address.active)
+
+    async def test_patch_keeps_the_address_when_it_did_not_change(self) -> None:
+        request = StoreRequestModel.partial()(address_uuid=str(self.old_address.uuid), preferred_phone_contact='111')
+        response = await self.service.patch(self.store.uuid, request, self.user)
+        self.assertEqual(response.status, HTTPStatus.OK)
+        self.address_repo.get.assert_not_awaited()
+        self.address_repo.update.assert_not_awaited()
+        self.assertIs(self.store.address, self.old_address)
@@ -0,0 +1,33 @@
+import unittest
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+from uuid import uuid4
+from api.exceptions.validation_exception import ValidationException
+from api.shared.keyset_cursor import KeysetCursor
+
+
+class TestKeysetCursor(unittest.TestCase):
+
+    def test_encode_and_decode_round_trip(self) -> None:
+        created_at = datetime(2025, 5, 12, 23, 3, 38, 496345, tzinfo=timezone.utc)
+        uuid = uuid4()
+        cursor = KeysetCursor(created_at, uuid).encode()
+        decoded = KeysetCursor.decode(cursor)
+        self.assertEqual(decoded.created_at, created_at)
+        self.assertEqual(decoded.uuid, uuid)
+        self.assertNotIn('=', cursor)
+
+    def test_decode_raises_validation_exception_for_garbage(self) -> None:
+        for cursor in ['not-a-cursor', 'eyJjIjoxfQ', '']:
+            with self.assertRaises(ValidationException):
+                KeysetCursor.decode(cursor)
+
+    def test_next_after_returns_cursor_of_the_last_entity_when_page_is_full(self) -> None:
+        entities = [MagicMock(created_at=datetime.now(timezone.utc), uuid=uuid4()) for _ in range(3)]
+        cursor = KeysetCursor.next_after(entities, per_page=3)
+        self.assertEqual(KeysetCursor.decode(cursor).uuid, entities[-1].uuid)
+
+    def test_next_after_returns_none_on_the_last_page(self) -> None:
+        entities = [MagicMock(created_at=datetime.now(timezone.utc), uuid=uuid4())]
+        self.assertIsNone(KeysetCursor.next_after(entities, per_page=10))
+        self.assertIsNone(KeysetCursor.next_after([], per_page=10))
@@ -0,0 +1,58 @@
+import unittest
+from unittest.mock import patch
+from api.shared.lru_ttl_cache import LruTtlCache
+
+
+class TestLruTtlCache(unittest.TestCase):
+
+    def test_get_returns_stored_value_and_counts_hits_and_misses(self) -> None:
+        cache = LruTtlCache(max_size=2, ttl_seconds=60)
+        cache.set('a', 1)
+        self.assertEqual(cache.get('a'), 1)
+        self.assertIsNone(cache.get('b'))
+        stats = cache.stats()
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['misses'], 1)
+        self.assertEqual(stats['hit_ratio'], 0.5)
+
+    def test_set_evicts_the_least_recently_used_entry(self) -> None:
+        cache = LruTtlCache(max_size=2, ttl_seconds=60)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('a'), 1)
+        self.assertEqual(cache.get('c'), 3)
+        self.assertEqual(cache.stats()['evictions'], 1)
+
+    @patch('api.shared.lru_ttl_cache.monotonic')
+    def test_entries_expire_after_the_shortest_ttl(self, mock_monotonic) -> None:
+        mock_monotonic.return_value = 100.0
+        cache = LruTtlCache(max_size=10, ttl_seconds=60)
+        cache.set('short', 1, ttl_seconds=5)
+        cache.set('long', 2, ttl_seconds=600)
+        mock_monotonic.return_value = 106.0
+        self.assertIsNone(cache.get('short'))
+        self.assertEqual(cache.get('long'), 2)
+        mock_monotonic.return_value = 161.0
+        self.assertEqual(cache.sweep(), 1)
+        self.assertEqual(len(cache), 0)
+
+    def test_set_ignores_already_expired_entries(self) -> None:
+        cache = LruTtlCache(max_size=10, ttl_seconds=60)
+        cache.set('a', 1, ttl_seconds=-1)
+        self.assertEqual(len(cache), 0)
+
+    def test_remove_where_drops_only_matching_entries(self) -> None:
+        cache = LruTtlCache(max_size=10, ttl_seconds=60)
+        cache.set('token-1', 'user-1')
+        cache.set('token-2', 'user-1')
+        cache.set('token-3', 'user-2')
+        removed = cache.remove_where(lambda _, user: user == 'user-1')
+        self.assertEqual(removed, 2)
+        self.assertEqual(cache.get('token-3'), 'user-2')
+
+    def test_max_size_must_be_positive(self) -> None:
+        with self.assertRaises(ValueError):
+            LruTtlCache(max_size=0, ttl_seconds=60)
@@ -0,0 +1,41 @@
+import asyncio
+import threading
+import unittest
+from unittest.mock import patch
+from api.shared.password_hasher import PasswordHasher
+
+
+class TestPasswordHasher(unittest.IsolatedAsyncioTestCase):
+
+    async def test_hash_async_and_verify_async_round_trip(self) -> None:
+        hashed = await PasswordHasher.hash_async('P@ssw0rd12')
+        self.assertNotEqual(hashed, 'P@ssw0rd12')
+        self.assertTrue(await PasswordHasher.verify_async('P@ssw0rd12', hashed))
+        self.assertFalse(await PasswordHasher.verify_async('wrong', hashed))
+
+    async def test_verify_async_runs_outside_the_event_loop_thread(self) -> None:
+        loop_thread = threading.get_ident()
+        threads = []
+
+        def fake_verify(plain_password: str, hashed_password: str) -> bool:
+            threads.append(threading.get_ident())
+            return True
+
+        with patch.object(PasswordHasher, 'verify', side_effect=fake_verify):
+            self.assertTrue(await PasswordHasher.verify_async('plain', 'hashed'))
+        self.assertEqual(len(threads), 1)
+        self.assertNotEqual(threads[0], loop_thread)
+
+    async def test_event_loop_keeps_running_while_hashing(self) -> None:
+        ticks = 0
+
+        async def ticker() -> None:
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.005)
+
+        ticker_task = asyncio.create_task(ticker())
+        await asyncio.gather(*(PasswordHasher.hash_async('P@ssw0rd12') for _ in range(2)))
+        ticker_task.cancel()
+        self.assertGreater(ticks, 2)
@@ -0,0 +1,34 @@
+import unittest
+from api.shared.prefix_index import PrefixIndex
+
+
+class TestPrefixIndex(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.index = PrefixIndex[int]()
+        self.index.add(1, 'Maçã Fuji (kg)')
+        self.index.add(2, 'Maçã Gala (kg)')
+        self.index.add(3, 'Mamão Papaya (uni.)')
+        self.index.add(4, 'Pera Maçã (kg)')
+
+    def test_search_is_accent_and_case_insensitive(self) -> None:
+        self.assertEqual(self.index.search('MACA', 10), [1, 2, 4])
+
+    def test_text_starts_come_before_word_starts(self) -> None:
+        self.assertEqual(self.index.search('ma', 10), [1, 2, 3, 4])
+        self.assertEqual(self.index.search('gala', 10), [2])
+
+    def test_search_honours_the_limit(self) -> None:
+        self.assertEqual(self.index.search('ma', 2), [1, 2])
+        self.assertEqual(self.index.search('ma', 0), [])
+
+    def test_blank_prefix_returns_nothing(self) -> None:
+        self.assertEqual(self.index.search('  ', 10), [])
+
+    def test_add_replaces_and_remove_forgets(self) -> None:
+        self.index.add(1, 'Uva Niágara (kg)')
+        self.index.remove(2)
+        self.index.remove(99)
+        self.assertEqual(self.index.search('maca', 10), [4])
+        self.assertEqual(self.index.search('niag', 10), [1])
+        self.assertEqual(len(self.index), 3)
@@ -0,0 +1,48 @@
+import asyncio
+import unittest
+from api.shared.single_flight import SingleFlight
+
+
+class TestSingleFlight(unittest.IsolatedAsyncioTestCase):
+
+    async def test_concurrent_calls_for_the_same_key_share_one_fetch(self) -> None:
+        flights = SingleFlight[int]()
+        calls = 0
+
+        async def fetch() -> int:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return 42
+
+        results = await asyncio.gather(*(flights.do('key', fetch) for _ in range(10)))
+        self.assertEqual(results, [42] * 10)
+        self.assertEqual(calls, 1)
+        self.assertEqual(len(flights), 0)
+
+    async def test_different_keys_fetch_independently(self) -> None:
+        flights = SingleFlight[str]()
+
+        async def fetch(value: str) -> str:
+            await asyncio.sleep(0.01)
+            return value
+
+        results = await asyncio.gather(flights.do('a', lambda: fetch('a')), flights.do('b', lambda: fetch('b')))
+        self.assertEqual(results, ['a', 'b'])
+
+    async def test_errors_are_shared_and_the_next_call_retries(self) -> None:
+        flights = SingleFlight[int]()
+        calls = 0
+
+        async def failing_fetch() -> int:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            raise ValueError('upstream down')
+
+        results = await asyncio.gather(*(flights.do('key', failing_fetch) for _ in range(3)), return_exceptions=True)
+        self.assertTrue(all(isinstance(result, ValueError) for result in results))
+        self.assertEqual(calls, 1)
+        with self.assertRaises(ValueError):
+            await flights.do('key', failing_fetch)
+        self.assertEqual(calls, 2)
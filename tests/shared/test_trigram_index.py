@@ -0,0 +1,38 @@
+import unittest
+from api.shared.trigram_index import TrigramIndex
+
+
+class TestTrigramIndex(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.index = TrigramIndex[int]()
+        self.index.add(1, 'Maçã Fuji (kg)')
+        self.index.add(2, 'Maçã Gala (kg)')
+        self.index.add(3, 'Mamão Papaya (uni.)')
+        self.index.add(4, 'Limão (kg)')
+
+    def test_fold_strips_accents_and_case(self) -> None:
+        self.assertEqual(TrigramIndex.fold('MAÇÃ Pêra'), 'maca pera')
+
+    def test_search_is_accent_and_case_insensitive(self) -> None:
+        self.assertEqual({key for key, _ in self.index.search('MACA')}, {1, 2})
+        self.assertEqual({key for key, _ in self.index.search('limao')}, {4})
+
+    def test_search_requires_the_whole_term_as_a_substring(self) -> None:
+        self.assertEqual(self.index.search('maca uva'), [])
+
+    def test_short_terms_fall_back_to_a_scan(self) -> None:
+        self.assertEqual({key for key, _ in self.index.search('ça')}, {1, 2})
+        self.assertEqual(len(self.index.search('')), 4)
+
+    def test_search_ranks_the_closest_text_first(self) -> None:
+        self.index.add(5, 'Maçã')
+        self.assertEqual(self.index.search('maçã')[0][0], 5)
+
+    def test_add_replaces_and_remove_forgets(self) -> None:
+        self.index.add(1, 'Pera Williams (kg)')
+        self.assertEqual({key for key, _ in self.index.search('maca')}, {2})
+        self.index.remove(2)
+        self.index.remove(99)
+        self.assertEqual(self.index.search('maca'), [])
+        self.assertEqual(len(self.index), 3)